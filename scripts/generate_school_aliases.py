@@ -0,0 +1,81 @@
+"""
+schools_initial.json (+ College Scorecard)에서 학교명 alias 파일을 생성합니다.
+
+사용법:
+    python scripts/generate_school_aliases.py
+    python scripts/generate_school_aliases.py --scorecard --output data/school_aliases.json
+
+`--scorecard`는 COLLEGE_SCORECARD_API 환경변수가 있을 때만 동작하며, 공식 명칭과
+`school.alias` 필드를 alias 후보에 추가합니다. "Community"를 뺀 표기와 3글자 이하 약어는
+Scorecard 이름 검색으로 다른 기관과 겹치지 않는지 확인한 것만 포함합니다
+(`--scorecard` 없이 실행하면 이런 alias는 생성하지 않습니다). 생성된 파일은 실행 중인 프로세스의
+EntityResolver가 자동으로 다시 읽습니다.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.integrations.college_scorecard_client import CollegeScorecardClient
+from src.services.school_alias_generator import (
+    DEFAULT_SCHOOL_ALIAS_PATH,
+    aliases_needing_check,
+    build_school_alias_table,
+    conflicts_with_scorecard,
+    load_seed_records,
+    write_alias_file,
+)
+
+
+def verify_aliases(client: CollegeScorecardClient, record) -> tuple:
+    """다른 기관과 겹칠 수 있는 alias 후보를 Scorecard 이름 검색으로 확인합니다."""
+    own_names = (record.name, record.scorecard_name)
+    candidates = set()
+    for source in (record.name, record.scorecard_name, *record.scorecard_aliases):
+        if source:
+            candidates |= aliases_needing_check(source, record.school_type)
+    verified = []
+    for alias in sorted(candidates):
+        matches = client.search_schools(alias)
+        # 조회에 실패하면(None) 확인하지 못한 것으로 보고 넣지 않습니다.
+        if matches is not None and not conflicts_with_scorecard(alias, own_names, matches):
+            verified.append(alias)
+    return tuple(verified)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학교명 alias 파일 생성")
+    parser.add_argument(
+        "--schools",
+        default=str(Path(__file__).parent.parent / "data" / "schools_initial.json"),
+        help="시드 학교 JSON 파일",
+    )
+    parser.add_argument("--output", default=str(DEFAULT_SCHOOL_ALIAS_PATH), help="출력 alias 파일")
+    parser.add_argument("--scorecard", action="store_true", help="College Scorecard 공식 명칭/alias 포함")
+    args = parser.parse_args()
+
+    records = load_seed_records(Path(args.schools))
+
+    if args.scorecard:
+        client = CollegeScorecardClient()
+        if not client.is_enabled():
+            print("⚠️ COLLEGE_SCORECARD_API 미설정: 시드 데이터만 사용합니다.")
+        else:
+            for index, record in enumerate(records, 1):
+                stats = client.fetch_school_stats(record.name)
+                if stats:
+                    record.scorecard_name = stats.school_name
+                    record.scorecard_aliases = stats.aliases
+                record.verified_aliases = verify_aliases(client, record)
+                if index % 50 == 0:
+                    print(f"  Scorecard 조회 {index}/{len(records)}")
+
+    table = build_school_alias_table(records)
+    output = write_alias_file(table, Path(args.output))
+    alias_count = sum(len(aliases) for aliases in table.values())
+    print(f"✅ {len(table)}개 학교, {alias_count}개 alias를 {output}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,18 +25,22 @@ ROBOTS_TXT_TIMEOUT_SECONDS = 5
 class BaseCrawler:
     """웹 크롤러 기본 클래스"""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
         """
         초기화
         
         Args:
             base_url: 크롤링할 기본 URL
+            session: 공유 세션 (예: PooledHttpClient.session). 주입받은 세션은 close()에서 닫지 않습니다.
         """
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': config.USER_AGENT
-        })
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': config.USER_AGENT
+            })
+        self.session = session
         self.ssl_error_detected: bool = False
         self.ssl_error_message: str = ""
         self.ssl_error_url: str = ""
@@ -216,8 +220,9 @@ class BaseCrawler:
         return urljoin(self.base_url, relative_url)
     
     def close(self) -> None:
-        """세션 종료"""
-        self.session.close()
+        """세션 종료 (주입받은 공유 세션은 소유자가 닫음)"""
+        if self._owns_session:
+            self.session.close()
         logger.info("크롤러 세션 종료")
     
     def __enter__(self):
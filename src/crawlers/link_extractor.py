@@ -0,0 +1,154 @@
+"""
+스트리밍 링크 추출기.
+
+링크 탐색은 `<a href>`와 anchor 텍스트만 필요하므로 BeautifulSoup DOM을 만들지 않고
+표준 라이브러리 `HTMLParser`로 한 번 훑으면서 `(절대 URL, anchor 텍스트, 주변 텍스트)`를
+차례로 yield 합니다. HTML을 일정 크기씩 feed 하므로 호출 측이 필요한 만큼만 읽고 멈출 수 있고
+(generator를 닫거나 `max_links`에 도달하면 남은 HTML은 파싱하지 않음), 트리를 만들지 않아
+메모리 사용량이 페이지 크기와 무관하게 작습니다.
+
+페이지 이동이 아닌 href(빈 값, `#fragment`, `mailto:`/`tel:`/`javascript:` 등)는 건너뜁니다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Iterator, List, Optional
+from urllib.parse import urljoin
+
+_SPACE_RE = re.compile(r"\s+")
+_SCHEME_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]*):")
+_NAVIGABLE_SCHEMES = frozenset({"http", "https"})
+
+# 주변 텍스트(context)를 끊는 블록 요소
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "body", "dd", "div", "dl", "dt", "footer",
+        "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "li", "main", "nav", "ol", "p",
+        "section", "table", "td", "th", "tr", "ul",
+    }
+)
+# 텍스트를 모으지 않는 요소
+_SKIP_TEXT_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+# 작을수록 조기 종료가 빨라지고, 클수록 feed 호출 오버헤드가 줄어듭니다.
+FEED_CHUNK_CHARS = 16 * 1024
+CONTEXT_CHARS = 200
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractedLink:
+    """HTML에서 찾은 링크 하나."""
+
+    url: str
+    anchor_text: str
+    # 링크가 속한 블록(li/p/td 등)에서 링크 앞까지의 텍스트 + anchor 텍스트
+    context_text: str
+
+
+def _clean(text: str) -> str:
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def _is_navigable(href: str) -> bool:
+    if not href or href.startswith("#"):
+        return False
+    match = _SCHEME_RE.match(href)
+    return match is None or match.group(1).lower() in _NAVIGABLE_SCHEMES
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self, base_url: str, collect_context: bool = True) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.collect_context = collect_context
+        self.links: List[ExtractedLink] = []
+        self._href: Optional[str] = None
+        self._anchor: List[str] = []
+        self._context_prefix = ""
+        self._block_text: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "a":
+            # 닫히지 않은 <a>가 있으면 새 <a>가 시작될 때 닫힌 것으로 봅니다.
+            self._close_anchor()
+            href = next((value for name, value in attrs if name == "href"), None)
+            if href is not None and _is_navigable(href.strip()):
+                self._href = href.strip()
+                self._anchor = []
+                self._context_prefix = "".join(self._block_text)
+        elif tag in _BLOCK_TAGS:
+            self._block_text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "a":
+            self._close_anchor()
+        elif tag in _BLOCK_TAGS:
+            self._block_text = []
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._href is not None:
+            self._anchor.append(data)
+        if self.collect_context:
+            self._block_text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._close_anchor()
+
+    def _close_anchor(self) -> None:
+        if self._href is None:
+            return
+        anchor_text = _clean("".join(self._anchor))
+        context = _clean(f"{self._context_prefix} {anchor_text}")[-CONTEXT_CHARS:] if self.collect_context else anchor_text
+        self.links.append(ExtractedLink(urljoin(self.base_url, self._href), anchor_text, context))
+        self._href = None
+        self._anchor = []
+
+
+def iter_links(
+    html: str,
+    base_url: str,
+    *,
+    max_links: Optional[int] = None,
+    collect_context: bool = True,
+) -> Iterator[ExtractedLink]:
+    """
+    HTML의 `<a href>`를 문서 순서대로 yield 합니다.
+
+    Args:
+        html: 페이지 HTML
+        base_url: 상대 경로를 풀 기준 URL
+        max_links: 이 개수만큼 yield 하면 나머지 HTML은 파싱하지 않고 멈춤
+        collect_context: False면 주변 텍스트를 모으지 않음 (context_text == anchor_text)
+
+    Yields:
+        ExtractedLink (url은 urljoin으로 절대화한 http(s)/상대 링크)
+    """
+    if max_links is not None and max_links <= 0:
+        return
+    parser = _LinkParser(base_url, collect_context=collect_context)
+    emitted = 0
+    for start in range(0, len(html), FEED_CHUNK_CHARS):
+        parser.feed(html[start : start + FEED_CHUNK_CHARS])
+        for link in parser.links:
+            yield link
+            emitted += 1
+            if emitted == max_links:
+                return
+        parser.links.clear()
+    parser.close()
+    for link in parser.links:
+        yield link
+        emitted += 1
+        if emitted == max_links:
+            return
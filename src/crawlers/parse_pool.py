@@ -0,0 +1,135 @@
+"""
+CPU 바운드 파싱/청킹 단계를 위한 프로세스 풀.
+
+페이지 요청은 스레드가 네트워크를 기다리는 동안 GIL을 놓으므로 스레드 풀로 충분하지만,
+BeautifulSoup 파싱과 문장 단위 청킹은 순수 파이썬 연산이라 스레드를 늘려도 한 코어에서
+차례로 실행됩니다. `ParsePool`은 이 단계만 별도 프로세스로 보내 코어 수만큼 병렬로 처리합니다
+(가져오기는 기존처럼 스레드, 파싱/청킹은 프로세스인 혼합 구성).
+
+워커는 soup 객체나 dataclass 대신 `(text, start_pos, end_pos)` 튜플 목록만 돌려주어 결과 pickle을
+작게 유지하고, 호출 프로세스에서 `Chunk`로 되돌립니다. 작은 페이지는 프로세스 간 전송 비용이
+파싱 비용보다 커서 `min_offload_chars` 미만이면 호출 스레드에서 바로 처리합니다.
+`workers`가 0이면 항상 호출 스레드에서 처리하므로 기존 동작과 같습니다.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from src.crawlers.chunking import Chunk, SemanticChunker
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 이보다 짧은 HTML은 워커로 보내지 않습니다 (전송/pickle 비용이 파싱 비용보다 큼).
+DEFAULT_MIN_OFFLOAD_CHARS = 8 * 1024
+
+ChunkTuple = Tuple[str, int, int]
+
+# 워커 프로세스마다 하나씩 만들어 재사용합니다.
+_worker_chunker: Optional[SemanticChunker] = None
+
+
+def chunk_html_compact(html: str, chunk_size: int, overlap: int) -> List[ChunkTuple]:
+    """워커에서 실행되는 청킹 작업 (결과는 pickle이 작은 튜플 목록)."""
+    global _worker_chunker
+    if _worker_chunker is None:
+        _worker_chunker = SemanticChunker()
+    chunks = _worker_chunker.chunk_html(html, chunk_size=chunk_size, overlap=overlap)
+    return [(chunk.text, chunk.start_pos, chunk.end_pos) for chunk in chunks]
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    # 스레드가 여럿 떠 있는 프로세스를 fork 하면 잠긴 락이 복제될 수 있어 fork는 쓰지 않습니다.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+class ParsePool:
+    """`SemanticChunker.chunk_html`과 같은 인터페이스로 청킹을 프로세스 풀에 위임합니다 (thread-safe)."""
+
+    def __init__(self, workers: int = 0, *, min_offload_chars: int = DEFAULT_MIN_OFFLOAD_CHARS) -> None:
+        """
+        Args:
+            workers: 파싱 프로세스 수 (0이면 프로세스 풀 없이 호출 스레드에서 처리)
+            min_offload_chars: 이 길이 이상인 HTML만 워커로 보냄
+        """
+        if workers < 0:
+            raise ValueError("workers는 음수가 될 수 없습니다.")
+        self.workers = workers
+        self.min_offload_chars = min_offload_chars
+        self._chunker = SemanticChunker()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._broken = False
+        self._closed = False
+        self._counts = {"offloaded": 0, "inline": 0}
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0 and not self._broken and not self._closed
+
+    def chunk_html(self, html: str, chunk_size: int = 1000, overlap: int = 200) -> list[Chunk]:
+        """HTML을 청킹합니다 (큰 페이지는 워커 프로세스에서)."""
+        # 잘못된 크기는 워커까지 보내지 않고 호출 측에서 바로 ValueError로 알립니다.
+        SemanticChunker._validate_sizes(chunk_size=chunk_size, overlap=overlap)
+        if not html or not html.strip():
+            return []
+
+        executor = self._executor_for(html)
+        if executor is not None:
+            try:
+                compact = executor.submit(chunk_html_compact, html, chunk_size, overlap).result()
+            except BrokenProcessPool as exc:
+                # 워커가 죽으면(OOM 등) 이후로는 호출 스레드에서 처리합니다.
+                logger.warning("파싱 프로세스 풀이 중단되어 호출 스레드에서 청킹합니다: %s", exc)
+                self._mark_broken()
+            else:
+                self._count("offloaded")
+                return [Chunk(text=text, start_pos=start, end_pos=end) for text, start, end in compact]
+
+        self._count("inline")
+        return self._chunker.chunk_html(html, chunk_size=chunk_size, overlap=overlap)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"workers": self.workers if self.enabled else 0, **self._counts}
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _executor_for(self, html: str) -> Optional[ProcessPoolExecutor]:
+        if len(html) < self.min_offload_chars:
+            return None
+        with self._lock:
+            if self.workers <= 0 or self._broken or self._closed:
+                return None
+            # 프로세스 기동 비용은 실제로 큰 페이지가 들어왔을 때만 치릅니다.
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_mp_context())
+            return self._executor
+
+    def _mark_broken(self) -> None:
+        with self._lock:
+            self._broken = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
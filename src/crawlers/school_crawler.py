@@ -6,6 +6,8 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 import sys
 
+import requests
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.crawlers.base_crawler import BaseCrawler
@@ -20,15 +22,16 @@ logger = setup_logger(__name__)
 class SchoolCrawler(BaseCrawler):
     """학교 정보 크롤러"""
     
-    def __init__(self, school_name: str, website: str):
+    def __init__(self, school_name: str, website: str, session: Optional[requests.Session] = None):
         """
         초기화
         
         Args:
             school_name: 학교 이름
             website: 학교 웹사이트 URL
+            session: 공유 HTTP 세션 (None이면 크롤러 전용 세션 생성)
         """
-        super().__init__(website)
+        super().__init__(website, session=session)
         self.school_name = school_name
         self.data: Dict[str, Any] = {
             'name': school_name,
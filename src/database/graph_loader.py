@@ -0,0 +1,305 @@
+"""
+Knowledge Graph 벌크 로더 (entities / knowledge_triples).
+
+Entity마다 SELECT/INSERT를 반복하던 seed 스크립트 방식 대신,
+1) 모든 Triple의 head/tail Entity를 메모리에서 (entity_type, canonical_name)으로 모으고
+2) Entity를 `execute_values ... ON CONFLICT DO UPDATE ... RETURNING` 한 번으로 upsert하여 UUID를 받은 뒤
+3) Triple을 같은 방식으로 배치 upsert 합니다.
+
+ON CONFLICT 대상 unique index는 alembic 마이그레이션(005_add_graph_unique_indexes)이 기존 중복을
+정리한 뒤 만듭니다 (로더는 DDL을 실행하지 않음). School Entity의 school_id는 같은 이름의
+schools 행 id로 채웁니다. 한 statement 안에서 같은 키가 두 번 나오면 Postgres가 거부하므로 Triple은 메모리에서
+미리 병합(confidence는 max)합니다.
+
+참고 자료:
+- https://www.psycopg.org/docs/extras.html#fast-execution-helpers
+- https://www.postgresql.org/docs/current/sql-insert.html#SQL-ON-CONFLICT
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from uuid import UUID, uuid4
+
+from psycopg2.extras import execute_values, register_uuid
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# uuid.UUID 파라미터/컬럼을 그대로 주고받기 위한 psycopg2 어댑터 등록
+register_uuid()
+
+EntityKey = Tuple[str, str]
+TripleKey = Tuple[EntityKey, str, EntityKey]
+
+_KNOWN_COMPANIES = {"Google", "Microsoft", "Amazon", "Tesla", "Meta", "Apple"}
+_KNOWN_JOBS = {"Software Engineer", "AI Engineer", "Data Scientist", "Product Manager", "Robotics Engineer"}
+_KNOWN_SKILLS = {"Machine Learning", "Deep Learning", "Python", "Algorithms", "Robotics", "Statistics"}
+_KNOWN_PROGRAMS = {
+    "Computer Science",
+    "Data Science",
+    "Business Administration",
+    "Electrical Engineering",
+    "Mechanical Engineering",
+    "Software Engineering",
+    "Robotics",
+    "Artificial Intelligence",
+    "Automotive Technology",
+}
+_LOCATION_STATES = ("California", "Massachusetts", "New York", "Pennsylvania")
+
+_UPSERT_ENTITIES_SQL = """
+    INSERT INTO entities (
+        uuid, entity_type, entity_name, canonical_name,
+        school_id, confidence_score, created_at, updated_at
+    ) VALUES %s
+    ON CONFLICT (entity_type, canonical_name)
+    DO UPDATE SET
+        school_id = COALESCE(entities.school_id, EXCLUDED.school_id),
+        updated_at = NOW()
+    RETURNING uuid, entity_type, canonical_name
+"""
+
+_UPSERT_TRIPLES_SQL = """
+    INSERT INTO knowledge_triples (
+        id, head_entity_uuid, head_entity_type, head_entity_name,
+        relation_type,
+        tail_entity_uuid, tail_entity_type, tail_entity_name,
+        weight, confidence_score, properties,
+        source_url, source_type, extraction_method,
+        created_at, updated_at
+    ) VALUES %s
+    ON CONFLICT (head_entity_uuid, relation_type, tail_entity_uuid)
+    DO UPDATE SET
+        confidence_score = GREATEST(knowledge_triples.confidence_score, EXCLUDED.confidence_score),
+        source_url = COALESCE(EXCLUDED.source_url, knowledge_triples.source_url),
+        updated_at = NOW()
+"""
+
+_SCHOOL_IDS_SQL = "SELECT name, id FROM schools WHERE name = ANY(%s)"
+
+_TRIPLE_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, NOW(), NOW())"
+
+
+def infer_entity_type(entity_name: str, school_name: str | None = None) -> str:
+    """Entity 이름으로부터 타입을 추론합니다 (간단한 휴리스틱, 기본값 Program)."""
+    if school_name and entity_name == school_name:
+        return "School"
+    if entity_name in _KNOWN_COMPANIES:
+        return "Company"
+    if entity_name in _KNOWN_JOBS:
+        return "Job"
+    if entity_name in _KNOWN_SKILLS:
+        return "Skill"
+    if entity_name in _KNOWN_PROGRAMS:
+        return "Program"
+    if "," in entity_name and any(state in entity_name for state in _LOCATION_STATES):
+        return "Location"
+    return "Program"
+
+
+@dataclass(frozen=True)
+class TripleRecord:
+    """로더 입력 단위 (출처 형식과 무관한 평탄화된 Triple 1건)."""
+
+    school_name: str
+    head: str
+    relation: str
+    tail: str
+    confidence: float = 0.8
+    source_url: Optional[str] = None
+
+
+def records_from_seed(data: Mapping[str, Any]) -> Iterator[TripleRecord]:
+    """`seed_triples.json` 형식(`{"schools": [{"school_name", "triples"}]}`)을 평탄화합니다."""
+    for school in data.get("schools", []):
+        for triple in school.get("triples", []):
+            yield TripleRecord(
+                school_name=school["school_name"],
+                head=triple["head"],
+                relation=triple["relation"],
+                tail=triple["tail"],
+                confidence=float(triple.get("confidence", 0.8)),
+                source_url=triple.get("source_url"),
+            )
+
+
+def records_from_report(report: Mapping[str, Any]) -> Iterator[TripleRecord]:
+    """`AutoTripleCollector` 리포트 1줄(`triples[].entries`)을 평탄화합니다."""
+    school_name = report.get("school_name")
+    if not school_name:
+        return
+    for page in report.get("triples") or []:
+        for entry in page.get("entries") or []:
+            head, relation, tail = entry.get("head"), entry.get("relation"), entry.get("tail")
+            if not (head and relation and tail):
+                continue
+            yield TripleRecord(
+                school_name=school_name,
+                head=head,
+                relation=relation,
+                tail=tail,
+                confidence=float(entry.get("confidence", 0.8)),
+                source_url=page.get("source_url"),
+            )
+
+
+@dataclass
+class _PlannedTriple:
+    head: EntityKey
+    relation: str
+    tail: EntityKey
+    confidence: float
+    source_url: Optional[str]
+
+
+class GraphBulkLoader:
+    """entities/knowledge_triples 벌크 upsert (psycopg2 connection 사용)."""
+
+    def __init__(
+        self,
+        conn: Any,
+        *,
+        page_size: int = 1000,
+        source_type: str = "crawled",
+        extraction_method: str = "gemini",
+    ) -> None:
+        self.conn = conn
+        self.page_size = page_size
+        self.source_type = source_type
+        self.extraction_method = extraction_method
+
+    @staticmethod
+    def plan(
+        records: Iterable[TripleRecord],
+    ) -> Tuple[Dict[EntityKey, str], Dict[TripleKey, _PlannedTriple]]:
+        """
+        Entity/Triple을 메모리에서 모으고 중복을 병합합니다.
+
+        Returns:
+            (entity key → 표시 이름, triple key → 병합된 Triple)
+        """
+        entities: Dict[EntityKey, str] = {}
+        triples: Dict[TripleKey, _PlannedTriple] = {}
+        for record in records:
+            school_key = ("School", record.school_name)
+            entities.setdefault(school_key, record.school_name)
+            head_key = (infer_entity_type(record.head, record.school_name), record.head)
+            tail_key = (infer_entity_type(record.tail, record.school_name), record.tail)
+            entities.setdefault(head_key, record.head)
+            entities.setdefault(tail_key, record.tail)
+
+            key = (head_key, record.relation, tail_key)
+            planned = triples.get(key)
+            if planned is None:
+                triples[key] = _PlannedTriple(
+                    head=head_key,
+                    relation=record.relation,
+                    tail=tail_key,
+                    confidence=record.confidence,
+                    source_url=record.source_url,
+                )
+            elif record.confidence > planned.confidence:
+                planned.confidence = record.confidence
+                planned.source_url = record.source_url or planned.source_url
+        return entities, triples
+
+    def load(self, records: Iterable[TripleRecord], *, commit: bool = True) -> Dict[str, int]:
+        """
+        Triple들을 한 트랜잭션으로 upsert합니다.
+
+        Returns:
+            {"entities": upsert한 Entity 수, "triples": upsert한 Triple 수}
+        """
+        entities, triples = self.plan(records)
+        if not triples:
+            return {"entities": 0, "triples": 0}
+
+        try:
+            with self.conn.cursor() as cur:
+                uuid_map = self._upsert_entities(cur, entities)
+                self._upsert_triples(cur, triples.values(), uuid_map)
+            if commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        logger.info("그래프 벌크 적재: entities=%d, triples=%d", len(entities), len(triples))
+        return {"entities": len(entities), "triples": len(triples)}
+
+    def _upsert_entities(self, cur: Any, entities: Mapping[EntityKey, str]) -> Dict[EntityKey, UUID]:
+        school_ids = self._school_ids(
+            cur, [canonical_name for entity_type, canonical_name in entities if entity_type == "School"]
+        )
+        rows = [
+            (
+                uuid4(),
+                entity_type,
+                display_name,
+                canonical_name,
+                school_ids.get(canonical_name) if entity_type == "School" else None,
+                1.0,
+            )
+            for (entity_type, canonical_name), display_name in entities.items()
+        ]
+        returned = execute_values(
+            cur,
+            _UPSERT_ENTITIES_SQL,
+            rows,
+            template="(%s, %s, %s, %s, %s, %s, NOW(), NOW())",
+            page_size=self.page_size,
+            fetch=True,
+        )
+        # 이미 존재하던 Entity는 기존 UUID가 RETURNING으로 돌아옵니다.
+        return {(entity_type, canonical_name): uuid for uuid, entity_type, canonical_name in returned}
+
+    @staticmethod
+    def _school_ids(cur: Any, school_names: List[str]) -> Dict[str, UUID]:
+        """학교 이름 → schools.id (배치에 나온 학교만 한 번에 조회)."""
+        if not school_names:
+            return {}
+        cur.execute(_SCHOOL_IDS_SQL, (school_names,))
+        return {name: school_id for name, school_id in cur.fetchall()}
+
+    def _upsert_triples(
+        self,
+        cur: Any,
+        triples: Iterable[_PlannedTriple],
+        uuid_map: Mapping[EntityKey, UUID],
+    ) -> None:
+        rows: List[tuple] = []
+        for triple in triples:
+            head_uuid = uuid_map.get(triple.head)
+            tail_uuid = uuid_map.get(triple.tail)
+            if not head_uuid or not tail_uuid:
+                logger.warning("Entity UUID를 찾을 수 없습니다: %s 또는 %s", triple.head, triple.tail)
+                continue
+            rows.append(
+                (
+                    uuid4(),
+                    head_uuid,
+                    triple.head[0],
+                    triple.head[1],
+                    triple.relation,
+                    tail_uuid,
+                    triple.tail[0],
+                    triple.tail[1],
+                    1.0,
+                    triple.confidence,
+                    "{}",
+                    triple.source_url,
+                    self.source_type,
+                    self.extraction_method,
+                )
+            )
+        if rows:
+            execute_values(
+                cur,
+                _UPSERT_TRIPLES_SQL,
+                rows,
+                template=_TRIPLE_TEMPLATE,
+                page_size=self.page_size,
+            )
@@ -0,0 +1,49 @@
+"""Add crawl_work_queue table for lease-based distributed crawling
+
+Revision ID: 004_add_crawl_work_queue
+Revises: 003_add_school_crawl_metadata
+Create Date: 2026-10-19 09:00:00
+
+여러 워커 노드가 `SELECT … FOR UPDATE SKIP LOCKED`로 학교를 하나씩 lease 받아 처리하는 작업 큐.
+- status: queued → leased → done/failed (heartbeat가 끊겨 lease가 만료되면 다시 queued)
+- 시각 컬럼은 워커가 기록하는 epoch 초 (src/services/crawl_work_queue.py 참고)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "004_add_crawl_work_queue"
+down_revision = "003_add_school_crawl_metadata"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawl_work_queue",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("school_key", sa.Text(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("priority", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("worker_id", sa.Text(), nullable=True),
+        sa.Column("lease_expires_at", sa.Float(), nullable=True),
+        sa.Column("enqueued_at", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.Float(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("result", sa.Text(), nullable=True),
+        sa.UniqueConstraint("school_key", name="uq_crawl_work_queue_school_key"),
+    )
+    op.create_index(
+        "idx_crawl_work_queue_claim",
+        "crawl_work_queue",
+        ["status", sa.text("priority DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_crawl_work_queue_claim", table_name="crawl_work_queue")
+    op.drop_table("crawl_work_queue")
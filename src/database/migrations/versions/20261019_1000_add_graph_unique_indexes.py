@@ -0,0 +1,100 @@
+"""Deduplicate entities/knowledge_triples and add the bulk-loader conflict indexes
+
+Revision ID: 005_add_graph_unique_indexes
+Revises: 004_add_crawl_work_queue
+Create Date: 2026-10-19 10:00:00
+
+GraphBulkLoader(src/database/graph_loader.py)의 `ON CONFLICT` 대상 unique index.
+- entities (entity_type, canonical_name)
+- knowledge_triples (head_entity_uuid, relation_type, tail_entity_uuid)
+
+예전 seed 스크립트는 SELECT 후 INSERT로 적재해 같은 키의 행이 여러 개 있을 수 있으므로,
+index를 만들기 전에 중복을 정리합니다.
+1. 같은 Entity 키의 행 중 가장 먼저 만든 행만 남기고, Triple의 head/tail이 남는 행을 가리키도록 바꿉니다.
+2. 같은 Triple 키의 행 중 confidence가 가장 높은 행만 남깁니다.
+
+두 테이블은 GraphRAG 스키마가 만들므로, 아직 없는 DB에서는 아무것도 하지 않습니다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005_add_graph_unique_indexes"
+down_revision = "004_add_crawl_work_queue"
+branch_labels = None
+depends_on = None
+
+_ENTITY_DUPLICATES = """
+    SELECT uuid, keep_uuid
+    FROM (
+        SELECT
+            uuid,
+            FIRST_VALUE(uuid) OVER (
+                PARTITION BY entity_type, canonical_name
+                ORDER BY created_at NULLS LAST, uuid
+            ) AS keep_uuid
+        FROM entities
+    ) ranked
+    WHERE uuid <> keep_uuid
+"""
+
+
+def _has_graph_tables() -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return inspector.has_table("entities") and inspector.has_table("knowledge_triples")
+
+
+def upgrade() -> None:
+    if not _has_graph_tables():
+        return
+
+    for column in ("head_entity_uuid", "tail_entity_uuid"):
+        op.execute(
+            f"""
+            UPDATE knowledge_triples AS t
+            SET {column} = d.keep_uuid
+            FROM ({_ENTITY_DUPLICATES}) AS d
+            WHERE t.{column} = d.uuid
+            """
+        )
+    op.execute(f"DELETE FROM entities WHERE uuid IN (SELECT uuid FROM ({_ENTITY_DUPLICATES}) AS d)")
+
+    op.execute(
+        """
+        DELETE FROM knowledge_triples
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT
+                    id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY head_entity_uuid, relation_type, tail_entity_uuid
+                        ORDER BY confidence_score DESC NULLS LAST, created_at NULLS LAST, id
+                    ) AS rn
+                FROM knowledge_triples
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+
+    # 이전 버전 로더가 런타임에 만든 index가 있을 수 있어 IF NOT EXISTS로 만듭니다.
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_entities_type_canonical
+        ON entities (entity_type, canonical_name)
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_knowledge_triples_head_relation_tail
+        ON knowledge_triples (head_entity_uuid, relation_type, tail_entity_uuid)
+        """
+    )
+
+
+def downgrade() -> None:
+    # 정리한 중복 행은 되돌리지 않습니다.
+    op.execute("DROP INDEX IF EXISTS uq_knowledge_triples_head_relation_tail")
+    op.execute("DROP INDEX IF EXISTS uq_entities_type_canonical")
@@ -0,0 +1,181 @@
+"""
+auto_triples.jsonl 스트리밍 적재기.
+
+수집기 출력(학교당 1줄, `triples[].entries`)을 한 줄씩 읽어 `GraphBulkLoader`로
+배치 단위 upsert 합니다. 파일 전체를 메모리에 올리지 않으며, 배치를 커밋할 때마다
+"다음에 읽을 바이트 오프셋"을 체크포인트 파일에 기록하므로 중단 후 재실행하면
+마지막으로 커밋된 줄 다음부터 이어서 적재합니다.
+
+체크포인트에는 첫 줄 해시와 오프셋 직전 바이트의 해시를 함께 저장하고, 파일이 오프셋보다 짧아졌거나
+두 해시 중 하나라도 달라지면(다른 수집 결과로 교체, 같은 첫 줄로 다시 쓴 경우 등) 처음부터 다시 읽습니다.
+inode나 수정 시각은 보지 않으므로 수집 재개로 줄이 덧붙거나 `repair_output`이 같은 내용을
+`os.replace`로 다시 써도 마지막 오프셋부터 이어서 적재합니다. upsert이므로 같은 줄을 다시 적재해도 안전합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .graph_loader import GraphBulkLoader, TripleRecord, records_from_report
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_FINGERPRINT_BYTES = 4096
+
+
+def _first_line_hash(path: Path) -> str:
+    """첫 줄(최대 `_FINGERPRINT_BYTES` 바이트)의 해시."""
+    with path.open("rb") as fp:
+        return hashlib.sha256(fp.readline(_FINGERPRINT_BYTES)).hexdigest()
+
+
+def _prefix_hash(path: Path, offset: int) -> str:
+    """오프셋 직전 최대 `_FINGERPRINT_BYTES` 바이트의 해시 (같은 첫 줄로 다시 쓴 파일 판별용)."""
+    start = max(0, offset - _FINGERPRINT_BYTES)
+    with path.open("rb") as fp:
+        fp.seek(start)
+        return hashlib.sha256(fp.read(offset - start)).hexdigest()
+
+
+class TripleJsonlIngester:
+    """JSONL 수집 결과를 배치 커밋 + 바이트 오프셋 체크포인트로 적재합니다."""
+
+    def __init__(
+        self,
+        loader: GraphBulkLoader,
+        *,
+        batch_size: int = 5000,
+        checkpoint_path: Optional[Path | str] = None,
+    ) -> None:
+        """
+        Args:
+            loader: DB 연결을 가진 벌크 로더
+            batch_size: 한 트랜잭션에 모을 Triple 수 (줄 경계에서 끊음)
+            checkpoint_path: 체크포인트 파일 경로 (None이면 `<입력>.checkpoint.json`)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+        self.loader = loader
+        self.batch_size = batch_size
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+
+    def _checkpoint_file(self, jsonl_path: Path) -> Path:
+        return self.checkpoint_path or jsonl_path.with_name(jsonl_path.name + ".checkpoint.json")
+
+    def read_checkpoint(self, jsonl_path: Path) -> int:
+        """유효한 체크포인트가 있으면 재개할 바이트 오프셋을, 없으면 0을 반환합니다."""
+        checkpoint_file = self._checkpoint_file(jsonl_path)
+        if not checkpoint_file.exists():
+            return 0
+        try:
+            data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
+            offset = int(data.get("offset", 0))
+        except (OSError, ValueError) as exc:
+            logger.warning("체크포인트를 읽을 수 없어 처음부터 적재합니다: %s", exc)
+            return 0
+        if (
+            offset > jsonl_path.stat().st_size
+            or data.get("first_line") != _first_line_hash(jsonl_path)
+            or data.get("prefix_hash") != _prefix_hash(jsonl_path, offset)
+        ):
+            logger.info("입력 파일이 바뀌어 체크포인트를 무시합니다: %s", jsonl_path)
+            return 0
+        return offset
+
+    def _write_checkpoint(self, jsonl_path: Path, offset: int, first_line: str) -> None:
+        checkpoint_file = self._checkpoint_file(jsonl_path)
+        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = checkpoint_file.with_suffix(checkpoint_file.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "source": str(jsonl_path),
+                    "offset": offset,
+                    "first_line": first_line,
+                    "prefix_hash": _prefix_hash(jsonl_path, offset),
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, checkpoint_file)
+
+    def ingest(self, jsonl_path: Path | str, *, resume: bool = True) -> Dict[str, Any]:
+        """
+        JSONL 파일을 적재합니다.
+
+        Args:
+            jsonl_path: AutoTripleCollector 출력 파일
+            resume: True면 체크포인트 오프셋부터 이어서 적재
+
+        Returns:
+            적재 요약 (lines, batches, triples, entities, skipped_lines, offset)
+        """
+        jsonl_path = Path(jsonl_path)
+        if not jsonl_path.exists():
+            raise FileNotFoundError(f"적재할 파일을 찾을 수 없습니다: {jsonl_path}")
+
+        first_line = _first_line_hash(jsonl_path)
+        start_offset = self.read_checkpoint(jsonl_path) if resume else 0
+        summary: Dict[str, Any] = {
+            "source": str(jsonl_path),
+            "start_offset": start_offset,
+            "lines": 0,
+            "skipped_lines": 0,
+            "batches": 0,
+            "triples": 0,
+            "entities": 0,
+        }
+        if start_offset:
+            logger.info("체크포인트에서 재개: %s @ %d bytes", jsonl_path, start_offset)
+
+        batch: List[TripleRecord] = []
+        offset = start_offset
+        with jsonl_path.open("rb") as fp:
+            fp.seek(start_offset)
+            while True:
+                line = fp.readline()
+                if not line:
+                    break
+                if not line.endswith(b"\n"):
+                    # 개행으로 끝나지 않은 마지막 줄은 아직 쓰는 중일 수 있어 다음 실행으로 미룹니다.
+                    break
+                offset += len(line)
+                summary["lines"] += 1
+                if not line.strip():
+                    continue
+                try:
+                    report = json.loads(line)
+                except ValueError:
+                    summary["skipped_lines"] += 1
+                    logger.warning("JSON 파싱 실패로 줄을 건너뜁니다 (offset=%d)", offset - len(line))
+                    continue
+                batch.extend(records_from_report(report))
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, jsonl_path, offset, first_line, summary)
+                    batch = []
+
+        self._flush(batch, jsonl_path, offset, first_line, summary)
+        summary["offset"] = offset
+        logger.info("JSONL 적재 완료: %s", summary)
+        return summary
+
+    def _flush(
+        self,
+        batch: List[TripleRecord],
+        jsonl_path: Path,
+        offset: int,
+        first_line: str,
+        summary: Dict[str, Any],
+    ) -> None:
+        if batch:
+            counts = self.loader.load(batch)
+            summary["batches"] += 1
+            summary["triples"] += counts["triples"]
+            summary["entities"] += counts["entities"]
+        # 커밋이 끝난 뒤에만 오프셋을 전진시켜, 중단 시 커밋되지 않은 줄을 다시 읽게 합니다.
+        self._write_checkpoint(jsonl_path, offset, first_line)
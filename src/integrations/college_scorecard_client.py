@@ -14,11 +14,12 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from src.crawlers.parsers.statistics_parser import StatisticsParser
+from src.utils.http_client import get_default_http_client
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -39,6 +40,8 @@ class ScorecardStats:
     graduation_rate_percent: Optional[int]
     average_salary_usd: Optional[int]
     employment_rate_percent: Optional[int] = None
+    # Scorecard `school.alias` (쉼표 구분 별칭 문자열)를 나눈 값
+    aliases: Tuple[str, ...] = ()
 
 
 class CollegeScorecardClient:
@@ -48,12 +51,14 @@ class CollegeScorecardClient:
         timeout_seconds: int = 15,
         max_retries: int = 3,
         base_url: str = SCORECARD_BASE_URL,
+        session: Optional[requests.Session] = None,
     ) -> None:
         self._api_key = (api_key or os.getenv("COLLEGE_SCORECARD_API") or "").strip() or None
         self._timeout_seconds = timeout_seconds
         self._max_retries = max_retries
         self._base_url = base_url
-        self._session = requests.Session()
+        # 주입받은 세션(공유 연결 풀)은 이 클라이언트가 닫지 않습니다.
+        self._session = session or get_default_http_client().session
         self._cache: Dict[Tuple[str, Optional[str], Optional[str]], Optional[ScorecardStats]] = {}
 
     def is_enabled(self) -> bool:
@@ -103,6 +108,30 @@ class CollegeScorecardClient:
         self._cache[cache_key] = stats
         return stats
 
+    def search_schools(self, name: str, per_page: int = 20) -> Optional[List[ScorecardStats]]:
+        """
+        이름 검색 결과 전체를 정규화하여 반환합니다 (alias 생성기의 이름 충돌 확인용).
+
+        키가 없거나 요청이 실패하면 None을 반환합니다 (결과 없음 `[]`과 구분).
+        """
+        name_key = (name or "").strip()
+        if not name_key or not self._api_key:
+            return None
+        data = self._get_with_retry(
+            {
+                "api_key": self._api_key,
+                "school.name": name_key,
+                "per_page": per_page,
+                "page": 0,
+                "fields": "id,school",
+                "keys_nested": "true",
+            }
+        )
+        if data is None:
+            return None
+        results = data.get("results") or []
+        return [stats for stats in map(self._extract_stats, results) if stats is not None]
+
     def _get_with_retry(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         last_error: Optional[str] = None
         for attempt in range(1, self._max_retries + 1):
@@ -221,4 +250,12 @@ class CollegeScorecardClient:
             graduation_rate_percent=graduation_rate,
             average_salary_usd=salary,
             employment_rate_percent=employment_rate_percent,
+            aliases=CollegeScorecardClient._split_aliases(school.get("alias")),
         )
+
+    @staticmethod
+    def _split_aliases(raw: Any) -> Tuple[str, ...]:
+        if not raw:
+            return ()
+        parts = raw if isinstance(raw, list) else str(raw).split(",")
+        return tuple(str(part).strip() for part in parts if str(part).strip())
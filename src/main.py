@@ -9,18 +9,25 @@ import sys
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
 
+from src.crawlers.parse_pool import ParsePool
 from src.crawlers.school_crawler import SchoolCrawler
-from src.database.connection import get_db
+from src.database.connection import engine, get_db
+from src.database.graph_loader import GraphBulkLoader
 from src.database.models import AuditLog, School
 from src.database.repository import SchoolRepository
+from src.database.triple_ingester import TripleJsonlIngester
 from src.services.auto_triple_collector import AutoTripleCollector
+from src.services.crawl_work_queue import CrawlWorkQueue, SchoolProcessingFailed, run_queue_worker
+from src.services.extraction_queue import ExtractionQueue
 from src.services.scorecard_enrichment_service import ScorecardEnrichmentService
+from src.services.triple_store import SchoolTripleStore
+from src.utils.config import config
 from src.utils.failed_sites import failed_site_manager
 from src.utils.logger import setup_logger
 
@@ -343,21 +350,49 @@ def crawl_single_school(
     return result
 
 
-def crawl_all_schools(json_file: Path, limit: int = None) -> None:
+def crawl_all_schools(
+    json_file: Path,
+    limit: int = None,
+    *,
+    work_queue: Optional[CrawlWorkQueue] = None,
+) -> None:
     """
     모든 학교 크롤링
     
     Args:
         json_file: 학교 목록 JSON 파일
         limit: 크롤링할 최대 학교 수 (None이면 전체)
+        work_queue: 지정되면 직접 크롤링하지 않고 학교를 작업 큐에 적재만 합니다
+            (여러 노드의 `crawl-worker`가 나눠서 처리)
     """
     schools = load_schools_list(json_file)
     
     if limit:
         schools = schools[:limit]
+
+    if work_queue is not None:
+        # 정보가 부족한 학교도 워커가 건너뜀/감사 로그를 남기도록 그대로 적재합니다.
+        queued = work_queue.enqueue(
+            (school.get('website') or school.get('name') or json.dumps(school, sort_keys=True), school, 0.0)
+            for school in schools
+        )
+        logger.info(f"📥 {queued}개 학교를 작업 큐에 적재 (전체 {len(schools)}개, 대기 상태: {work_queue.stats()})")
+        return
     
     logger.info(f"📚 총 {len(schools)}개 학교 크롤링 시작\n")
-    
+    success_count, fail_count = _crawl_schools(schools)
+
+    # 최종 결과
+    logger.info(f"\n{'='*60}")
+    logger.info(f"📊 최종 결과")
+    logger.info(f"{'='*60}")
+    logger.info(f"✅ 성공: {success_count}개")
+    logger.info(f"❌ 실패: {fail_count}개")
+    logger.info("💾 저장 방식: DB 단일 저장")
+
+
+def _crawl_schools(schools: List[dict]) -> Tuple[int, int]:
+    """학교 목록을 순서대로 크롤링하고 (성공 수, 실패 수)를 반환합니다."""
     success_count = 0
     fail_count = 0
     
@@ -464,14 +499,31 @@ def crawl_all_schools(json_file: Path, limit: int = None) -> None:
                 message="예외 발생으로 크롤링 실패",
             )
             fail_count += 1
-    
-    # 최종 결과
-    logger.info(f"\n{'='*60}")
-    logger.info(f"📊 최종 결과")
-    logger.info(f"{'='*60}")
-    logger.info(f"✅ 성공: {success_count}개")
-    logger.info(f"❌ 실패: {fail_count}개")
-    logger.info("💾 저장 방식: DB 단일 저장")
+
+    return success_count, fail_count
+
+
+def _crawl_queued_school(school: dict) -> dict:
+    """작업 큐에서 lease 받은 학교 하나를 크롤링합니다."""
+    success_count, _ = _crawl_schools([school])
+    if not success_count:
+        # 실패한 학교는 complete 대신 fail로 기록되어 max_attempts까지 다시 lease됩니다.
+        raise SchoolProcessingFailed(f"크롤링 실패: {school.get('name') or school.get('website')}")
+    return {"success": True}
+
+
+def run_crawl_worker(queue_url: str, *, keep_polling: bool = False) -> None:
+    """
+    작업 큐에서 학교를 lease 받아 크롤링하는 워커를 실행합니다.
+
+    keep_polling이 False면 대기열이 비는 즉시 종료하고, True면 새 적재를 기다리며 계속 실행합니다.
+    """
+    work_queue = CrawlWorkQueue.from_url(queue_url, lease_seconds=config.CRAWL_LEASE_SECONDS)
+    try:
+        summary = run_queue_worker(work_queue, _crawl_queued_school, stop_when_empty=not keep_polling)
+        logger.info(f"작업 큐 워커 summary: {summary} (대기 상태: {work_queue.stats()})")
+    finally:
+        work_queue.close()
 
 
 def run_auto_triple_collection(
@@ -480,29 +532,107 @@ def run_auto_triple_collection(
     limit: Optional[int] = None,
     gemini_key: str | None = None,
     output: Optional[Path] = None,
+    queue_db: Optional[Path] = None,
+    merged_output: Optional[Path] = None,
+    workers: int = 1,
+    resume: Optional[bool] = None,
+    parse_workers: int = 0,
 ) -> None:
-    """Phase 2 자동 크롤링 확장 파이프라인을 실행합니다."""
-    collector = AutoTripleCollector(
-        schools_json=schools_file,
-        output_path=output or Path(__file__).parent.parent / "data" / "auto_triples.jsonl",
-        gemini_api_key=gemini_key,
-    )
-    summary = collector.run(limit=limit)
+    """
+    Phase 2 자동 크롤링 확장 파이프라인을 실행합니다.
+
+    queue_db가 주어지면 페이지를 추출 큐에 적재만 하고(deferred 모드),
+    Triple 추출은 `extract` 명령이 별도로 수행합니다.
+    merged_output이 주어지면 이전 실행 결과와 병합한 학교별 중복 제거 Triple도 저장합니다.
+    resume이 None이면 끝나지 않은 체크포인트가 있을 때만 이어서 수집합니다.
+    parse_workers가 1 이상이면 HTML 파싱/청킹을 그 수만큼의 프로세스에서 수행합니다.
+    """
+    with ParsePool(parse_workers) as parse_pool:
+        collector = AutoTripleCollector(
+            schools_json=schools_file,
+            output_path=output or Path(__file__).parent.parent / "data" / "auto_triples.jsonl",
+            gemini_api_key=gemini_key,
+            extraction_queue=ExtractionQueue(queue_db) if queue_db else None,
+            triple_store=SchoolTripleStore(merged_output).load() if merged_output else None,
+            parse_pool=parse_pool if parse_workers > 0 else None,
+        )
+        if resume is None:
+            resume = collector.can_resume(limit=limit)
+            if resume:
+                logger.info("끝나지 않은 수집 체크포인트를 발견하여 이어서 수집합니다 (--force로 새로 시작)")
+        summary = collector.run(limit=limit, workers=workers, resume=resume)
     logger.info("AutoTripleCollector summary: %s", summary)
 
 
+def run_deferred_extraction(
+    schools_file: Path,
+    *,
+    queue_db: Path,
+    workers: int = 2,
+    gemini_key: str | None = None,
+    output: Optional[Path] = None,
+    merged_output: Optional[Path] = None,
+    parse_workers: int = 0,
+) -> None:
+    """deferred 모드로 적재된 추출 큐를 워커 풀로 처리합니다."""
+    with ParsePool(parse_workers) as parse_pool:
+        collector = AutoTripleCollector(
+            schools_json=schools_file,
+            output_path=output or Path(__file__).parent.parent / "data" / "auto_triples.jsonl",
+            gemini_api_key=gemini_key,
+            extraction_queue=ExtractionQueue(queue_db),
+            triple_store=SchoolTripleStore(merged_output).load() if merged_output else None,
+            parse_pool=parse_pool if parse_workers > 0 else None,
+        )
+        summary = collector.drain_extraction_queue(workers=workers)
+    logger.info("추출 큐 summary: %s", summary)
+
+
+def run_triple_ingestion(
+    jsonl_path: Path,
+    *,
+    batch_size: int = 5000,
+    resume: bool = True,
+) -> None:
+    """수집기 JSONL 출력을 entities/knowledge_triples에 스트리밍 적재합니다."""
+    conn = engine.raw_connection()
+    try:
+        loader = GraphBulkLoader(conn)
+        summary = TripleJsonlIngester(loader, batch_size=batch_size).ingest(jsonl_path, resume=resume)
+        logger.info("Triple 적재 summary: %s", summary)
+    finally:
+        conn.close()
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description='College Crawler - 미국 대학 정보 수집')
 
     parser.add_argument(
         'command',
-        choices=['crawl', 'test', 'harvest'],
-        help='실행할 명령 (crawl: 전체/단일 학교 크롤링, test: 첫 학교 테스트, harvest: Triple 자동 수집)',
+        choices=['crawl', 'crawl-worker', 'test', 'harvest', 'extract', 'ingest'],
+        help=(
+            '실행할 명령 (crawl: 전체/단일 학교 크롤링, crawl-worker: 작업 큐의 학교 크롤링, '
+            'test: 첫 학교 테스트, harvest: Triple 자동 수집, extract: 추출 큐 처리, ingest: 수집 결과 DB 적재)'
+        ),
     )
     parser.add_argument('--school', type=str, help='크롤링할 특정 학교 이름')
     parser.add_argument('--website', type=str, help='학교 웹사이트 URL (--school과 함께 사용)')
     parser.add_argument('--limit', type=int, help='크롤링할 최대 학교 수 또는 harvest 샘플 수')
+    parser.add_argument(
+        '--queue-url',
+        type=str,
+        default=config.CRAWL_QUEUE_URL or None,
+        help=(
+            '분산 크롤링 작업 큐 (sqlite:///path 또는 postgresql://..., 기본 CRAWL_QUEUE_URL). '
+            'crawl은 학교를 큐에 적재만 하고 crawl-worker가 처리'
+        ),
+    )
+    parser.add_argument(
+        '--keep-polling',
+        action='store_true',
+        help='대기열이 비어도 종료하지 않고 새 적재를 기다림 (crawl-worker 전용)',
+    )
     parser.add_argument(
         '--schools-file',
         type=str,
@@ -516,7 +646,67 @@ def main():
     parser.add_argument(
         '--auto-output',
         type=str,
-        help='Triple 자동 수집 결과 출력 파일 경로 (harvest 전용)',
+        help='Triple 자동 수집 결과 파일 경로 (harvest/extract 출력, ingest 입력)',
+    )
+    parser.add_argument(
+        '--defer',
+        action='store_true',
+        help='harvest 시 페이지를 추출 큐에만 적재하고 Triple 추출은 extract 명령으로 분리',
+    )
+    parser.add_argument(
+        '--queue-db',
+        type=str,
+        help='추출 큐 SQLite 경로 (harvest --defer/extract 전용, 기본 data/extraction_queue.sqlite3)',
+    )
+    parser.add_argument(
+        '--harvest-workers',
+        type=int,
+        default=1,
+        help='동시에 수집할 학교 수 (harvest 전용, 같은 도메인 학교는 순차 처리)',
+    )
+    resume_group = parser.add_mutually_exclusive_group()
+    resume_group.add_argument(
+        '--resume',
+        action='store_true',
+        help='체크포인트에 완료된 학교를 건너뛰고 이어서 수집 (harvest 전용, 기본: 중단된 수집이 있으면 자동 재개)',
+    )
+    resume_group.add_argument(
+        '--force',
+        action='store_true',
+        help='체크포인트를 무시하고 출력 파일을 비운 뒤 처음부터 수집 (harvest 전용)',
+    )
+    parser.add_argument(
+        '--extract-workers',
+        type=int,
+        default=2,
+        help='추출 큐를 처리할 워커 수 (extract 전용)',
+    )
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=0,
+        help='HTML 파싱/청킹을 수행할 프로세스 수 (harvest/extract 전용, 0이면 수집 스레드에서 처리)',
+    )
+    parser.add_argument(
+        '--merged-output',
+        type=str,
+        help='페이지/실행 간 중복을 병합한 학교별 Triple JSONL 경로 (harvest/extract 전용, 기본 data/school_triples.jsonl)',
+    )
+    parser.add_argument(
+        '--no-merge',
+        action='store_true',
+        help='학교별 병합 Triple 저장을 생략 (harvest/extract 전용)',
+    )
+    parser.add_argument(
+        '--ingest-batch-size',
+        type=int,
+        default=5000,
+        help='한 트랜잭션으로 커밋할 Triple 수 (ingest 전용)',
+    )
+    parser.add_argument(
+        '--restart',
+        action='store_true',
+        help='체크포인트를 무시하고 파일 처음부터 적재 (ingest 전용)',
     )
     
     args = parser.parse_args()
@@ -534,18 +724,56 @@ def main():
             # 특정 학교 크롤링
             crawl_single_school(args.school, args.website)
         else:
-            # 전체 학교 크롤링
+            # 전체 학교 크롤링 (--queue-url이 있으면 작업 큐에 적재만)
             json_file = project_root / 'data' / 'schools_initial.json'
-            crawl_all_schools(json_file, limit=args.limit)
-    elif args.command == 'harvest':
+            if args.queue_url:
+                work_queue = CrawlWorkQueue.from_url(args.queue_url, lease_seconds=config.CRAWL_LEASE_SECONDS)
+                try:
+                    crawl_all_schools(json_file, limit=args.limit, work_queue=work_queue)
+                finally:
+                    work_queue.close()
+            else:
+                crawl_all_schools(json_file, limit=args.limit)
+    elif args.command == 'crawl-worker':
+        if not args.queue_url:
+            parser.error('crawl-worker에는 --queue-url 또는 CRAWL_QUEUE_URL이 필요합니다.')
+        run_crawl_worker(args.queue_url, keep_polling=args.keep_polling)
+    elif args.command == 'ingest':
+        jsonl_path = Path(args.auto_output) if args.auto_output else project_root / 'data' / 'auto_triples.jsonl'
+        run_triple_ingestion(
+            jsonl_path,
+            batch_size=args.ingest_batch_size,
+            resume=not args.restart,
+        )
+    elif args.command in ('harvest', 'extract'):
         schools_file = Path(args.schools_file) if args.schools_file else project_root / 'data' / 'schools_initial_full.json'
         output_path = Path(args.auto_output) if args.auto_output else None
-        run_auto_triple_collection(
-            schools_file=schools_file,
-            limit=args.limit,
-            gemini_key=args.gemini_key,
-            output=output_path,
-        )
+        queue_db = Path(args.queue_db) if args.queue_db else project_root / 'data' / 'extraction_queue.sqlite3'
+        merged_output = None
+        if not args.no_merge:
+            merged_output = Path(args.merged_output) if args.merged_output else project_root / 'data' / 'school_triples.jsonl'
+        if args.command == 'extract':
+            run_deferred_extraction(
+                schools_file=schools_file,
+                queue_db=queue_db,
+                workers=args.extract_workers,
+                gemini_key=args.gemini_key,
+                output=output_path,
+                merged_output=merged_output,
+                parse_workers=args.parse_workers,
+            )
+        else:
+            run_auto_triple_collection(
+                schools_file=schools_file,
+                limit=args.limit,
+                gemini_key=args.gemini_key,
+                output=output_path,
+                queue_db=queue_db if args.defer else None,
+                merged_output=merged_output,
+                workers=args.harvest_workers,
+                resume=True if args.resume else False if args.force else None,
+                parse_workers=args.parse_workers,
+            )
 
 
 if __name__ == '__main__':
@@ -4,6 +4,8 @@
 - 컨테이너에서 root/cron 데몬 없이 동작하도록 설계
 - APScheduler로 "매일 KST 새벽 2시" 실행
 - 옵션으로 컨테이너 시작 시 1회 즉시 실행
+- CRAWL_QUEUE_URL이 설정되면 학교를 작업 큐에 적재하고, 이 컨테이너도 워커 하나로 참여
+  (다른 노드는 `python -m src.main crawl-worker`로 같은 큐를 나눠 처리)
 """
 
 from __future__ import annotations
@@ -19,7 +21,9 @@ import pytz
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from src.main import crawl_all_schools
+from src.main import crawl_all_schools, run_crawl_worker
+from src.services.crawl_work_queue import CrawlWorkQueue
+from src.utils.config import config
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -59,7 +63,17 @@ def run_crawl_once(limit: Optional[int] = None) -> None:
     logger.info(f"- limit={limit}")
     started_at = datetime.utcnow()
 
-    crawl_all_schools(json_file=json_file, limit=limit)
+    queue_url = config.CRAWL_QUEUE_URL
+    if queue_url:
+        logger.info(f"- queue_url={queue_url.split('@')[-1]}")  # 자격 증명은 로그에 남기지 않습니다.
+        work_queue = CrawlWorkQueue.from_url(queue_url, lease_seconds=config.CRAWL_LEASE_SECONDS)
+        try:
+            crawl_all_schools(json_file=json_file, limit=limit, work_queue=work_queue)
+        finally:
+            work_queue.close()
+        run_crawl_worker(queue_url)
+    else:
+        crawl_all_schools(json_file=json_file, limit=limit)
 
     elapsed = (datetime.utcnow() - started_at).total_seconds()
     logger.info(f"크롤링 실행 종료 (elapsed_seconds={elapsed:.1f})")
@@ -75,6 +89,7 @@ def main() -> None:
     - SCHEDULER_DAILY_MINUTE (default: 0)
     - SCHEDULER_RUN_ON_STARTUP (default: true)
     - CRAWL_LIMIT (default: unset)
+    - CRAWL_QUEUE_URL (default: unset, 설정 시 작업 큐 기반 분산 크롤링)
     """
 
     timezone = os.getenv("SCHEDULER_TIMEZONE", "Asia/Seoul")
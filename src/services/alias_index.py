@@ -0,0 +1,297 @@
+"""
+EntityResolver용 alias 색인 (데이터 파일 기반 + 핫 리로드).
+
+alias 테이블은 버전이 있는 JSON 파일(`data/entity_aliases.json` 등)에서 읽어
+정규화 키 → canonical 매핑, trigram fuzzy 색인, normalize memo를 한 번에 컴파일한
+불변(immutable) `AliasIndex`로 만듭니다. 프로세스당 한 번 빌드하여 모든 추출기/워커가
+공유하고, 원본 파일이 바뀌면 새 색인을 빌드한 뒤 참조만 원자적으로 교체합니다.
+
+alias 파일 형식:
+    {"version": "2026-10-19.1", "aliases": {"Canonical Name": ["alias", ...]}}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from difflib import get_close_matches
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping, Sequence
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_SPECIAL_RE = re.compile(r"[^a-zA-Z0-9\s,&\-]")
+_SPACE_RE = re.compile(r"\s+")
+_FUZZY_CUTOFF = 0.93
+_NGRAM = 3
+
+# 앞선 파일이 alias 충돌 시 우선합니다 (수작업 사전 > 자동 생성 학교 alias).
+DEFAULT_ALIAS_PATHS: tuple[Path, ...] = (
+    Path(__file__).parent.parent.parent / "data" / "entity_aliases.json",
+    Path(__file__).parent.parent.parent / "data" / "school_aliases.json",
+)
+
+
+def normalize_key(value: str) -> str:
+    """alias 조회용 정규화 키 (소문자, 마침표/특수문자 제거, 공백 정리)."""
+    lowered = value.lower().strip()
+    lowered = lowered.replace(".", "").replace("-", " ")
+    lowered = _SPECIAL_RE.sub("", lowered)
+    lowered = _SPACE_RE.sub(" ", lowered).strip()
+    return lowered
+
+
+def clean_entity_name(value: str) -> str:
+    """alias에 없는 엔티티 이름의 fallback 표기 (특수문자를 공백으로 바꾸고 공백 정리)."""
+    return _SPACE_RE.sub(" ", _SPECIAL_RE.sub(" ", value)).strip()
+
+
+def _ngram_counts(value: str) -> Counter[str]:
+    return Counter(value[i : i + _NGRAM] for i in range(len(value) - _NGRAM + 1))
+
+
+class _FuzzyKeyIndex:
+    """
+    difflib.get_close_matches 결과를 그대로 유지하면서 후보 집합만 줄이는 trigram 색인.
+
+    SequenceMatcher ratio = 2M/T (M: 매칭 문자 수, T: 두 문자열 길이 합)이 cutoff 이상이면
+    - 길이 조건: 2·min(la, lb)/T >= cutoff
+    - 매칭 블록 수 k <= (T - 2M) + 1 이고 각 블록은 (길이 - 2)개 이상의 trigram을 공유하므로
+      공유 trigram 수(multiset) >= M - 2k
+    를 만족해야 합니다. 이 하한을 통과한 키만 실제 get_close_matches로 채점하므로
+    결과(동점 처리 포함)는 전체 스캔과 동일합니다.
+    """
+
+    def __init__(self, keys: Iterable[str], cutoff: float = _FUZZY_CUTOFF) -> None:
+        self.cutoff = cutoff
+        self._keys: list[str] = sorted(set(keys))
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+        # 길이 호환 구간(cutoff 0.93 기준 약 ±7%)만 훑도록 posting을 길이별로 나눕니다.
+        self._postings: dict[int, dict[str, list[tuple[int, int]]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for key_id, key in enumerate(self._keys):
+            self._by_length[len(key)].append(key_id)
+            for gram, count in _ngram_counts(key).items():
+                self._postings[len(key)][gram].append((key_id, count))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _compatible_lengths(self, query_len: int) -> list[int]:
+        return [
+            length
+            for length in self._by_length
+            if query_len + length and 2 * min(query_len, length) / (query_len + length) >= self.cutoff
+        ]
+
+    def candidates(self, query: str) -> list[str]:
+        """ratio >= cutoff 가능성이 있는 키만 반환합니다 (거짓 음성 없음)."""
+        lengths = self._compatible_lengths(len(query))
+        if not lengths:
+            return []
+
+        query_grams = _ngram_counts(query)
+        result: list[str] = []
+        for length in lengths:
+            total = len(query) + length
+            # ratio >= cutoff 를 만족하는 최소 매칭 수와, 그때 허용되는 최대 불일치 문자 수
+            # (부동소수 오차로 후보가 빠지지 않도록 epsilon만큼 보수적으로 계산)
+            min_matches = math.ceil(self.cutoff * total / 2 - 1e-9)
+            max_unmatched = total - 2 * min_matches
+            need = min_matches - (_NGRAM - 1) * (max_unmatched + 1)
+            key_ids = self._by_length[length]
+            if need <= 0:
+                result.extend(self._keys[key_id] for key_id in key_ids)
+                continue
+
+            postings = self._postings[length]
+            shared: dict[int, int] = defaultdict(int)
+            for gram, q_count in query_grams.items():
+                for key_id, k_count in postings.get(gram, ()):
+                    shared[key_id] += min(q_count, k_count)
+            result.extend(self._keys[key_id] for key_id, count in shared.items() if count >= need)
+        return result
+
+    def best_match(self, query: str) -> str | None:
+        near = get_close_matches(query, self.candidates(query), n=1, cutoff=self.cutoff)
+        return near[0] if near else None
+
+
+class _LruMemo:
+    """여러 워커 스레드가 공유하는 resolver용 소형 LRU 캐시."""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 8192) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple[str, bool], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, bool]) -> str | None:
+        with self._lock:
+            value = self._data.get(key, self._MISSING)
+            if value is self._MISSING:
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, bool], value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+@dataclass(frozen=True)
+class AliasIndex:
+    """한 번 컴파일되면 바뀌지 않는 alias 색인 (교체는 registry가 참조 단위로 수행)."""
+
+    version: str
+    alias_to_canonical: Mapping[str, str]
+    fuzzy: _FuzzyKeyIndex
+    memo: _LruMemo = field(default_factory=_LruMemo, compare=False)
+
+    @classmethod
+    def build(
+        cls,
+        sources: Iterable[Mapping[str, Iterable[str]]],
+        version: str = "inline",
+    ) -> "AliasIndex":
+        """
+        canonical → aliases 매핑들로 색인을 만듭니다.
+
+        canonical 이름의 키는 다른 항목의 alias가 덮어쓰지 못하고, alias 충돌 시에는
+        먼저 나온 소스가 우선합니다 (핵심 사전이 자동 생성 alias보다 우선).
+        """
+        sources = list(sources)
+        mapping: dict[str, str] = {}
+        for aliases_by_canonical in sources:
+            for canonical in aliases_by_canonical:
+                mapping.setdefault(normalize_key(canonical), canonical)
+        for aliases_by_canonical in sources:
+            for canonical, aliases in aliases_by_canonical.items():
+                for alias in aliases:
+                    alias_key = normalize_key(alias)
+                    if alias_key:
+                        mapping.setdefault(alias_key, canonical)
+        mapping.pop("", None)
+        return cls(
+            version=version,
+            alias_to_canonical=MappingProxyType(mapping),
+            fuzzy=_FuzzyKeyIndex(mapping.keys()),
+        )
+
+
+def load_alias_file(path: Path) -> tuple[str, dict[str, list[str]]]:
+    """alias JSON 파일을 읽어 (version, canonical → aliases)를 반환합니다."""
+    with path.open("r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    aliases = data.get("aliases", {})
+    if not isinstance(aliases, dict):
+        raise ValueError(f"alias 파일 형식 오류(aliases는 객체여야 함): {path}")
+    return str(data.get("version", "unversioned")), {
+        str(canonical): [str(alias) for alias in values or []]
+        for canonical, values in aliases.items()
+    }
+
+
+class AliasIndexRegistry:
+    """
+    alias 파일들로부터 `AliasIndex`를 빌드/공유하고, 파일 변경 시 원자적으로 교체합니다.
+
+    `current()`는 최대 `check_interval`초마다 파일 mtime만 확인하므로 normalize 경로의
+    추가 비용은 사실상 없습니다. 리로드 중 예외가 나면 기존 색인을 계속 사용합니다.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Path | str] | None = None,
+        *,
+        check_interval: float = 30.0,
+    ) -> None:
+        self.paths = [Path(p) for p in (paths if paths is not None else _paths_from_env())]
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature: tuple | None = None
+        self._next_check = 0.0
+        self._index = self._build()
+
+    def _file_signature(self) -> tuple:
+        signature = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((str(path), None, None))
+        return tuple(signature)
+
+    def _build(self) -> AliasIndex:
+        signature = self._file_signature()
+        sources: list[dict[str, list[str]]] = []
+        versions: list[str] = []
+        for path in self.paths:
+            if not path.exists():
+                continue
+            version, aliases = load_alias_file(path)
+            sources.append(aliases)
+            versions.append(f"{path.name}@{version}")
+        index = AliasIndex.build(sources, version="+".join(versions) or "empty")
+        self._signature = signature
+        self._next_check = time.monotonic() + self.check_interval
+        logger.info(
+            "alias 색인 빌드: version=%s, keys=%d", index.version, len(index.alias_to_canonical)
+        )
+        return index
+
+    def current(self) -> AliasIndex:
+        """현재 색인을 반환합니다 (필요 시 변경 감지 후 교체)."""
+        if time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self._index
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """원본 파일이 바뀌었으면 새 색인을 빌드해 교체합니다."""
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            if not force and self._file_signature() == self._signature:
+                return False
+            try:
+                new_index = self._build()
+            except (OSError, ValueError) as exc:
+                logger.warning("alias 색인 리로드 실패(기존 색인 유지): %s", exc)
+                return False
+            self._index = new_index  # 참조 교체는 원자적이므로 reader는 lock이 필요 없습니다.
+            return True
+
+
+def _paths_from_env() -> list[Path]:
+    value = os.getenv("ENTITY_ALIAS_PATHS")
+    if value:
+        return [Path(part) for part in value.split(os.pathsep) if part.strip()]
+    return list(DEFAULT_ALIAS_PATHS)
+
+
+_default_registry: AliasIndexRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_alias_registry() -> AliasIndexRegistry:
+    """프로세스 전역 공유 registry (최초 호출 시 한 번만 빌드)."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = AliasIndexRegistry()
+    return _default_registry
@@ -7,16 +7,31 @@ knowledge_triples/graph signal 검증에 사용할 자료 구조를 준비합니
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+import requests
 
+from src.crawlers.link_extractor import iter_links
+from src.crawlers.parse_pool import ParsePool
 from src.crawlers.school_crawler import SchoolCrawler
 from src.services.entity_resolution import NormalizedTriple
+from src.services.extraction_queue import ExtractionQueue, content_hash
+from src.services.harvest_checkpoint import HarvestCheckpoint, report_line
+from src.services.llm_usage import UsageStats
+from src.services.triple_store import SchoolTripleStore
 from src.services.web_page_analyzer import WebPageAnalyzer
+from src.utils.host_scope import DEFAULT_SCOPE_POLICY, HostScope, registered_domain, url_host
+from src.utils.http_client import PooledHttpClient
+from src.utils.url_canonicalizer import UrlCanonicalizer, get_default_canonicalizer
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -59,15 +74,37 @@ class AutoTripleCollector:
         *,
         output_path: Path | str = Path("data/auto_triples.jsonl"),
         gemini_api_key: str | None = None,
+        extraction_queue: ExtractionQueue | None = None,
+        triple_store: SchoolTripleStore | None = None,
+        http_client: PooledHttpClient | None = None,
+        canonicalizer: UrlCanonicalizer | None = None,
+        host_scope: str = DEFAULT_SCOPE_POLICY,
+        parse_pool: ParsePool | None = None,
     ) -> None:
         self.schools_json = schools_json
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         self.schools = self._load_schools()
         self.logger = logger
+        # 지정되면 페이지를 즉시 추출하지 않고 큐에 적재만 합니다 (deferred 모드).
+        self.extraction_queue = extraction_queue
+        # 지정되면 페이지/실행 간 중복을 병합한 학교별 Triple 집합도 함께 유지합니다.
+        self.triple_store = triple_store
+        # 학교 단위 완료 기록 (`<output>.checkpoint.jsonl`), run(resume=True)가 이어 받습니다.
+        self.checkpoint = HarvestCheckpoint.for_output(self.output_path)
+        # 지정되면 모든 학교가 이 연결 풀을 공유합니다. 없으면 run()마다 워커 수에 맞춰 만들고 닫습니다.
+        self.http_client = http_client
+        self._http_session: Optional[requests.Session] = None
+        self.canonicalizer = canonicalizer or get_default_canonicalizer()
+        # 후보 링크로 인정할 호스트 범위 정책 ("exact" | "registered_domain")
+        self.host_scope = HostScope.validate_policy(host_scope)
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._host_locks_guard = threading.Lock()
+        # 지정되면 페이지 파싱/청킹을 프로세스 풀에서 수행합니다 (수명은 호출 측이 관리).
+        self.parse_pool = parse_pool
         self.analyzer: Optional[WebPageAnalyzer]
         try:
-            self.analyzer = WebPageAnalyzer(gemini_api_key=gemini_api_key)
+            self.analyzer = WebPageAnalyzer(gemini_api_key=gemini_api_key, parse_pool=parse_pool)
         except ValueError as exc:
             self.logger.warning(
                 "Gemini API 키가 없어 Triple 추출을 생략합니다 (%s)", exc
@@ -82,45 +119,199 @@ class AutoTripleCollector:
         except FileNotFoundError as exc:
             raise RuntimeError(f"학교 목록 파일을 찾을 수 없음: {self.schools_json}") from exc
 
-    def run(self, limit: int | None = None) -> Dict[str, Any]:
+    def run(
+        self,
+        limit: int | None = None,
+        *,
+        workers: int = 1,
+        resume: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        학교 목록을 수집하여 JSONL로 기록합니다.
+
+        Args:
+            limit: 처리할 최대 학교 수
+            workers: 동시에 처리할 학교 수. 2 이상이면 학교 단위 스레드 풀로 수집하고,
+                JSONL은 호출 스레드 하나가 완료 순서대로 기록합니다.
+            resume: True면 체크포인트에 완료로 기록된 학교를 건너뛰고 출력 파일에 이어 씁니다.
+                False면 출력 파일과 체크포인트를 비우고 처음부터 수집합니다.
+        """
         schools = self.schools if limit is None else self.schools[:limit]
         total_triples = 0
         processed_schools = 0
+        queued_pages = 0
+        pages_fetched = 0
+        bytes_fetched = 0
+        run_usage = UsageStats()
+
+        checkpoint = self.checkpoint
+        run_params = self._run_params(limit)
+        if resume:
+            checkpoint.load()
+            if not checkpoint.matches(run_params):
+                self.logger.warning(
+                    "체크포인트의 수집 조건이 현재와 다르지만 resume=True라 이어서 수집합니다: %s → %s",
+                    checkpoint.run_params,
+                    run_params,
+                )
+            checkpoint.repair_output(self.output_path)
+            self._replay_output_into_store()
+        else:
+            checkpoint.reset(run_params)
+        pending = [school for school in schools if not checkpoint.is_done(school.get("name"))]
+        resumed = [
+            checkpoint.completed[school["name"]] for school in schools if checkpoint.is_done(school.get("name"))
+        ]
+        for entry in resumed:
+            run_usage.merge(self._usage_from_dict(entry.get("usage")))
+            queued_pages += entry.get("queued", 0)
+            if entry.get("has_triples"):
+                processed_schools += 1
+                total_triples += entry.get("triples", 0)
 
         self.logger.info(
-            "AutoTripleCollector 시작 (schools=%s, output=%s)",
+            "AutoTripleCollector 시작 (schools=%s, resumed=%s, workers=%s, output=%s)",
             len(schools),
+            len(resumed),
+            workers,
             self.output_path,
         )
 
-        with self.output_path.open("w", encoding="utf-8") as fp:
-            for school in schools:
-                report = self._collect_for_school(school)
-                if report.get("routing", {}).get("skipped"):
-                    fp.write(json.dumps(report, ensure_ascii=False))
-                    fp.write("\n")
-                    continue
-
-                if report.get("triples"):
+        started = time.monotonic()
+        with self.output_path.open("a" if resume else "w", encoding="utf-8") as fp, self._http_scope(workers) as http:
+            # 공유 풀의 카운터는 다른 학교/실행과 누적되므로 이번 실행 시작 시점과의 차이만 보고합니다.
+            http_baseline = http.stats()
+            for done, report in enumerate(self._iter_reports(pending, workers), 1):
+                self._log_progress(done, len(pending), started, report.get("school_name"))
+                content_hashes = report.pop("content_hashes", {})
+                # 가져온 규모는 JSONL 스키마에 넣지 않고 이번 실행 summary에만 합산합니다.
+                pages_fetched += report.pop("pages_fetched", 0)
+                bytes_fetched += report.pop("bytes_fetched", 0)
+                run_usage.merge(self._usage_from_dict(report.get("usage")))
+                if self.triple_store is not None:
+                    self.triple_store.add_report(report)
+                queued_pages += len(report.get("queued_urls", []))
+                if report.get("triples") and not report.get("routing", {}).get("skipped"):
                     processed_schools += 1
                     total_triples += sum(entry.get("count", 0) for entry in report["triples"])
 
-                fp.write(json.dumps(report, ensure_ascii=False))
+                line = report_line(report)
+                fp.write(line)
                 fp.write("\n")
+                fp.flush()
+                os.fsync(fp.fileno())
+                # 출력 줄이 디스크에 내려간 뒤에만 완료로 기록합니다.
+                checkpoint.record(report, line=line, content_hashes=content_hashes)
 
+        checkpoint.mark_run_completed()
         summary = {
             "schools_processed": len(schools),
             "schools_with_triples": processed_schools,
             "triples_collected": total_triples,
+            "pages_fetched": pages_fetched,
+            "bytes_fetched": bytes_fetched,
+            "usage": run_usage.to_dict(),
             "output": str(self.output_path),
         }
+        if resume:
+            summary["schools_resumed"] = len(resumed)
+        summary["http"] = http.stats().since(http_baseline).to_dict()
+        if self.parse_pool is not None:
+            summary["parse_pool"] = self.parse_pool.stats()
+        if self.extraction_queue is not None:
+            summary["pages_queued"] = queued_pages
+        if self.triple_store is not None:
+            self.triple_store.save()
+            summary["unique_triples"] = len(self.triple_store)
         self.logger.info(
-            "AutoTripleCollector 완료: schools=%d, triples=%d",
+            "AutoTripleCollector 완료: schools=%d, triples=%d, tokens=%d, cost=$%.4f",
             summary["schools_processed"],
             total_triples,
+            run_usage.total_tokens,
+            run_usage.cost_usd,
         )
         return summary
 
+    @contextmanager
+    def _http_scope(self, workers: int) -> Iterator[PooledHttpClient]:
+        """run() 동안 학교 크롤러가 공유할 연결 풀 (주입받은 풀은 닫지 않음)."""
+        client = self.http_client or PooledHttpClient(pool_size=max(1, workers))
+        self._http_session = client.session
+        try:
+            yield client
+        finally:
+            self._http_session = None
+            if client is not self.http_client:
+                client.close()
+
+    def can_resume(self, limit: int | None = None) -> bool:
+        """같은 학교 목록/limit으로 시작했다가 끝나지 않은 이전 수집의 체크포인트가 있는지 확인합니다."""
+        if not self.checkpoint.exists():
+            return False
+        checkpoint = self.checkpoint.load()
+        if not checkpoint.completed or checkpoint.run_completed:
+            return False
+        if not checkpoint.matches(self._run_params(limit)):
+            self.logger.info(
+                "학교 목록 파일 또는 limit이 바뀌어 이전 체크포인트를 이어 받지 않습니다: %s", checkpoint.run_params
+            )
+            return False
+        return True
+
+    def _run_params(self, limit: int | None) -> Dict[str, Any]:
+        """체크포인트에 남기는 수집 조건 (학교 목록 파일 경로/내용 해시, limit)."""
+        return {
+            "schools_file": str(Path(self.schools_json).resolve()),
+            "schools_sha256": hashlib.sha256(Path(self.schools_json).read_bytes()).hexdigest(),
+            "limit": limit,
+        }
+
+    def _replay_output_into_store(self) -> None:
+        # 중단된 실행은 병합 저장소를 save하지 못했으므로, 이미 기록된 리포트를 다시 반영합니다.
+        # SchoolTripleStore는 덮어쓰지 않고 병합합니다. Triple마다 출처 URL별 confidence의 max를 보관하고
+        # noisy-OR은 서로 다른 URL끼리만 합치므로, 이미 반영된 리포트를 다시 넣어도 값이 바뀌지 않습니다.
+        if self.triple_store is None or not self.output_path.exists():
+            return
+        with self.output_path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                if line.strip():
+                    self.triple_store.add_report(json.loads(line))
+
+    def _iter_reports(self, schools: List[dict[str, Any]], workers: int) -> Iterator[Dict[str, Any]]:
+        """학교별 리포트를 완료되는 대로 yield 합니다 (기록은 호출 측 단일 스레드)."""
+        if workers <= 1:
+            for school in schools:
+                yield self._collect_for_school(school)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="harvest") as executor:
+            futures = [executor.submit(self._collect_politely, school) for school in schools]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _collect_politely(self, school: dict[str, Any]) -> Dict[str, Any]:
+        """같은 등록 도메인(예: 한 district의 여러 college)은 동시에 크롤링하지 않습니다."""
+        with self._host_lock(school.get("website")):
+            return self._collect_for_school(school)
+
+    def _host_lock(self, website: str | None) -> threading.Lock:
+        key = registered_domain(url_host(website or ""))
+        with self._host_locks_guard:
+            return self._host_locks.setdefault(key, threading.Lock())
+
+    def _log_progress(self, done: int, total: int, started: float, school_name: str | None) -> None:
+        elapsed = time.monotonic() - started
+        eta = elapsed / done * (total - done) if done else 0.0
+        self.logger.info(
+            "진행 %d/%d (%.0f%%) %s | 경과 %.0fs, 예상 남은 시간 %.0fs",
+            done,
+            total,
+            100.0 * done / total if total else 100.0,
+            school_name,
+            elapsed,
+            eta,
+        )
+
     def _collect_for_school(self, school: dict[str, Any]) -> Dict[str, Any]:
         name = school.get("name")
         website = school.get("website")
@@ -130,7 +321,11 @@ class AutoTripleCollector:
             "discovered_urls": [],
             "triples": [],
             "routing": {},
+            "content_hashes": {},
+            "pages_fetched": 0,
+            "bytes_fetched": 0,
         }
+        school_usage = UsageStats()
 
         if not name or not website:
             result["routing"]["skipped"] = True
@@ -139,75 +334,240 @@ class AutoTripleCollector:
             return result
 
         try:
-            with SchoolCrawler(name, website) as crawler:
+            with SchoolCrawler(name, website, session=self._http_session) as crawler:
                 response = crawler.fetch(website, max_retry=1, timeout_seconds=15)
+                if response:
+                    self._count_fetched(result, response)
                 if not response or not response.text.strip():
                     result["routing"]["skipped"] = True
                     result["routing"]["reason"] = "홈페이지 응답 없음"
                     return result
 
-                candidate_urls = self._discover_candidate_urls(response.text, crawler.base_url)
+                final_url = getattr(response, "url", None)
+                if isinstance(final_url, str) and final_url:
+                    self.canonicalizer.add_redirect(website, final_url)
+                    if url_host(final_url) != url_host(website):
+                        result["effective_url"] = final_url
+                else:
+                    final_url = crawler.base_url
+                # redirect 이후의 실제 주소를 기준으로 링크를 풀고 범위를 정합니다.
+                candidate_urls = self._discover_candidate_urls(
+                    response.text, final_url, site_url=crawler.base_url
+                )
                 result["discovered_urls"] = candidate_urls
 
                 for url in candidate_urls:
                     if crawler.ssl_error_detected:
                         break
                     page_response = crawler.fetch(url, max_retry=1, timeout_seconds=20)
+                    if page_response:
+                        self._count_fetched(result, page_response)
                     if not page_response or not page_response.text.strip():
                         continue
+                    result["content_hashes"][url] = content_hash(page_response.text)
+                    if self.extraction_queue is not None:
+                        self.extraction_queue.enqueue(name, url, page_response.text, website=website)
+                        result.setdefault("queued_urls", []).append(url)
+                        continue
+                    page_usage = UsageStats()
                     page_triples = self._extract_triples_from_page(
                         html=page_response.text,
                         school_name=name,
                         source_url=url,
+                        usage=page_usage,
                     )
+                    school_usage.merge(page_usage)
                     if page_triples:
                         result["triples"].append(
                             {
                                 "source_url": url,
                                 "count": len(page_triples),
                                 "entries": page_triples,
+                                "usage": page_usage.to_dict(),
                             }
                         )
         except Exception as exc:
             self.logger.error("Triple 자동 수집 실패: %s / %s", name, exc)
             result["routing"]["skipped"] = True
             result["routing"]["reason"] = f"예외: {exc}"
+        # Triple이 나오지 않은 페이지의 호출 비용도 학교 단위 합계에는 포함합니다.
+        result["usage"] = school_usage.to_dict()
         return result
 
-    def _discover_candidate_urls(self, html: str, base_url: str) -> List[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        base_domain = urlparse(base_url).netloc.lower()
-        candidates: List[str] = []
+    @staticmethod
+    def _count_fetched(result: Dict[str, Any], response: Any) -> None:
+        content = getattr(response, "content", None)
+        size = len(content) if isinstance(content, (bytes, bytearray)) else len(response.text.encode("utf-8"))
+        result["pages_fetched"] += 1
+        result["bytes_fetched"] += size
 
-        for anchor in soup.find_all("a", href=True):
-            href = anchor["href"].strip()
-            if not href or href.startswith("#") or href.startswith("mailto:"):
-                continue
+    def drain_extraction_queue(
+        self,
+        *,
+        workers: int = 2,
+        output_path: Path | str | None = None,
+        max_attempts: int = 3,
+        stale_after_seconds: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        deferred 모드에서 적재된 페이지를 추출 워커 풀로 처리하고 학교별 리포트를 씁니다.
+
+        워커 수는 크롤링과 독립적으로 정하며, 실제 호출 속도는 QuotaController의
+        전역 백오프가 모델 quota에 맞춰 조절합니다. 이미 done인 항목은 다시 호출하지 않습니다.
+        LLM 호출이 실패한 페이지는 `queue.fail`로 넘겨 `max_attempts`까지 다시 시도합니다.
+
+        Args:
+            stale_after_seconds: 시작할 때 이보다 오래 processing 상태인 항목을 pending으로 되돌림
+                (기본 0: 같은 큐를 처리하는 다른 프로세스가 없다고 보고 전부 복구)
+        """
+        if self.extraction_queue is None:
+            raise RuntimeError("extraction_queue가 설정되지 않았습니다.")
+        if not self.analyzer:
+            self.logger.warning("Gemini 키 없음: 추출 큐 처리를 건너뜁니다.")
+            return {"pages_extracted": 0, "pages_failed": 0, "queue": self.extraction_queue.stats()}
+
+        queue = self.extraction_queue
+        requeued = queue.requeue_stale(older_than_seconds=stale_after_seconds)
+        if requeued:
+            self.logger.info("중단된 추출 항목 %d건을 대기열로 복구했습니다.", requeued)
+
+        counters = {"pages_extracted": 0, "pages_failed": 0}
+        counters_lock = threading.Lock()
+
+        def _worker(worker_id: str) -> None:
+            while True:
+                items = queue.claim(worker_id, limit=1)
+                if not items:
+                    return
+                item = items[0]
+                page_usage = UsageStats()
+                try:
+                    triples = self._extract_triples_from_page(
+                        html=item.html,
+                        school_name=item.school_name,
+                        source_url=item.source_url,
+                        usage=page_usage,
+                        raise_errors=True,
+                    )
+                    queue.complete(item.id, triples, page_usage.to_dict())
+                    key = "pages_extracted"
+                except Exception as exc:
+                    self.logger.warning("추출 큐 항목 실패: %s / %s", item.source_url, exc)
+                    queue.fail(item.id, str(exc), max_attempts=max_attempts)
+                    key = "pages_failed"
+                with counters_lock:
+                    counters[key] += 1
+
+        threads = [
+            threading.Thread(target=_worker, args=(f"extractor-{index}",), daemon=True)
+            for index in range(max(1, workers))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        export_summary = self.export_queue_results(output_path or self.output_path)
+        summary = {**counters, **export_summary, "queue": queue.stats()}
+        self.logger.info("추출 큐 처리 완료: %s", summary)
+        return summary
 
-            abs_url = urljoin(base_url, href)
+    def export_queue_results(self, output_path: Path | str) -> Dict[str, Any]:
+        """큐의 done 결과를 수집기와 같은 JSONL 스키마(학교당 1줄)로 내보냅니다."""
+        if self.extraction_queue is None:
+            raise RuntimeError("extraction_queue가 설정되지 않았습니다.")
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        total_triples = 0
+        run_usage = UsageStats()
+        reports: Dict[str, Dict[str, Any]] = {}
+
+        for row in self.extraction_queue.iter_results():
+            report = reports.setdefault(
+                row["school_name"],
+                {
+                    "school_name": row["school_name"],
+                    "website": row["website"],
+                    "discovered_urls": [],
+                    "triples": [],
+                    "routing": {"deferred": True},
+                    "usage": UsageStats(),
+                },
+            )
+            report["discovered_urls"].append(row["source_url"])
+            page_usage = self._usage_from_dict(row["usage"])
+            report["usage"].merge(page_usage)
+            if row["entries"]:
+                report["triples"].append(
+                    {
+                        "source_url": row["source_url"],
+                        "count": len(row["entries"]),
+                        "entries": row["entries"],
+                        "usage": page_usage.to_dict(),
+                    }
+                )
+                total_triples += len(row["entries"])
+
+        with path.open("w", encoding="utf-8") as fp:
+            for report in reports.values():
+                if self.triple_store is not None:
+                    self.triple_store.add_report(report)
+                run_usage.merge(report["usage"])
+                report["usage"] = report["usage"].to_dict()
+                fp.write(json.dumps(report, ensure_ascii=False))
+                fp.write("\n")
+
+        summary = {
+            "schools_with_triples": sum(1 for report in reports.values() if report["triples"]),
+            "triples_collected": total_triples,
+            "usage": run_usage.to_dict(),
+            "output": str(path),
+        }
+        if self.triple_store is not None:
+            self.triple_store.save()
+            summary["unique_triples"] = len(self.triple_store)
+        return summary
+
+    def _discover_candidate_urls(self, html: str, base_url: str, *, site_url: str | None = None) -> List[str]:
+        """
+        홈페이지 HTML에서 Triple 추출 후보 URL을 고릅니다.
+
+        Args:
+            html: 홈페이지 HTML
+            base_url: 홈페이지의 실제(redirect 이후) URL
+            site_url: 학교 목록에 등록된 원래 URL (redirect 전 호스트도 범위에 포함)
+        """
+        scope = HostScope.for_site(site_url or base_url, base_url, policy=self.host_scope)
+        candidates: List[str] = []
+        # `/programs`, `/programs/`, `/Programs#top`, `?utm_*` 변형은 한 번만 후보로 넣습니다.
+        seen: set[str] = set()
+
+        def _add(url: str) -> None:
+            key = self.canonicalizer.dedupe_key(url)
+            if key not in seen:
+                seen.add(key)
+                candidates.append(self.canonicalizer.canonicalize(url))
+
+        # 후보를 MAX_TARGETS개 찾으면 generator를 닫아 나머지 HTML은 파싱하지 않습니다.
+        for link in iter_links(html, base_url, collect_context=False):
+            abs_url = link.url
             parsed = urlparse(abs_url)
             if not parsed.scheme.startswith("http"):
                 continue
-            if parsed.netloc and parsed.netloc.lower() != base_domain:
+            if not scope.contains(abs_url):
                 continue
 
             normalized = parsed.path.lower()
-            link_text = anchor.get_text(" ", strip=True).lower()
+            link_text = link.anchor_text.lower()
             if any(keyword in normalized or keyword in link_text for keyword in self.TARGET_KEYWORDS):
-                if abs_url not in candidates:
-                    candidates.append(abs_url)
+                _add(abs_url)
             if len(candidates) >= self.MAX_TARGETS:
                 break
 
         for segment in self.FALLBACK_SEGMENTS:
             if len(candidates) >= self.MAX_TARGETS:
                 break
-            fallback = urljoin(base_url, segment)
-            parsed = urlparse(fallback)
-            if parsed.netloc and parsed.netloc.lower() != base_domain:
-                continue
-            if fallback not in candidates:
-                candidates.append(fallback)
+            _add(urljoin(base_url, segment))
 
         return candidates
 
@@ -216,23 +576,49 @@ class AutoTripleCollector:
         html: str,
         school_name: str,
         source_url: str,
+        usage: UsageStats | None = None,
+        *,
+        raise_errors: bool = False,
     ) -> List[Dict[str, Any]]:
+        """
+        페이지 하나에서 Triple을 추출합니다.
+
+        raise_errors가 True면(추출 큐 경로) 예외를 그대로 올리고, 청크 단위 LLM 호출이
+        하나라도 실패했거나 rate limit 재시도 한도를 넘겨 버려진 청크가 있어도 예외를 발생시켜
+        호출 측이 항목을 재시도하게 합니다.
+        """
         if not self.analyzer:
             self.logger.debug("Gemini 키 없음: Triple 추출 스킵 (%s)", school_name)
             return []
 
+        if raise_errors and usage is None:
+            usage = UsageStats()
+        failed_before = usage.failed_calls + usage.dropped_chunks if usage is not None else 0
         try:
             raw_triples = self.analyzer.extract_triples(
                 html=html,
                 school_name=school_name,
                 source_url=source_url,
+                usage=usage,
             )
         except Exception as exc:
+            if raise_errors:
+                raise
             self.logger.warning("Triples 추출 중 예외: %s / %s", school_name, exc)
             return []
+        if raise_errors and usage is not None and usage.failed_calls + usage.dropped_chunks > failed_before:
+            raise RuntimeError(
+                f"LLM 호출/청크 {usage.failed_calls + usage.dropped_chunks - failed_before}건 실패: {source_url}"
+            )
 
         return [self._serialize_triple(triple) for triple in raw_triples]
 
+    @staticmethod
+    def _usage_from_dict(data: Dict[str, Any] | None) -> UsageStats:
+        if not data:
+            return UsageStats()
+        return UsageStats(**{key: data[key] for key in UsageStats.__dataclass_fields__ if key in data})
+
     @staticmethod
     def _serialize_triple(triple: NormalizedTriple) -> Dict[str, Any]:
         return {
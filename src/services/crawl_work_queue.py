@@ -0,0 +1,425 @@
+"""
+여러 워커 프로세스/노드가 학교를 나눠 크롤링하기 위한 lease 기반 작업 큐.
+
+한 컨테이너가 학교 목록 전체를 도는 대신, 스케줄러(또는 CrawlingPipeline)가 학교를
+`crawl_work_queue` 테이블에 적재하고 N개의 워커가 한 곳씩 lease를 받아 처리합니다.
+
+- claim: 대기 항목을 예상 비용(priority)이 큰 순서로 골라 `leased`로 바꾸고 만료 시각을 기록합니다.
+  Postgres에서는 `SELECT … FOR UPDATE SKIP LOCKED`로 다른 워커가 잡은 행을 기다리지 않고 건너뛰고,
+  SQLite(로컬 실행)에서는 UPDATE 한 문장이 DB 쓰기 락을 잡아 같은 효과를 냅니다.
+- heartbeat: 처리 중인 워커가 주기적으로 만료 시각을 연장합니다.
+- 만료: heartbeat가 끊긴(죽은) 워커의 항목은 다음 claim 때 다시 대기열로 돌아가고,
+  시도 횟수가 `max_attempts`에 도달하면 failed로 남습니다.
+
+시각은 각 워커의 시계(epoch 초)를 쓰므로 `lease_seconds`는 노드 간 시계 오차보다 충분히 커야 합니다.
+Postgres 테이블은 alembic 마이그레이션(004_add_crawl_work_queue)이 만들고, SQLite는 열 때 생성합니다.
+
+참고 자료:
+- https://www.postgresql.org/docs/current/sql-select.html#SQL-FOR-UPDATE-SHARE
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_LEASED = "leased"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+DIALECTS = ("sqlite", "postgresql")
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_work_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    school_key TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    priority REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_work_queue_claim ON crawl_work_queue (status, priority DESC, id);
+"""
+
+# 이미 대기/처리 중인 학교는 건드리지 않고, 끝난(done/failed) 학교만 새 실행을 위해 다시 대기열에 넣습니다.
+_ENQUEUE_SQL = """
+    INSERT INTO crawl_work_queue (school_key, payload, priority, status, attempts, enqueued_at, updated_at)
+    VALUES (?, ?, ?, 'queued', 0, ?, ?)
+    ON CONFLICT (school_key) DO UPDATE SET
+        payload = excluded.payload,
+        priority = excluded.priority,
+        status = 'queued',
+        attempts = 0,
+        worker_id = NULL,
+        lease_expires_at = NULL,
+        error = NULL,
+        result = NULL,
+        enqueued_at = excluded.enqueued_at,
+        updated_at = excluded.updated_at
+    WHERE crawl_work_queue.status IN ('done', 'failed')
+"""
+
+_ENQUEUE_NEW_ONLY_SQL = """
+    INSERT INTO crawl_work_queue (school_key, payload, priority, status, attempts, enqueued_at, updated_at)
+    VALUES (?, ?, ?, 'queued', 0, ?, ?)
+    ON CONFLICT (school_key) DO NOTHING
+"""
+
+_REAP_SQL = """
+    UPDATE crawl_work_queue
+    SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,
+        worker_id = NULL,
+        lease_expires_at = NULL,
+        error = 'lease expired',
+        updated_at = ?
+    WHERE status = 'leased' AND lease_expires_at < ?
+"""
+
+_CLAIM_SQL = """
+    UPDATE crawl_work_queue
+    SET status = 'leased', worker_id = ?, lease_expires_at = ?, attempts = attempts + 1, updated_at = ?
+    WHERE id IN (
+        SELECT id FROM crawl_work_queue
+        WHERE status = 'queued'
+        ORDER BY priority DESC, id
+        LIMIT ?
+        {lock_clause}
+    )
+    RETURNING id, school_key, payload, priority, attempts
+"""
+
+_HEARTBEAT_SQL = """
+    UPDATE crawl_work_queue
+    SET lease_expires_at = ?, updated_at = ?
+    WHERE id = ? AND worker_id = ? AND status = 'leased'
+"""
+
+_COMPLETE_SQL = """
+    UPDATE crawl_work_queue
+    SET status = 'done', result = ?, error = NULL, worker_id = NULL, lease_expires_at = NULL, updated_at = ?
+    WHERE id = ? AND worker_id = ? AND status = 'leased'
+"""
+
+_FAIL_SQL = """
+    UPDATE crawl_work_queue
+    SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,
+        error = ?, worker_id = NULL, lease_expires_at = NULL, updated_at = ?
+    WHERE id = ? AND worker_id = ? AND status = 'leased'
+"""
+
+
+class SchoolProcessingFailed(RuntimeError):
+    """`run_queue_worker`의 process 함수가 학교 처리 실패를 알릴 때 던지는 예외 (traceback 없이 fail 기록)."""
+
+
+def default_worker_id() -> str:
+    """`<hostname>-<pid>` 형태의 워커 식별자."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class SchoolLease:
+    """워커가 claim한 학교 하나."""
+
+    id: int
+    school_key: str
+    school: Dict[str, Any]
+    priority: float
+    attempts: int
+    worker_id: str
+
+
+class CrawlWorkQueue:
+    """DB-API 연결 위의 lease 작업 큐 (thread-safe, 프로세스/노드 간 공유)."""
+
+    def __init__(
+        self,
+        conn: Any,
+        *,
+        dialect: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            conn: autocommit 모드의 DB-API 연결 (sqlite3 또는 psycopg2)
+            dialect: "sqlite" | "postgresql"
+            lease_seconds: heartbeat 없이 lease가 유지되는 시간
+            max_attempts: 이 횟수만큼 claim된 뒤에도 끝나지 않으면 failed 처리
+            clock: 현재 시각(초) 함수 (테스트 주입용)
+        """
+        if dialect not in DIALECTS:
+            raise ValueError(f"지원하지 않는 작업 큐 dialect: {dialect} (가능: {', '.join(DIALECTS)})")
+        self._conn = conn
+        self.dialect = dialect
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._lock = threading.Lock()
+        # 다른 워커가 잡고 있는 행은 기다리지 않고 건너뜁니다 (SQLite는 문장 단위 쓰기 락으로 충분).
+        self._claim_sql = self._sql(
+            _CLAIM_SQL.format(lock_clause="FOR UPDATE SKIP LOCKED" if dialect == "postgresql" else "")
+        )
+
+    @classmethod
+    def sqlite(cls, db_path: Path | str, **kwargs) -> "CrawlWorkQueue":
+        """로컬 실행용 SQLite 큐 (테이블이 없으면 만듭니다)."""
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(db_path),
+            timeout=30,
+            isolation_level=None,  # 문장마다 autocommit
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SQLITE_SCHEMA)
+        return cls(conn, dialect="sqlite", **kwargs)
+
+    @classmethod
+    def postgres(cls, dsn: str, **kwargs) -> "CrawlWorkQueue":
+        """Postgres 큐 (테이블은 alembic 마이그레이션으로 생성)."""
+        import psycopg2
+
+        conn = psycopg2.connect(dsn)
+        conn.autocommit = True
+        return cls(conn, dialect="postgresql", **kwargs)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "CrawlWorkQueue":
+        """`sqlite:///path/to/queue.sqlite3` 또는 `postgresql://…` URL로 큐를 엽니다."""
+        if url.startswith("sqlite:///"):
+            return cls.sqlite(url[len("sqlite:///"):], **kwargs)
+        if url.startswith(("postgresql://", "postgres://")):
+            return cls.postgres(url, **kwargs)
+        raise ValueError(f"지원하지 않는 작업 큐 URL: {url} (sqlite:/// 또는 postgresql://)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(
+        self,
+        schools: Iterable[Tuple[str, Dict[str, Any], float]],
+        *,
+        requeue_finished: bool = True,
+    ) -> int:
+        """
+        학교를 대기열에 넣습니다.
+
+        Args:
+            schools: (school_key, 학교 dict, 예상 비용) 목록. 비용이 큰 학교부터 claim됩니다.
+            requeue_finished: True면 이미 끝난(done/failed) 학교도 새 실행을 위해 다시 대기열에 넣고,
+                False면 큐에 처음 들어오는 학교만 넣습니다 (여러 노드가 같은 목록을 적재해도 한 번만 처리).
+
+        Returns:
+            새로 넣거나 다시 대기열로 돌린 학교 수 (대기/처리 중인 학교는 그대로 둠)
+        """
+        now = self._clock()
+        rows = [
+            (key, json.dumps(school, ensure_ascii=False), float(priority), now, now)
+            for key, school, priority in schools
+        ]
+        if not rows:
+            return 0
+        sql = self._sql(_ENQUEUE_SQL if requeue_finished else _ENQUEUE_NEW_ONLY_SQL)
+        inserted = 0
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                # executemany의 rowcount는 드라이버마다 달라 행마다 셉니다.
+                for row in rows:
+                    cursor.execute(sql, row)
+                    inserted += max(cursor.rowcount, 0)
+            finally:
+                cursor.close()
+        return inserted
+
+    def claim(self, worker_id: str, limit: int = 1) -> List[SchoolLease]:
+        """만료된 lease를 되돌린 뒤 대기 학교를 최대 limit개 lease 합니다."""
+        now = self._clock()
+        self.requeue_expired(now=now)
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute(self._claim_sql, (worker_id, now + self.lease_seconds, now, limit))
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        leases = [
+            SchoolLease(
+                id=int(row[0]),
+                school_key=row[1],
+                school=json.loads(row[2]),
+                priority=float(row[3]),
+                attempts=int(row[4]),
+                worker_id=worker_id,
+            )
+            for row in rows
+        ]
+        # RETURNING 순서는 보장되지 않으므로 비싼 학교부터 처리하도록 다시 정렬합니다.
+        leases.sort(key=lambda lease: (-lease.priority, lease.id))
+        return leases
+
+    def heartbeat(self, lease: SchoolLease) -> bool:
+        """lease 만료 시각을 연장합니다 (False면 이미 만료되어 다른 워커에게 넘어간 것)."""
+        now = self._clock()
+        return self._execute(_HEARTBEAT_SQL, (now + self.lease_seconds, now, lease.id, lease.worker_id)) == 1
+
+    def complete(self, lease: SchoolLease, result: Optional[Dict[str, Any]] = None) -> bool:
+        """처리 결과를 기록합니다 (lease를 잃었으면 False)."""
+        payload = json.dumps(result or {}, ensure_ascii=False)
+        return self._execute(_COMPLETE_SQL, (payload, self._clock(), lease.id, lease.worker_id)) == 1
+
+    def fail(self, lease: SchoolLease, error: str) -> bool:
+        """실패한 학교를 재시도 대기열로 돌리거나, 시도 한도를 넘기면 failed 처리합니다."""
+        params = (self.max_attempts, error[:1000], self._clock(), lease.id, lease.worker_id)
+        return self._execute(_FAIL_SQL, params) == 1
+
+    def requeue_expired(self, *, now: Optional[float] = None) -> int:
+        """heartbeat가 끊긴 lease를 대기열(또는 시도 한도를 넘기면 failed)로 돌립니다."""
+        now = self._clock() if now is None else now
+        return self._execute(_REAP_SQL, (self.max_attempts, now, now))
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 학교 수."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute("SELECT status, COUNT(*) FROM crawl_work_queue GROUP BY status")
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        counts = {status: 0 for status in (STATUS_QUEUED, STATUS_LEASED, STATUS_DONE, STATUS_FAILED)}
+        counts.update({status: int(count) for status, count in rows})
+        return counts
+
+    def _execute(self, sql: str, params: Tuple[Any, ...]) -> int:
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute(self._sql(sql), params)
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def _sql(self, sql: str) -> str:
+        # sqlite3는 qmark(?), psycopg2는 format(%s) 파라미터 스타일을 씁니다.
+        return sql.replace("?", "%s") if self.dialect == "postgresql" else sql
+
+
+class LeaseHeartbeat:
+    """처리하는 동안 백그라운드 스레드에서 lease를 연장합니다 (`with LeaseHeartbeat(queue, lease):`)."""
+
+    def __init__(self, queue: CrawlWorkQueue, lease: SchoolLease, *, interval: Optional[float] = None) -> None:
+        self.queue = queue
+        self.lease = lease
+        # 만료 전에 두 번 이상 연장을 시도하도록 lease 시간의 1/3 간격
+        self.interval = interval if interval is not None else max(queue.lease_seconds / 3, 0.01)
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f"lease-{lease.id}", daemon=True)
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                alive = self.queue.heartbeat(self.lease)
+            except Exception as exc:  # 일시적인 DB 오류는 다음 주기에 다시 시도합니다.
+                logger.warning("lease heartbeat 실패 (school=%s): %s", self.lease.school_key, exc)
+                continue
+            if not alive:
+                self.lost = True
+                logger.warning("lease가 만료되어 다른 워커에게 넘어감: %s", self.lease.school_key)
+                return
+
+
+def run_queue_worker(
+    queue: CrawlWorkQueue,
+    process: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    *,
+    worker_id: Optional[str] = None,
+    poll_interval: float = 5.0,
+    stop_when_empty: bool = True,
+    stop_event: Optional[threading.Event] = None,
+) -> Dict[str, int]:
+    """
+    큐에서 학교를 하나씩 lease 받아 `process(school)`로 처리합니다.
+
+    Args:
+        queue: 작업 큐
+        process: 학교 dict를 받아 결과 요약(dict, 선택)을 돌려주는 함수. 예외를 던지면 실패로 기록하며,
+            처리는 끝났지만 학교가 성공하지 못했으면 `SchoolProcessingFailed`를 던집니다.
+        worker_id: 워커 식별자 (기본 `<hostname>-<pid>`)
+        poll_interval: 대기열이 비었을 때 다시 확인할 간격 (stop_when_empty=False일 때)
+        stop_when_empty: True면 대기열이 비는 즉시 종료
+        stop_event: 설정되면 현재 학교를 마친 뒤 종료
+
+    Returns:
+        {"completed": n, "failed": n, "lost": n}
+    """
+    worker_id = worker_id or default_worker_id()
+    counters = {"completed": 0, "failed": 0, "lost": 0}
+    while stop_event is None or not stop_event.is_set():
+        leases = queue.claim(worker_id, limit=1)
+        if not leases:
+            if stop_when_empty:
+                break
+            if stop_event is not None:
+                stop_event.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+            continue
+
+        lease = leases[0]
+        with LeaseHeartbeat(queue, lease) as heartbeat:
+            try:
+                result = process(lease.school)
+            except SchoolProcessingFailed as exc:
+                logger.warning("작업 큐 학교 처리 실패 (school=%s): %s", lease.school_key, exc)
+                error = str(exc) or "failed"
+            except Exception as exc:
+                logger.exception("작업 큐 학교 처리 실패 (school=%s): %s", lease.school_key, exc)
+                error: Optional[str] = f"{type(exc).__name__}: {exc}"
+            else:
+                error = None
+        if heartbeat.lost:
+            counters["lost"] += 1
+            continue
+        if error is None and queue.complete(lease, result if isinstance(result, dict) else None):
+            counters["completed"] += 1
+        elif error is not None and queue.fail(lease, error):
+            counters["failed"] += 1
+        else:
+            counters["lost"] += 1
+    logger.info("작업 큐 워커 종료 (worker=%s): %s", worker_id, counters)
+    return counters
@@ -1,15 +1,26 @@
 """크롤링 파이프라인 런처."""
 from __future__ import annotations
 
-import json
 import logging
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from threading import Lock
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
+from src.crawlers.parse_pool import ParsePool
 from src.services.auto_triple_collector import AutoTripleCollector
+from src.services.crawl_work_queue import (
+    CrawlWorkQueue,
+    SchoolProcessingFailed,
+    default_worker_id,
+    run_queue_worker,
+)
+from src.services.school_cost import SchoolCost, SchoolCostStore
+from src.services.status_journal import DEFAULT_COMPACT_EVERY, StatusJournal
 from src.services.url_finder import UrlFinder
+from src.services.work_scheduler import WorkStealingScheduler
+from src.utils.http_client import PooledHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -19,31 +30,53 @@ class CrawlingPipeline:
 
     def __init__(
         self,
-        url_finder: UrlFinder,
+        url_finder: Optional[UrlFinder],
         collector_cls: type[AutoTripleCollector],
         *,
         status_path: Path | str = Path("data/crawling_status.json"),
         max_workers: int = 4,
+        status_compact_every: int = DEFAULT_COMPACT_EVERY,
+        parse_workers: int = 0,
+        work_queue: Optional[CrawlWorkQueue] = None,
+        clock: Callable[[], float] = time.monotonic,
+        http_client: Optional[PooledHttpClient] = None,
     ):
-        self.url_finder = url_finder
+        """
+        Args:
+            url_finder: 후보 URL 탐색기. None이면 파이프라인의 연결 풀 세션으로 `UrlFinder`를 만듭니다.
+                직접 넘길 때는 같은 풀을 쓰도록 `UrlFinder(session=http_client.session)`과 http_client를 함께 넘깁니다.
+            max_workers: 동시에 처리할 학교 수 (페이지 요청을 기다리는 I/O 스레드)
+            parse_workers: HTML 파싱/청킹 프로세스 수. 1 이상이면 run() 동안 공유 `ParsePool`을 만들어
+                collector에 `parse_pool`로 넘기고, 0이면 collector가 자기 스레드에서 파싱합니다.
+            work_queue: 지정되면 run()이 학교를 이 공유 큐에 적재한 뒤 큐에서 lease 받아 처리합니다.
+                같은 큐를 쓰는 다른 프로세스/노드의 파이프라인과 학교를 나눠 처리합니다.
+            clock: 학교별 소요 시간을 재는 시각(초) 함수 (테스트 주입용)
+            http_client: UrlFinder와 collector가 함께 쓸 연결 풀. None이면 max_workers에 맞춰 하나 만들고
+                run()이 끝날 때 연결을 닫습니다 (주입받은 풀은 닫지 않음).
+        """
+        # 학교 하나의 URL 탐색과 페이지 수집이 같은 호스트에 요청하므로 keep-alive 연결을 함께 씁니다.
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or PooledHttpClient(pool_size=max_workers)
+        self.url_finder = url_finder if url_finder is not None else UrlFinder(session=self.http_client.session)
         self.collector_cls = collector_cls
         self.status_path = Path(status_path)
         self.max_workers = max_workers
+        self.parse_workers = parse_workers
+        self.work_queue = work_queue
+        self._clock = clock
+        self._parse_pool: Optional[ParsePool] = None
         self._status_lock = Lock()
+        # 상태 변경은 저널에 한 줄씩 덧붙이고, status_path 스냅샷은 주기적으로만 교체합니다.
+        self._journal = StatusJournal(self.status_path, compact_every=status_compact_every)
         self._status = self._load_status()
+        # 학교별 페이지 수/바이트/소요 시간 기록 (`<status>.costs.json`), 다음 실행의 처리 순서를 정합니다.
+        self._costs = SchoolCostStore.for_status(self.status_path)
 
     def _load_status(self) -> Dict[str, str]:
-        if self.status_path.exists():
-            try:
-                return json.loads(self.status_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                return {}
-        return {}
+        return self._journal.load()
 
     def _persist_status(self) -> None:
-        self.status_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.status_path.open("w", encoding="utf-8") as fp:
-            json.dump(self._status, fp, ensure_ascii=False, indent=2)
+        self._journal.compact()
 
     def _school_key(self, school: Dict[str, str]) -> str:
         return school.get("website") or school.get("name") or "<unknown>"
@@ -56,9 +89,36 @@ class CrawlingPipeline:
         key = self._school_key(school)
         with self._status_lock:
             self._status[key] = status
-            self._persist_status()
+            if self._journal.append(key, status):
+                # 상태 스냅샷을 압축할 때 비용 기록도 함께 저장해, 중단돼도 다음 실행이 추정에 씁니다.
+                self._costs.save()
+
+    def _record_cost(
+        self,
+        school: Dict[str, str],
+        started: float,
+        summary: Dict[str, Any],
+        candidate_urls: List[str],
+        *,
+        completed: bool = True,
+    ) -> None:
+        # collector가 실제 페이지 수/바이트를 알려주면 그 값을, 아니면 후보 URL 수를 페이지 수로 씁니다.
+        pages = summary.get("pages_fetched")
+        if pages is None:
+            pages = (summary.get("http") or {}).get("requests", len(candidate_urls))
+        # 실패/건너뛴 학교의 소요 시간은 정상 처리 시간이 아니므로 기록하지 않고(0),
+        # 다음 추정은 이전 소요 시간 또는 페이지/바이트 규모로 합니다.
+        self._costs.record(
+            self._school_key(school),
+            SchoolCost(
+                pages=int(pages or 0),
+                bytes=int(summary.get("bytes_fetched") or 0),
+                duration_s=self._clock() - started if completed else 0.0,
+            ),
+        )
 
     def _process_school(self, school: Dict[str, str]) -> Dict[str, int]:
+        started = self._clock()
         name = school.get("name")
         homepage = school.get("website")
 
@@ -70,29 +130,73 @@ class CrawlingPipeline:
         candidate_urls = self.url_finder.find_target_urls(homepage)
         if not candidate_urls:
             logger.info("UrlFinder가 URL을 찾지 못해 AutoTripleCollector를 건너뜀: %s", homepage)
+            self._record_cost(school, started, {}, [], completed=False)
             self._record_status(school, "skipped")
             return {"triples_collected": 0}
 
         try:
-            collector = self.collector_cls(school=school, candidate_urls=candidate_urls)
+            collector_kwargs: Dict[str, Any] = {
+                "school": school,
+                "candidate_urls": candidate_urls,
+                "http_client": self.http_client,
+            }
+            if self._parse_pool is not None:
+                collector_kwargs["parse_pool"] = self._parse_pool
+            collector = self.collector_cls(**collector_kwargs)
             summary = collector.run()
+            summary = summary if isinstance(summary, dict) else {"triples_collected": 0}
+            self._record_cost(school, started, summary, candidate_urls)
             self._record_status(school, "completed")
-            return summary if isinstance(summary, dict) else {"triples_collected": 0}
+            return summary
         except Exception as exc:
             logger.exception("AutoTripleCollector 실행 실패 (school=%s): %s", name, exc)
+            self._record_cost(school, started, {}, candidate_urls, completed=False)
             self._record_status(school, "failed")
             return {"triples_collected": 0}
 
     def run(self, schools: List[Dict[str, str]]) -> int:
-        """ThreadPoolExecutor 기반으로 여러 학교를 동시에 처리합니다."""
-        total_triples = 0
+        """
+        여러 학교를 동시에 처리합니다.
+
+        이전 실행의 비용 기록으로 학교별 소요 시간을 추정해 오래 걸리는 학교부터 시작하고(LPT),
+        자기 몫을 끝낸 워커는 다른 워커에 남은 학교를 가져와 처리합니다 (`WorkStealingScheduler`).
+        parse_workers가 1 이상이면 I/O는 학교 스레드가, 파싱/청킹은 공유 프로세스 풀이 맡습니다.
+        work_queue가 있으면 같은 예상 비용을 priority로 큐에 적재하고, 여러 노드가 비싼 학교부터 나눠 처리합니다.
+        """
         pending = [school for school in schools if not self._should_skip(school)]
         if not pending:
             logger.info("모든 학교가 이미 처리되었거나 상태 파일에 완료로 기록됨.")
             return 0
 
-        with ThreadPoolExecutor(max_workers=min(len(pending), self.max_workers)) as executor:
-            futures = {executor.submit(self._process_school, school): school for school in pending}
+        if self.parse_workers > 0:
+            self._parse_pool = ParsePool(self.parse_workers)
+        try:
+            costs = self._costs.estimate_many(self._school_key(school) for school in pending)
+            if self.work_queue is not None:
+                total_triples = self._run_from_queue(pending, costs)
+            else:
+                total_triples = self._run_scheduled(pending, costs)
+        finally:
+            if self._parse_pool is not None:
+                logger.info("파싱 프로세스 풀 사용량: %s", self._parse_pool.stats())
+                self._parse_pool.close()
+                self._parse_pool = None
+            logger.info("HTTP 연결 풀 사용량: %s", self.http_client.stats().to_dict())
+            if self._owns_http_client:
+                self.http_client.close()
+            self._costs.save()
+            # 실행이 끝나면(중단 포함) 저널을 스냅샷으로 압축해 다음 시작 시 접을 줄을 줄입니다.
+            self._persist_status()
+
+        if total_triples == 0:
+            logger.warning("CrawlingPipeline 결과 Triple이 0개입니다.")
+        return total_triples
+
+    def _run_scheduled(self, pending: List[Dict[str, str]], costs: List[float]) -> int:
+        """이 프로세스의 워커 스레드만으로 예상 비용이 큰 학교부터 처리합니다."""
+        total_triples = 0
+        with WorkStealingScheduler(min(len(pending), self.max_workers), thread_name_prefix="pipeline") as scheduler:
+            futures = scheduler.submit_all(self._process_school, pending, costs)
             for future in as_completed(futures):
                 try:
                     summary = future.result()
@@ -100,7 +204,45 @@ class CrawlingPipeline:
                     logger.exception("학교 처리 중 예외 발생: %s", exc)
                     continue
                 total_triples += summary.get("triples_collected", 0) or 0
+        logger.info("학교 스케줄링 통계: %s", scheduler.stats())
+        return total_triples
 
-        if total_triples == 0:
-            logger.warning("CrawlingPipeline 결과 Triple이 0개입니다.")
+    def _run_from_queue(self, pending: List[Dict[str, str]], costs: List[float]) -> int:
+        """학교를 공유 작업 큐에 적재하고, max_workers개 스레드가 큐가 빌 때까지 lease 받아 처리합니다."""
+        queue = self.work_queue
+        assert queue is not None
+        # 파이프라인은 완료된 학교를 다시 처리하지 않으므로, 다른 노드가 이미 끝낸 학교는 다시 넣지 않습니다.
+        queued = queue.enqueue(
+            ((self._school_key(school), school, cost) for school, cost in zip(pending, costs)),
+            requeue_finished=False,
+        )
+        logger.info("작업 큐에 %d개 학교 적재 (대기 상태: %s)", queued, queue.stats())
+
+        total_triples = 0
+        total_lock = Lock()
+
+        def _process(school: Dict[str, str]) -> Dict[str, int]:
+            nonlocal total_triples
+            summary = self._process_school(school)
+            with self._status_lock:
+                failed = self._status.get(self._school_key(school)) == "failed"
+            if failed:
+                # collector 실패는 큐에서 fail로 기록해 다른 워커가 max_attempts까지 다시 시도하게 합니다.
+                raise SchoolProcessingFailed(f"AutoTripleCollector 실패: {school.get('name')}")
+            triples = summary.get("triples_collected", 0) or 0
+            with total_lock:
+                total_triples += triples
+            return {"triples_collected": triples}
+
+        worker_prefix = default_worker_id()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="queue") as executor:
+            futures = [
+                executor.submit(run_queue_worker, queue, _process, worker_id=f"{worker_prefix}-{index}")
+                for index in range(self.max_workers)
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.exception("작업 큐 워커 중단: %s", exc)
         return total_triples
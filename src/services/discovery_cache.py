@@ -0,0 +1,207 @@
+"""
+URL 탐색 결과 캐시.
+
+UrlFinder 전략의 `search()` 결과를 "홈페이지 키 + 전략 설정 키" 단위로 보관합니다.
+항목마다 저장 시각을 기록해 TTL이 지나면 다시 탐색하고, 경로를 주면 JSON 파일로 저장하여
+다음 실행(예: 야간 배치)이 전날 찾은 URL을 재사용합니다. 학교 사이트가 개편되면
+`invalidate(homepage)`로 해당 학교 항목만 지울 수 있습니다.
+
+홈페이지가 다른 주소로 redirect 되는 학교는 최종 origin(`record_origin`)도 함께 보관하여
+다음 탐색이 redirect 없이 실제 주소에서 시작하도록 합니다.
+
+홈페이지 키는 `UrlCanonicalizer.dedupe_key`를 사용하므로 `http://x.edu`, `https://x.edu/`는 같은 항목입니다.
+redirect alias는 프로세스 메모리에만 있으므로 키에는 적용하지 않습니다(다음 실행에서도 같은 키).
+
+변경 사항은 메모리에 모아 두었다가 `flush_every`건마다, 또는 마지막 저장 후 `flush_interval_seconds`가
+지나면 파일을 한 번에 교체합니다. 실행을 마칠 때 `close()`(또는 `with` 블록)로 남은 변경을 저장합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set
+
+from src.utils.logger import setup_logger
+from src.utils.url_canonicalizer import UrlCanonicalizer, get_default_canonicalizer
+
+logger = setup_logger(__name__)
+
+DEFAULT_DISCOVERY_CACHE_PATH = Path("data/discovery_cache.json")
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# 아무것도 찾지 못한 결과는 일시적 장애일 수 있어 짧게만 보관합니다.
+DEFAULT_EMPTY_TTL_SECONDS = 3600
+DEFAULT_FLUSH_EVERY = 50
+DEFAULT_FLUSH_INTERVAL_SECONDS = 30.0
+_CACHE_VERSION = 1
+
+
+class DiscoveryCache:
+    """TTL + 선택적 디스크 저장을 지원하는 탐색 결과 캐시 (thread-safe)."""
+
+    def __init__(
+        self,
+        path: Optional[Path | str] = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        empty_ttl_seconds: float = DEFAULT_EMPTY_TTL_SECONDS,
+        canonicalizer: Optional[UrlCanonicalizer] = None,
+        clock: Callable[[], float] = time.time,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Args:
+            path: JSON 저장 경로 (None이면 메모리에만 보관)
+            ttl_seconds: 결과 유효 기간
+            empty_ttl_seconds: 빈 결과의 유효 기간
+            canonicalizer: 홈페이지 키 계산에 쓸 정규화기
+            clock: 현재 시각(초) 함수 (테스트 주입용)
+            flush_every: 이만큼 변경이 쌓이면 파일에 저장
+            flush_interval_seconds: 마지막 저장 후 이 시간이 지난 변경은 바로 저장
+        """
+        if flush_every <= 0:
+            raise ValueError("flush_every는 1 이상이어야 합니다.")
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.empty_ttl_seconds = empty_ttl_seconds
+        self.canonicalizer = canonicalizer or get_default_canonicalizer()
+        self._clock = clock
+        self.flush_every = flush_every
+        self.flush_interval_seconds = flush_interval_seconds
+        self._lock = threading.Lock()
+        # 마지막 저장 이후 변경 수 / 저장 시각
+        self._dirty = 0
+        self._flushed_at = clock()
+        # {homepage_key: {strategy_key: {"urls": [...], "stored_at": float}}}
+        self._entries: Dict[str, Dict[str, Dict[str, object]]] = {}
+        # {homepage_key: {"url": 최종 URL, "stored_at": float}}
+        self._origins: Dict[str, Dict[str, object]] = {}
+        if self.path is not None:
+            self._load()
+
+    def __enter__(self) -> "DiscoveryCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(strategies) for strategies in self._entries.values())
+
+    def homepage_key(self, homepage_url: str) -> str:
+        return self.canonicalizer.dedupe_key(homepage_url, resolve_aliases=False)
+
+    def get(self, homepage_url: str, strategy_key: str) -> Optional[Set[str]]:
+        """유효한 캐시 결과 (없거나 만료되면 None)."""
+        key = self.homepage_key(homepage_url)
+        with self._lock:
+            entry = self._entries.get(key, {}).get(strategy_key)
+            if entry is None:
+                return None
+            urls = entry["urls"]
+            ttl = self.ttl_seconds if urls else self.empty_ttl_seconds
+            if self._clock() - float(entry["stored_at"]) > ttl:
+                del self._entries[key][strategy_key]
+                return None
+            return set(urls)
+
+    def put(self, homepage_url: str, strategy_key: str, urls: Set[str]) -> None:
+        key = self.homepage_key(homepage_url)
+        with self._lock:
+            self._entries.setdefault(key, {})[strategy_key] = {
+                "urls": sorted(urls),
+                "stored_at": self._clock(),
+            }
+            self._mark_dirty_locked()
+
+    def record_origin(self, homepage_url: str, effective_url: str) -> None:
+        """홈페이지의 redirect 최종 URL을 기록합니다."""
+        key = self.homepage_key(homepage_url)
+        with self._lock:
+            current = self._origins.get(key)
+            if current is not None and current["url"] == effective_url:
+                return
+            self._origins[key] = {"url": effective_url, "stored_at": self._clock()}
+            self._mark_dirty_locked()
+
+    def origin_for(self, homepage_url: str) -> Optional[str]:
+        """기록된 redirect 최종 URL (없거나 만료되면 None)."""
+        key = self.homepage_key(homepage_url)
+        with self._lock:
+            origin = self._origins.get(key)
+            if origin is None:
+                return None
+            if self._clock() - float(origin["stored_at"]) > self.ttl_seconds:
+                del self._origins[key]
+                return None
+            return str(origin["url"])
+
+    def invalidate(self, homepage_url: Optional[str] = None) -> int:
+        """
+        학교 하나(또는 전체)의 캐시를 지웁니다.
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            if homepage_url is None:
+                removed = sum(len(strategies) for strategies in self._entries.values())
+                changed = bool(removed or self._origins)
+                self._entries.clear()
+                self._origins.clear()
+            else:
+                key = self.homepage_key(homepage_url)
+                removed = len(self._entries.pop(key, {}))
+                changed = bool(removed) | (self._origins.pop(key, None) is not None)
+            if changed:
+                self._save_locked()
+            return removed
+
+    def flush(self) -> None:
+        """쌓인 변경을 파일에 저장합니다 (변경이 없으면 아무것도 하지 않음)."""
+        with self._lock:
+            if self._dirty:
+                self._save_locked()
+
+    def close(self) -> None:
+        self.flush()
+
+    def _mark_dirty_locked(self) -> None:
+        self._dirty += 1
+        if self._dirty >= self.flush_every or self._clock() - self._flushed_at >= self.flush_interval_seconds:
+            self._save_locked()
+
+    def _load(self) -> None:
+        assert self.path is not None
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("탐색 캐시를 읽을 수 없어 비어 있는 상태로 시작합니다: %s", exc)
+            return
+        if data.get("version") != _CACHE_VERSION:
+            return
+        self._entries = data.get("entries") or {}
+        self._origins = data.get("origins") or {}
+
+    def _save_locked(self) -> None:
+        self._dirty = 0
+        self._flushed_at = self._clock()
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"version": _CACHE_VERSION, "entries": self._entries, "origins": self._origins},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
@@ -1,6 +1,8 @@
 """
 GraphRAG Step 0 Entity Resolution.
 
+alias 사전은 `data/entity_aliases.json`에서 로드되며 `src.services.alias_index` 참고.
+
 참고 자료:
 - https://github.com/langchain-ai/langchain
 - https://github.com/microsoft/graphrag
@@ -8,27 +10,20 @@ GraphRAG Step 0 Entity Resolution.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
-from difflib import get_close_matches
 from typing import Iterable
 
+from src.services.alias_index import (
+    AliasIndex,
+    AliasIndexRegistry,
+    clean_entity_name,
+    get_default_alias_registry,
+    normalize_key,
+)
 from src.services.prompt_templates import Triple
 
 
-_SPECIAL_RE = re.compile(r"[^a-zA-Z0-9\s,&\-]")
-_SPACE_RE = re.compile(r"\s+")
-
-
-def _norm_key(value: str) -> str:
-    lowered = value.lower().strip()
-    lowered = lowered.replace(".", "").replace("-", " ")
-    lowered = _SPECIAL_RE.sub("", lowered)
-    lowered = _SPACE_RE.sub(" ", lowered).strip()
-    return lowered
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedTriple:
     """정규화가 적용된 Triple."""
 
@@ -51,72 +46,45 @@ class EntityResolver:
         "PARTNERS_WITH",
     }
 
-    CANONICAL_ALIASES: dict[str, list[str]] = {
-        "Machine Learning": ["ML", "machine learning", "machine-learning", "machinelearning"],
-        "Deep Learning": ["DL", "deep learning", "deep-learning"],
-        "Computer Science": ["CS", "CompSci", "Computer Sci", "Comp Sci"],
-        "Data Science": ["DS", "DataSci", "Data Sci"],
-        "Cloud Computing": ["Cloud", "Cloud Comp", "cloud computing"],
-        "Software Engineering": ["SE", "Software Eng", "Software Engineer Program"],
-        "Artificial Intelligence": ["AI", "A.I.", "artificial intelligence"],
-        "Data Scientist": ["data scientist", "data-scientist"],
-        "AI Engineer": ["ai engineer", "ai-engineer"],
-        "Software Engineer": ["software engineer", "swe"],
-        "Product Manager": ["PM", "product manager"],
-        "Google": ["Google Inc", "Google LLC", "Alphabet", "Google, Inc."],
-        "Microsoft": ["MSFT", "Microsoft Corp", "Microsoft Corporation"],
-        "Amazon": ["Amazon.com", "AWS", "Amazon Inc"],
-        "Meta": ["Facebook", "Meta Platforms", "Meta Inc"],
-        "Apple": ["Apple Inc", "Apple Computer"],
-        "Tesla": ["Tesla Inc", "Tesla Motors"],
-        "Stanford University": ["Stanford", "Stanford Univ", "SU"],
-        "Massachusetts Institute of Technology": ["MIT", "M.I.T."],
-        "Carnegie Mellon University": ["CMU", "Carnegie Mellon"],
-        "University of California, Berkeley": ["UC Berkeley", "Berkeley", "UCB"],
-        "University of California, Los Angeles": ["UCLA", "UC Los Angeles"],
-        "University of Southern California": ["USC", "Southern California University"],
-        "New York University": ["NYU"],
-        "San Jose State University": ["SJSU", "San Jose State"],
-        "Santa Monica College": ["SMC", "Santa Monica CC"],
-        "California": ["CA", "Calif."],
-        "New York": ["NY", "N.Y."],
-        "Massachusetts": ["MA", "Mass."],
-        "Washington": ["WA", "Wash."],
-        "Palo Alto, California": ["Palo Alto CA"],
-        "Seattle, Washington": ["Seattle WA"],
-    }
+    def __init__(self, alias_registry: AliasIndexRegistry | None = None) -> None:
+        # alias 색인은 프로세스 전역으로 공유되므로 인스턴스 생성 비용이 없습니다.
+        self._registry = alias_registry or get_default_alias_registry()
 
-    def __init__(self) -> None:
-        self._alias_to_canonical: dict[str, str] = {}
-        all_keys: list[str] = []
-        for canonical, aliases in self.CANONICAL_ALIASES.items():
-            key = _norm_key(canonical)
-            self._alias_to_canonical[key] = canonical
-            all_keys.append(key)
-            for alias in aliases:
-                alias_key = _norm_key(alias)
-                self._alias_to_canonical[alias_key] = canonical
-                all_keys.append(alias_key)
-        self._known_keys = sorted(set(all_keys))
+    @property
+    def alias_index(self) -> AliasIndex:
+        return self._registry.current()
 
     def normalize(self, entity_name: str, entity_type: str = "Unknown") -> str:
         """엔티티 이름을 canonical 표기로 정규화합니다."""
         raw = (entity_name or "").strip()
         if not raw:
             return ""
-        key = _norm_key(raw)
-        if key in self._alias_to_canonical:
-            return self._alias_to_canonical[key]
+        index = self._registry.current()
+        title_case = entity_type.lower() in {"skill", "program", "job"}
+        memo_key = (raw, title_case)
+        cached = index.memo.get(memo_key)
+        if cached is not None:
+            return cached
 
-        # 향후 고도화를 위한 경량 fuzzy matching.
-        near = get_close_matches(key, self._known_keys, n=1, cutoff=0.93)
+        resolved = self._resolve(index, raw, title_case)
+        index.memo.put(memo_key, resolved)
+        return resolved
+
+    @staticmethod
+    def _resolve(index: AliasIndex, raw: str, title_case: bool) -> str:
+        key = normalize_key(raw)
+        canonical = index.alias_to_canonical.get(key)
+        if canonical is not None:
+            return canonical
+
+        # trigram 색인으로 후보를 좁힌 뒤 동일한 cutoff로 fuzzy matching.
+        near = index.fuzzy.best_match(key)
         if near:
-            return self._alias_to_canonical[near[0]]
+            return index.alias_to_canonical[near]
 
         # fallback: 특수문자 제거 + Title Case
-        cleaned = _SPECIAL_RE.sub(" ", raw)
-        cleaned = _SPACE_RE.sub(" ", cleaned).strip()
-        if entity_type.lower() in {"skill", "program", "job"}:
+        cleaned = clean_entity_name(raw)
+        if title_case:
             return cleaned.title()
         return cleaned
 
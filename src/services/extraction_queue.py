@@ -0,0 +1,245 @@
+"""
+크롤링 ↔ LLM Triple 추출 분리를 위한 SQLite 기반 지연 추출 큐.
+
+크롤러는 (school, url, content-hash, html) 작업 항목을 큐에 적재만 하고, 별도의
+추출 워커 풀이 모델 rate limit 속도에 맞춰 큐를 소비합니다. 큐와 추출 결과가 모두
+로컬 SQLite(WAL)에 남기 때문에 어느 단계가 재시작되어도 페이지를 다시 받지 않습니다.
+
+참고 자료:
+- https://www.sqlite.org/wal.html
+- https://www.sqlite.org/lang_transaction.html (BEGIN IMMEDIATE)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    school_name TEXT NOT NULL,
+    website TEXT,
+    source_url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    html BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    claimed_at REAL,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    error TEXT,
+    triples_json TEXT,
+    usage_json TEXT,
+    UNIQUE (source_url, content_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_items_status ON extraction_items (status, id);
+CREATE INDEX IF NOT EXISTS idx_extraction_items_school ON extraction_items (school_name);
+"""
+
+
+def content_hash(html: str) -> str:
+    """페이지 본문의 SHA-256 해시 (동일 내용 재추출 방지용)."""
+    return hashlib.sha256(html.encode("utf-8", errors="replace")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExtractionWorkItem:
+    """추출 워커가 claim한 작업 항목."""
+
+    id: int
+    school_name: str
+    website: str | None
+    source_url: str
+    content_hash: str
+    html: str
+    attempts: int
+
+
+class ExtractionQueue:
+    """SQLite WAL 기반의 durable 작업 큐 (프로세스/스레드 간 공유 가능)."""
+
+    def __init__(self, db_path: Path | str = Path("data/extraction_queue.sqlite3")) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30,
+            isolation_level=None,  # 트랜잭션은 BEGIN IMMEDIATE로 직접 제어합니다.
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(
+        self,
+        school_name: str,
+        source_url: str,
+        html: str,
+        *,
+        website: str | None = None,
+    ) -> bool:
+        """
+        페이지를 추출 대기열에 적재합니다.
+
+        Returns:
+            새로 적재되면 True, 같은 URL/내용이 이미 있으면 False
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO extraction_items (
+                    school_name, website, source_url, content_hash, html,
+                    status, enqueued_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    school_name,
+                    website,
+                    source_url,
+                    content_hash(html),
+                    zlib.compress(html.encode("utf-8", errors="replace")),
+                    STATUS_PENDING,
+                    now,
+                    now,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def claim(self, worker_id: str, limit: int = 1) -> List[ExtractionWorkItem]:
+        """대기 항목을 원자적으로 processing 상태로 바꾸고 반환합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT * FROM extraction_items WHERE status = ? ORDER BY id LIMIT ?",
+                    (STATUS_PENDING, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    """
+                    UPDATE extraction_items
+                    SET status = ?, worker_id = ?, claimed_at = ?, updated_at = ?, attempts = attempts + 1
+                    WHERE id = ?
+                    """,
+                    [(STATUS_PROCESSING, worker_id, now, now, row["id"]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return [
+            ExtractionWorkItem(
+                id=row["id"],
+                school_name=row["school_name"],
+                website=row["website"],
+                source_url=row["source_url"],
+                content_hash=row["content_hash"],
+                html=zlib.decompress(row["html"]).decode("utf-8"),
+                attempts=row["attempts"] + 1,
+            )
+            for row in rows
+        ]
+
+    def complete(
+        self,
+        item_id: int,
+        triples: List[Dict[str, Any]],
+        usage: Dict[str, Any] | None = None,
+    ) -> None:
+        """추출 결과를 저장하고 done 처리합니다."""
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE extraction_items
+                SET status = ?, triples_json = ?, usage_json = ?, error = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    STATUS_DONE,
+                    json.dumps(triples, ensure_ascii=False),
+                    json.dumps(usage or {}, ensure_ascii=False),
+                    time.time(),
+                    item_id,
+                ),
+            )
+
+    def fail(self, item_id: int, error: str, *, max_attempts: int = 3) -> None:
+        """실패 항목을 재시도 대기열로 돌리거나, 시도 한도를 넘기면 failed 처리합니다."""
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE extraction_items
+                SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,
+                    error = ?, worker_id = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (max_attempts, STATUS_FAILED, STATUS_PENDING, error[:1000], time.time(), item_id),
+            )
+
+    def requeue_stale(self, older_than_seconds: float = 600.0) -> int:
+        """워커가 죽어 processing에 남은 항목을 pending으로 되돌립니다."""
+        cutoff = time.time() - older_than_seconds
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE extraction_items
+                SET status = ?, worker_id = NULL, updated_at = ?
+                WHERE status = ? AND claimed_at < ?
+                """,
+                (STATUS_PENDING, time.time(), STATUS_PROCESSING, cutoff),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 항목 수."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS cnt FROM extraction_items GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in (STATUS_PENDING, STATUS_PROCESSING, STATUS_DONE, STATUS_FAILED)}
+        counts.update({row["status"]: row["cnt"] for row in rows})
+        return counts
+
+    def iter_results(self) -> Iterator[Dict[str, Any]]:
+        """done 항목의 추출 결과를 학교/ID 순으로 반환합니다 (html 제외)."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT school_name, website, source_url, triples_json, usage_json
+                FROM extraction_items
+                WHERE status = ?
+                ORDER BY school_name, id
+                """,
+                (STATUS_DONE,),
+            ).fetchall()
+        for row in rows:
+            yield {
+                "school_name": row["school_name"],
+                "website": row["website"],
+                "source_url": row["source_url"],
+                "entries": json.loads(row["triples_json"] or "[]"),
+                "usage": json.loads(row["usage_json"] or "{}"),
+            }
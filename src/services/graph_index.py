@@ -0,0 +1,377 @@
+"""
+Knowledge Triple용 in-memory 그래프 색인.
+
+엔티티 이름은 `StringInterner`로 정수 id에 매핑하고, relation마다 정방향/역방향
+CSR(Compressed Sparse Row) 인접 배열(`array('I')` offsets/targets + `array('f')`
+confidence)을 만듭니다. 이웃 조회는 offsets 두 값을 읽고 연속 구간을 훑는 것이
+전부이므로 1~2 hop 탐색, 경로 탐색, 필터 질의를 SQL join 없이 마이크로초 단위로
+처리할 수 있습니다.
+
+예: "CA 소재 학교의 프로그램 중 Data Scientist로 이어지는 것"
+    schools = index.traverse(["California"], [("LOCATED_IN", "in")])
+    programs = index.traverse(schools, [("OFFERS", "out")])
+    result = programs & index.traverse(["Data Scientist"], [("LEADS_TO", "in")])
+
+색인은 JSONL(수집기 출력/학교별 병합 출력) 또는 DB에서 한 번의 스트리밍 패스로 빌드합니다.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.services.entity_resolution import EntityResolver, NormalizedTriple
+from src.services.interner import StringInterner
+
+if TYPE_CHECKING:
+    from src.services.triple_batch import TripleBatch
+
+FALLBACK_RELATION = "RELATED_TO"
+RELATIONS: Tuple[str, ...] = tuple(sorted(EntityResolver.RELATIONS)) + (FALLBACK_RELATION,)
+DIRECTIONS = ("out", "in", "both")
+
+Step = Tuple[str, str]
+
+
+def _relation_name(relation: str) -> str:
+    """`EntityResolver.normalize_relation`과 같은 규칙으로 relation을 정규화합니다."""
+    normalized = (relation or "").strip().upper().replace("-", "_").replace(" ", "_")
+    return normalized if normalized in EntityResolver.RELATIONS else FALLBACK_RELATION
+
+
+@dataclass(frozen=True)
+class _Adjacency:
+    """한 relation/방향의 CSR 인접 배열."""
+
+    offsets: array
+    targets: array
+    confidence: array
+
+    def edges(self, node: int) -> Iterator[Tuple[int, float]]:
+        start, end = self.offsets[node], self.offsets[node + 1]
+        targets, confidence = self.targets, self.confidence
+        for position in range(start, end):
+            yield targets[position], confidence[position]
+
+
+def _build_adjacency(edges: List[Tuple[int, int, float]], node_count: int) -> _Adjacency:
+    """(source, target, confidence) 목록을 source 기준 CSR로 만듭니다."""
+    edges.sort()
+    offsets = array("I", bytes(4 * (node_count + 1)))
+    for source, _, _ in edges:
+        offsets[source + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+    return _Adjacency(
+        offsets=offsets,
+        targets=array("I", (target for _, target, _ in edges)),
+        confidence=array("f", (value for _, _, value in edges)),
+    )
+
+
+class GraphIndexBuilder:
+    """Triple을 스트리밍으로 받아 `GraphIndex`를 만듭니다 (중복 간선은 max confidence)."""
+
+    def __init__(self, interner: Optional[StringInterner] = None) -> None:
+        self.entities = interner if interner is not None else StringInterner()
+        self._relation_ids = {name: index for index, name in enumerate(RELATIONS)}
+        self._edges: Dict[Tuple[int, int, int], float] = {}
+
+    def add(self, head: str, relation: str, tail: str, confidence: float = 1.0) -> None:
+        head, tail = (head or "").strip(), (tail or "").strip()
+        if not head or not tail:
+            return
+        key = (
+            self._relation_ids[_relation_name(relation)],
+            self.entities.intern(head),
+            self.entities.intern(tail),
+        )
+        confidence = float(confidence)
+        if confidence > self._edges.get(key, -1.0):
+            self._edges[key] = confidence
+
+    def add_triple(self, triple: NormalizedTriple) -> None:
+        self.add(triple.head, triple.relation, triple.tail, triple.confidence)
+
+    def add_batch(self, batch: "TripleBatch") -> None:
+        """`TripleBatch`를 추가합니다 (같은 interner를 공유하면 엔티티 id를 그대로 재사용)."""
+        if batch.interner is not self.entities:
+            for triple in batch:
+                self.add_triple(triple)
+            return
+        lookup = batch.relation_interner.lookup
+        relation_ids: Dict[int, int] = {}
+        for head_id, relation, tail_id, confidence in zip(
+            batch.heads, batch.relations, batch.tails, batch.confidence
+        ):
+            relation_id = relation_ids.get(relation)
+            if relation_id is None:
+                relation_id = relation_ids[relation] = self._relation_ids[_relation_name(lookup(relation))]
+            key = (relation_id, head_id, tail_id)
+            if confidence > self._edges.get(key, -1.0):
+                self._edges[key] = confidence
+
+    def add_record(self, record: Dict[str, Any]) -> None:
+        """JSONL 한 줄을 추가합니다 (수집기 리포트와 학교별 병합 출력 모두 지원)."""
+        for item in record.get("triples") or []:
+            if "entries" in item:
+                for entry in item.get("entries") or []:
+                    self.add(entry.get("head"), entry.get("relation"), entry.get("tail"), entry.get("confidence", 0.8))
+            else:
+                self.add(item.get("head"), item.get("relation"), item.get("tail"), item.get("confidence", 0.8))
+
+    def build(self) -> "GraphIndex":
+        node_count = len(self.entities)
+        forward: List[List[Tuple[int, int, float]]] = [[] for _ in RELATIONS]
+        backward: List[List[Tuple[int, int, float]]] = [[] for _ in RELATIONS]
+        for (relation_id, head_id, tail_id), confidence in self._edges.items():
+            forward[relation_id].append((head_id, tail_id, confidence))
+            backward[relation_id].append((tail_id, head_id, confidence))
+        return GraphIndex(
+            entities=self.entities,
+            out_edges=[_build_adjacency(edges, node_count) for edges in forward],
+            in_edges=[_build_adjacency(edges, node_count) for edges in backward],
+            edge_count=len(self._edges),
+        )
+
+
+class GraphIndex:
+    """relation별 CSR 배열 위에서 동작하는 읽기 전용 그래프 색인."""
+
+    def __init__(
+        self,
+        *,
+        entities: StringInterner,
+        out_edges: List[_Adjacency],
+        in_edges: List[_Adjacency],
+        edge_count: int,
+    ) -> None:
+        self.entities = entities
+        self._out = out_edges
+        self._in = in_edges
+        self._node_count = len(out_edges[0].offsets) - 1 if out_edges else 0
+        self.edge_count = edge_count
+
+    def __len__(self) -> int:
+        return self.edge_count
+
+    @property
+    def entity_count(self) -> int:
+        return self._node_count
+
+    def _node(self, entity: str) -> Optional[int]:
+        """엔티티 id (없거나 빌드 이후 공유 interner에 새로 등록된 이름이면 None)."""
+        node = self.entities.get(entity)
+        return node if node is not None and node < self._node_count else None
+
+    # ------------------------------------------------------------------ loaders
+    @classmethod
+    def from_triples(cls, triples: Iterable[NormalizedTriple]) -> "GraphIndex":
+        builder = GraphIndexBuilder()
+        for triple in triples:
+            builder.add_triple(triple)
+        return builder.build()
+
+    @classmethod
+    def from_jsonl(cls, path: Path | str) -> "GraphIndex":
+        """`auto_triples.jsonl` 또는 `school_triples.jsonl`을 한 줄씩 읽어 빌드합니다."""
+        builder = GraphIndexBuilder()
+        with Path(path).open("r", encoding="utf-8") as fp:
+            for line in fp:
+                line = line.strip()
+                if line:
+                    builder.add_record(json.loads(line))
+        return builder.build()
+
+    @classmethod
+    def from_db(cls, conn: Any, *, batch_size: int = 10000) -> "GraphIndex":
+        """knowledge_triples를 서버 측 커서로 스트리밍하여 빌드합니다 (psycopg2 connection)."""
+        builder = GraphIndexBuilder()
+        with conn.cursor(name="graph_index_stream") as cur:
+            cur.itersize = batch_size
+            cur.execute(
+                """
+                SELECT head_entity_name, relation_type, tail_entity_name, confidence_score
+                FROM knowledge_triples
+                """
+            )
+            for head, relation, tail, confidence in cur:
+                builder.add(head, relation, tail, confidence if confidence is not None else 1.0)
+        return builder.build()
+
+    # ------------------------------------------------------------------ queries
+    def _relation_ids(self, relations: Optional[Iterable[str]]) -> List[int]:
+        if relations is None:
+            return list(range(len(RELATIONS)))
+        wanted = {_relation_name(relation) for relation in relations}
+        return [index for index, name in enumerate(RELATIONS) if name in wanted]
+
+    def _adjacent(
+        self,
+        node: int,
+        relation_ids: Sequence[int],
+        direction: str,
+        min_confidence: float,
+    ) -> Iterator[Tuple[int, int, float, bool]]:
+        """(이웃 id, relation id, confidence, 정방향 여부)를 yield 합니다."""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction은 {DIRECTIONS} 중 하나여야 합니다: {direction}")
+        for relation_id in relation_ids:
+            if direction in ("out", "both"):
+                for target, confidence in self._out[relation_id].edges(node):
+                    if confidence >= min_confidence:
+                        yield target, relation_id, confidence, True
+            if direction in ("in", "both"):
+                for source, confidence in self._in[relation_id].edges(node):
+                    if confidence >= min_confidence:
+                        yield source, relation_id, confidence, False
+
+    def neighbors(
+        self,
+        entity: str,
+        relation: Optional[str] = None,
+        *,
+        direction: str = "out",
+        min_confidence: float = 0.0,
+    ) -> List[Tuple[str, str, float]]:
+        """1-hop 이웃을 (이웃 이름, relation, confidence) 목록으로 반환합니다."""
+        node = self._node(entity)
+        if node is None:
+            return []
+        relation_ids = self._relation_ids(None if relation is None else [relation])
+        return [
+            (self.entities.lookup(other), RELATIONS[relation_id], confidence)
+            for other, relation_id, confidence, _ in self._adjacent(node, relation_ids, direction, min_confidence)
+        ]
+
+    def neighborhood(
+        self,
+        entity: str,
+        hops: int = 2,
+        *,
+        relations: Optional[Iterable[str]] = None,
+        direction: str = "both",
+        min_confidence: float = 0.0,
+    ) -> Dict[str, int]:
+        """`hops` 이내에 도달 가능한 엔티티 → 최단 hop 수 (시작 엔티티 제외)."""
+        start = self._node(entity)
+        if start is None:
+            return {}
+        relation_ids = self._relation_ids(relations)
+        distance = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if distance[node] >= hops:
+                continue
+            for other, _, _, _ in self._adjacent(node, relation_ids, direction, min_confidence):
+                if other not in distance:
+                    distance[other] = distance[node] + 1
+                    queue.append(other)
+        del distance[start]
+        return {self.entities.lookup(node): hop for node, hop in distance.items()}
+
+    def traverse(
+        self,
+        starts: Iterable[str],
+        steps: Sequence[Step],
+        *,
+        min_confidence: float = 0.0,
+    ) -> Set[str]:
+        """
+        시작 엔티티 집합에서 (relation, direction) 단계를 차례로 따라간 최종 엔티티 집합.
+
+        예: `traverse(["Data Scientist"], [("LEADS_TO", "in"), ("OFFERS", "in")])`
+            → Data Scientist로 이어지는 프로그램을 제공하는 학교들
+        """
+        frontier = {node for node in map(self._node, starts) if node is not None}
+        for relation, direction in steps:
+            relation_ids = self._relation_ids([relation])
+            frontier = {
+                other
+                for node in frontier
+                for other, _, _, _ in self._adjacent(node, relation_ids, direction, min_confidence)
+            }
+            if not frontier:
+                break
+        return {self.entities.lookup(node) for node in frontier}
+
+    def find_paths(
+        self,
+        source: str,
+        target: str,
+        *,
+        max_hops: int = 3,
+        relations: Optional[Iterable[str]] = None,
+        min_confidence: float = 0.0,
+        limit: int = 100,
+    ) -> List[List[NormalizedTriple]]:
+        """
+        source와 target을 잇는 단순 경로(간선 방향 무시)를 짧은 것부터 최대 `limit`개 반환합니다.
+
+        각 경로는 원래 방향을 유지한 `NormalizedTriple` 목록입니다.
+        """
+        start, goal = self._node(source), self._node(target)
+        if start is None or goal is None or start == goal:
+            return []
+        relation_ids = self._relation_ids(relations)
+        paths: List[List[NormalizedTriple]] = []
+        queue: deque[Tuple[int, Tuple[int, ...], Tuple[NormalizedTriple, ...]]] = deque([(start, (start,), ())])
+        while queue and len(paths) < limit:
+            node, visited, edges = queue.popleft()
+            if len(edges) >= max_hops:
+                continue
+            for other, relation_id, confidence, forward in self._adjacent(
+                node, relation_ids, "both", min_confidence
+            ):
+                if other in visited:
+                    continue
+                head, tail = (node, other) if forward else (other, node)
+                edge = NormalizedTriple(
+                    head=self.entities.lookup(head),
+                    relation=RELATIONS[relation_id],
+                    tail=self.entities.lookup(tail),
+                    confidence=confidence,
+                )
+                if other == goal:
+                    paths.append([*edges, edge])
+                    if len(paths) >= limit:
+                        break
+                else:
+                    queue.append((other, visited + (other,), edges + (edge,)))
+        return paths
+
+    def filter_triples(
+        self,
+        relation: Optional[str] = None,
+        *,
+        head: Optional[str] = None,
+        tail: Optional[str] = None,
+        min_confidence: float = 0.0,
+    ) -> Iterator[NormalizedTriple]:
+        """relation/head/tail/confidence 조건에 맞는 Triple을 yield 합니다."""
+        relation_ids = self._relation_ids(None if relation is None else [relation])
+        if head is not None:
+            node = self._node(head)
+            heads: Iterable[int] = () if node is None else (node,)
+        else:
+            heads = range(self._node_count)
+        tail_id = self._node(tail) if tail is not None else None
+        if tail is not None and tail_id is None:
+            return
+        for relation_id in relation_ids:
+            adjacency = self._out[relation_id]
+            for head_id in heads:
+                for target, confidence in adjacency.edges(head_id):
+                    if confidence < min_confidence or (tail_id is not None and target != tail_id):
+                        continue
+                    yield NormalizedTriple(
+                        head=self.entities.lookup(head_id),
+                        relation=RELATIONS[relation_id],
+                        tail=self.entities.lookup(target),
+                        confidence=confidence,
+                    )
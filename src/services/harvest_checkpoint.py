@@ -0,0 +1,175 @@
+"""
+AutoTripleCollector 수집 체크포인트.
+
+학교 하나의 리포트를 출력 JSONL에 기록(flush)한 직후, 그 학교를 append-only 체크포인트
+파일에 기록합니다. 중단 후 재시작하면 체크포인트에 있는 학교는 건너뛰고 출력 파일에
+이어 씁니다.
+
+체크포인트 첫 줄은 수집 조건(`{"run_params": {"schools_file", "schools_sha256", "limit"}}`)이며,
+학교 목록 파일이나 limit이 바뀐 실행은 이 체크포인트를 자동으로 이어 받지 않습니다.
+
+체크포인트 항목(1줄):
+    {"school_name", "website", "content_hashes": {url: sha256}, "report_sha256",
+     "triples", "has_triples", "queued", "usage", "completed_at"}
+
+`content_hashes`는 학교에서 가져온 페이지별 본문 해시(`extraction_queue.content_hash`)로,
+재개하거나 다시 수집할 때 페이지 내용이 바뀌었는지 비교하는 데 씁니다.
+
+건너뛴(skipped) 학교는 일시적 장애일 수 있으므로 재개 시 다시 수집합니다.
+출력 파일에는 기록됐지만 체크포인트 기록 전에 죽은 학교의 줄(또는 반쯤 쓰인 줄)은
+`repair_output()`이 report_sha256와 대조해 제거하므로, 재개 후에도 학교당 한 줄이 유지됩니다.
+수집 전체가 끝나면 `{"run_completed": true}` 표시를 남겨, 다음 실행이 자동으로 이어 받지 않게 합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def report_line(report: Dict[str, Any]) -> str:
+    """출력 JSONL과 체크포인트 해시가 같은 직렬화를 쓰도록 한 곳에서 만듭니다."""
+    return json.dumps(report, ensure_ascii=False)
+
+
+def line_sha256(line: str) -> str:
+    return hashlib.sha256(line.encode("utf-8")).hexdigest()
+
+
+class HarvestCheckpoint:
+    """완료된 학교 목록을 append-only JSONL로 관리합니다."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.run_completed = False
+        self.run_params: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def for_output(cls, output_path: Path | str) -> "HarvestCheckpoint":
+        output_path = Path(output_path)
+        return cls(output_path.with_name(output_path.name + ".checkpoint.jsonl"))
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> "HarvestCheckpoint":
+        """체크포인트를 읽습니다 (마지막 줄이 깨져 있으면 무시)."""
+        self.completed = {}
+        self.run_completed = False
+        self.run_params = None
+        if not self.path.exists():
+            return self
+        with self.path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "run_params" in entry:
+                    self.run_params = entry["run_params"]
+                elif entry.get("run_completed"):
+                    self.run_completed = True
+                elif entry.get("school_name"):
+                    self.completed[entry["school_name"]] = entry
+        return self
+
+    def reset(self, run_params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        새 수집을 시작합니다 (기존 체크포인트 삭제).
+
+        Args:
+            run_params: 이 수집의 조건 (재개 시 `matches()`로 비교)
+        """
+        self.completed = {}
+        self.run_completed = False
+        self.run_params = run_params
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+        if run_params is not None:
+            self._append({"run_params": run_params})
+
+    def matches(self, run_params: Dict[str, Any]) -> bool:
+        """체크포인트가 같은 조건(학교 목록 파일/내용/limit)의 수집인지."""
+        return self.run_params == run_params
+
+    def is_done(self, school_name: Optional[str]) -> bool:
+        """완료된 학교인지 (홈페이지 무응답/예외로 건너뛴 학교는 재개 시 다시 시도)."""
+        entry = self.completed.get(school_name) if school_name else None
+        return entry is not None and not entry.get("skipped")
+
+    def record(
+        self,
+        report: Dict[str, Any],
+        *,
+        line: str,
+        content_hashes: Dict[str, str],
+    ) -> None:
+        """출력 파일에 `line`을 기록한 뒤 호출합니다."""
+        triples = sum(page.get("count", 0) for page in report.get("triples") or [])
+        entry = {
+            "school_name": report.get("school_name"),
+            "website": report.get("website"),
+            "content_hashes": content_hashes,
+            "report_sha256": line_sha256(line),
+            "skipped": bool(report.get("routing", {}).get("skipped")),
+            "triples": triples,
+            "has_triples": bool(report.get("triples")),
+            "queued": len(report.get("queued_urls", [])),
+            "usage": report.get("usage") or {},
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._append(entry)
+        if entry["school_name"]:
+            self.completed[entry["school_name"]] = entry
+
+    def mark_run_completed(self) -> None:
+        self._append({"run_completed": True, "completed_at": datetime.now(timezone.utc).isoformat()})
+        self.run_completed = True
+
+    def repair_output(self, output_path: Path) -> int:
+        """
+        출력 파일에서 체크포인트에 기록된 줄만 남깁니다.
+
+        Returns:
+            제거한 줄 수 (중단 직전에 쓰였지만 체크포인트에 없는 줄, 반쯤 쓰인 줄)
+        """
+        if not output_path.exists():
+            return 0
+        valid_hashes = {
+            entry.get("report_sha256") for name, entry in self.completed.items() if self.is_done(name)
+        }
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        removed = 0
+        with output_path.open("r", encoding="utf-8") as src, tmp_path.open("w", encoding="utf-8") as dst:
+            for raw in src:
+                line = raw.rstrip("\n")
+                if raw.endswith("\n") and line_sha256(line) in valid_hashes:
+                    dst.write(raw)
+                elif line:
+                    removed += 1
+        os.replace(tmp_path, output_path)
+        if removed:
+            logger.info("체크포인트에 없는 출력 %d줄을 정리했습니다: %s", removed, output_path)
+        return removed
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+b") as fp:
+            # 이전 실행이 줄 중간에 중단됐으면 새 항목이 깨진 줄에 붙지 않도록 개행부터 씁니다.
+            if fp.tell() > 0:
+                fp.seek(-1, os.SEEK_END)
+                if fp.read(1) != b"\n":
+                    fp.write(b"\n")
+            fp.write(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+            fp.write(b"\n")
+            fp.flush()
+            os.fsync(fp.fileno())
@@ -0,0 +1,51 @@
+"""
+문자열 ↔ 정수 id interning 테이블.
+
+엔티티 이름/relation처럼 수천 번 반복되는 문자열을 한 번만 보관하고, 그래프 색인과
+Triple 배치는 이 테이블이 부여한 연속 정수 id만 저장합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable, Iterator
+
+
+class StringInterner:
+    """삽입 순서대로 0부터 id를 부여하는 thread-safe interning 테이블."""
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self._ids: dict[str, int] = {}
+        self._values: list[str] = []
+        self._lock = threading.Lock()
+        for value in values:
+            self.intern(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._ids
+
+    def intern(self, value: str) -> int:
+        """문자열의 id를 반환합니다 (처음 보는 값이면 새 id를 부여)."""
+        found = self._ids.get(value)
+        if found is not None:
+            return found
+        with self._lock:
+            found = self._ids.get(value)
+            if found is None:
+                found = len(self._values)
+                self._values.append(value)
+                self._ids[value] = found
+            return found
+
+    def get(self, value: str) -> int | None:
+        """등록된 문자열의 id (없으면 None, 새로 등록하지 않음)."""
+        return self._ids.get(value)
+
+    def lookup(self, value_id: int) -> str:
+        return self._values[value_id]
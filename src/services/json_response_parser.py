@@ -0,0 +1,73 @@
+"""
+LLM JSON 응답용 관대한(tolerant) 파서.
+
+모델 응답은 코드 펜스, 앞뒤 설명 문장, max_output_tokens로 잘린 꼬리 등으로
+`json.loads` 한 번에 통과하지 못하는 경우가 많습니다. 이 모듈은 전체 파싱이 실패해도
+완결된 Triple 객체만 골라내어, 청크 하나의 결과 전체를 버리는 일을 막습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator
+
+_FENCE_OPEN_RE = re.compile(r"```[a-zA-Z]*\s*")
+_DECODER = json.JSONDecoder()
+
+
+def strip_code_fence(text: str) -> str:
+    """```json ... ``` 코드 펜스와 앞쪽 설명 문장을 제거합니다 (닫는 펜스가 없어도 동작)."""
+    cleaned = (text or "").strip()
+    match = _FENCE_OPEN_RE.search(cleaned)
+    if not match:
+        return cleaned
+    body = cleaned[match.end():]
+    closing = body.rfind("```")
+    if closing != -1:
+        body = body[:closing]
+    return body.strip()
+
+
+def iter_json_objects(text: str, item_key: str = "triples") -> Iterator[dict[str, Any]]:
+    """
+    응답 텍스트에서 `item_key` 배열의 원소(dict)를 순서대로 yield 합니다.
+
+    1) 정상 JSON이면 C 구현 `json.loads` 한 번으로 처리합니다 (fast path).
+    2) 실패하면 `{` 위치마다 `raw_decode`로 완결된 객체만 증분 디코딩합니다.
+       잘린 마지막 객체나 객체 사이의 잡음은 건너뜁니다.
+    """
+    cleaned = strip_code_fence(text)
+    if not cleaned:
+        return
+
+    try:
+        data = json.loads(cleaned)
+    except ValueError:
+        pass
+    else:
+        yield from _items_of(data, item_key)
+        return
+
+    pos = cleaned.find("{")
+    while pos != -1:
+        try:
+            obj, end = _DECODER.raw_decode(cleaned, pos)
+        except ValueError:
+            # 잘렸거나 깨진 객체: 다음 `{`(보통 내부 첫 원소)부터 다시 시도합니다.
+            pos = cleaned.find("{", pos + 1)
+            continue
+        yield from _items_of(obj, item_key)
+        pos = cleaned.find("{", end)
+
+
+def _items_of(data: Any, item_key: str) -> Iterator[dict[str, Any]]:
+    if isinstance(data, list):
+        yield from (item for item in data if isinstance(item, dict))
+    elif isinstance(data, dict):
+        items = data.get(item_key)
+        if isinstance(items, list):
+            yield from (item for item in items if isinstance(item, dict))
+        elif item_key not in data:
+            # 배열 래퍼 없이 원소 객체 자체가 온 경우 (salvage 경로)
+            yield data
@@ -0,0 +1,105 @@
+"""
+LLM 호출 사용량(토큰/지연/재시도/비용) 집계 유틸.
+
+Gemini 응답의 `usage_metadata`를 읽어 청크 → 페이지 → 학교 → 실행 단위로 합산합니다.
+청킹 파라미터 튜닝 전후로 토큰이 어디에 쓰이는지 비교하는 용도입니다.
+
+참고 자료:
+- https://ai.google.dev/gemini-api/docs/tokens
+- https://ai.google.dev/gemini-api/docs/pricing
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+# 모델별 100만 토큰당 USD 단가 (input, output). 미등록 모델은 비용 0으로 집계합니다.
+MODEL_PRICING_PER_MILLION: dict[str, tuple[float, float]] = {
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-1.5-pro": (1.25, 5.00),
+}
+
+
+def estimate_cost_usd(model_name: str | None, prompt_tokens: int, output_tokens: int) -> float:
+    """토큰 수로부터 예상 비용(USD)을 계산합니다."""
+    pricing = MODEL_PRICING_PER_MILLION.get((model_name or "").removeprefix("models/"))
+    if not pricing:
+        return 0.0
+    input_price, output_price = pricing
+    return (prompt_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def _token_count(usage_metadata: Any, field: str) -> int:
+    value = getattr(usage_metadata, field, None)
+    # mock/구버전 SDK에서 int가 아닌 값이 올 수 있어 방어적으로 처리합니다.
+    return value if isinstance(value, int) and value >= 0 else 0
+
+
+@dataclass
+class UsageStats:
+    """LLM 호출 사용량 누적 카운터."""
+
+    calls: int = 0
+    failed_calls: int = 0
+    retries: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+    # rate limit 재시도 한도를 넘겨 추출하지 못하고 버린 청크 수
+    dropped_chunks: int = 0
+
+    def record_call(
+        self,
+        *,
+        model_name: str | None,
+        usage_metadata: Any = None,
+        latency_ms: float = 0.0,
+        retries: int = 0,
+        failed: bool = False,
+    ) -> None:
+        """단일 generate_content 호출 결과를 누적합니다."""
+        prompt_tokens = _token_count(usage_metadata, "prompt_token_count")
+        output_tokens = _token_count(usage_metadata, "candidates_token_count")
+        total_tokens = _token_count(usage_metadata, "total_token_count") or prompt_tokens + output_tokens
+
+        self.calls += 1
+        self.failed_calls += int(failed)
+        self.retries += retries
+        self.prompt_tokens += prompt_tokens
+        self.output_tokens += output_tokens
+        self.total_tokens += total_tokens
+        self.latency_ms += latency_ms
+        self.cost_usd += estimate_cost_usd(model_name, prompt_tokens, output_tokens)
+
+    def merge(self, other: "UsageStats") -> "UsageStats":
+        """다른 집계 결과를 합산합니다 (페이지 → 학교 → 실행)."""
+        self.calls += other.calls
+        self.failed_calls += other.failed_calls
+        self.retries += other.retries
+        self.prompt_tokens += other.prompt_tokens
+        self.output_tokens += other.output_tokens
+        self.total_tokens += other.total_tokens
+        self.latency_ms += other.latency_ms
+        self.cost_usd += other.cost_usd
+        self.dropped_chunks += other.dropped_chunks
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONL 리포트/summary에 기록할 dict로 변환합니다."""
+        return {
+            "calls": self.calls,
+            "failed_calls": self.failed_calls,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "latency_ms": round(self.latency_ms, 1),
+            "cost_usd": round(self.cost_usd, 6),
+            "dropped_chunks": self.dropped_chunks,
+        }
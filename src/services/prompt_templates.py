@@ -72,6 +72,35 @@ Return JSON only.
 """
 
 
+def build_triple_response_schema(relations: Iterable[str]) -> dict[str, Any]:
+    """
+    Structured output(response_schema) 지원 모델에서 사용하는 Triple 응답 스키마.
+
+    Gemini OpenAPI subset 형식이며, relation은 ontology relation set으로 제한합니다.
+    relation 목록은 `EntityResolver.RELATIONS`를 넘겨 정규화 단계와 한 곳에서 관리합니다
+    (entity_resolution이 이 모듈을 import하므로 여기서는 인자로 받습니다).
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "triples": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "head": {"type": "string"},
+                        "relation": {"type": "string", "enum": sorted(relations)},
+                        "tail": {"type": "string"},
+                        "confidence": {"type": "number"},
+                    },
+                    "required": ["head", "relation", "tail", "confidence"],
+                },
+            },
+        },
+        "required": ["triples"],
+    }
+
+
 ENTITY_NORMALIZATION_PROMPT = """
 Normalize entity names for a study-abroad knowledge graph.
 
@@ -118,7 +147,7 @@ Return JSON only:
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Triple:
     """추출된 지식 그래프 Triple."""
 
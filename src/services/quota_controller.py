@@ -0,0 +1,147 @@
+"""
+Gemini 429/quota 응답에 대한 프로세스 전역 백오프 컨트롤러.
+
+한 워커가 rate limit에 걸리면 같은 quota를 공유하는 모든 추출 호출이 함께 멈췄다가
+재개되도록 "전역 일시정지 시각"을 공유합니다. 동시에 도착한 429 여러 건은 같은
+백오프 구간으로 묶어, 워커 수만큼 대기 시간이 불어나지 않게 합니다.
+
+참고 자료:
+- https://ai.google.dev/gemini-api/docs/rate-limits
+- https://cloud.google.com/storage/docs/retry-strategy#exponential-backoff
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from typing import Callable
+
+from google.api_core import exceptions as google_exceptions
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_TOO_MANY_REQUESTS = 429
+_RETRY_AFTER_RE = re.compile(
+    r"(?:retry in|retry after|retry_delay\s*\{\s*seconds:)\s*([0-9]+(?:\.[0-9]+)?)",
+    re.IGNORECASE,
+)
+
+
+class QuotaExceededError(RuntimeError):
+    """rate limit으로 호출이 거절되어 재시도(재큐잉)가 필요함을 알립니다."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _status_code(exc: BaseException) -> int | None:
+    """예외가 들고 있는 HTTP 상태 코드 (`code`/`status_code` 속성 또는 `response.status_code`)."""
+    response = getattr(exc, "response", None)
+    for value in (
+        getattr(exc, "code", None),
+        getattr(exc, "status_code", None),
+        getattr(response, "status_code", None),
+    ):
+        if isinstance(value, bool):
+            continue
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """
+    예외가 429/quota 초과 응답인지 판별합니다.
+
+    메시지 문자열은 보지 않고 예외 타입과 상태 코드로만 판단합니다
+    (본문에 "quota"나 "429"가 들어간 다른 오류로 전역 백오프가 걸리지 않도록).
+    """
+    if isinstance(exc, (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)):
+        return True
+    return _status_code(exc) == _TOO_MANY_REQUESTS
+
+
+def parse_retry_after(exc: BaseException) -> float | None:
+    """에러 메시지에 서버가 제안한 재시도 대기 시간이 있으면 초 단위로 반환합니다."""
+    match = _RETRY_AFTER_RE.search(str(exc))
+    return float(match.group(1)) if match else None
+
+
+class QuotaController:
+    """전역 일시정지 시각을 공유하는 thread-safe 백오프 컨트롤러."""
+
+    def __init__(
+        self,
+        *,
+        base_delay: float = 2.0,
+        max_delay: float = 120.0,
+        jitter: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._streak = 0
+        self.rate_limited_count = 0
+
+    @property
+    def paused_until(self) -> float:
+        with self._lock:
+            return self._paused_until
+
+    def wait(self) -> float:
+        """일시정지 구간이면 끝날 때까지 대기하고, 실제 대기한 초를 반환합니다."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                remaining = self._paused_until - self._clock()
+            if remaining <= 0:
+                return waited
+            self._sleep(remaining)
+            waited += remaining
+
+    def report_rate_limited(self, retry_after: float | None = None) -> float:
+        """
+        429/quota 응답을 보고하고 전역 일시정지 구간을 설정합니다.
+
+        이미 일시정지 중에 도착한 429(같은 파도)는 백오프 단계를 올리지 않습니다.
+
+        Returns:
+            지금부터 일시정지가 끝날 때까지 남은 초
+        """
+        with self._lock:
+            now = self._clock()
+            self.rate_limited_count += 1
+            if now >= self._paused_until:
+                self._streak += 1
+            delay = min(self.max_delay, self.base_delay * (2 ** (self._streak - 1)))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            delay *= 1 + random.uniform(0, self.jitter)
+            self._paused_until = max(self._paused_until, now + delay)
+            remaining = self._paused_until - now
+            streak = self._streak
+
+        logger.warning("Gemini rate limit 감지: 전역 백오프 %.1fs (연속 %d회)", remaining, streak)
+        return remaining
+
+    def report_success(self) -> None:
+        """정상 응답을 보고하여 백오프 단계를 초기화합니다."""
+        with self._lock:
+            self._streak = 0
+
+
+# 같은 API 키(quota)를 공유하는 모든 추출기가 사용하는 프로세스 전역 인스턴스
+default_quota_controller = QuotaController()
@@ -0,0 +1,264 @@
+"""
+학교명 alias 자동 생성기.
+
+`data/schools_initial.json`의 시드 학교명과 College Scorecard 조회 결과로부터
+canonical 학교명 → alias 목록을 만들어 `data/school_aliases.json`(EntityResolver
+alias 색인 입력)으로 저장합니다. Gemini가 돌려주는 학교 엔티티 대부분이 fuzzy/fallback
+경로 대신 정확 일치(O(1))로 해결되도록 하는 것이 목적입니다.
+
+생성 규칙:
+- 약어: "Orange Coast College" → "OCC", "University of California, Los Angeles" → "UCLA"
+- 어순 변형: "College of X" ↔ "X College", "University of X" ↔ "X University"
+- "Community" 생략/추가: "X Community College" ↔ "X College"
+- 표기 변형: 선행 "The", "&" ↔ "and", "Saint" ↔ "St.", "Mount" ↔ "Mt.", 쉼표 제거
+- Scorecard 공식 명칭 및 `school.alias` 필드
+
+여러 학교에 동시에 생기는 alias(예: 같은 약어)는 모호하므로 모두 버립니다.
+
+"Community"를 뺀 표기("Austin Community College" → "Austin College")와 3글자 이하 약어("ARC")는
+시드 목록 밖의 다른 실제 학교 이름이거나 흔한 약어일 수 있습니다. 이런 alias는 Scorecard 이름
+검색으로 다른 기관과 겹치지 않음을 확인한 경우(`SchoolNameRecord.verified_aliases`)에만 내보내고,
+Scorecard를 조회하지 않은 실행에서는 버립니다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from src.services.alias_index import normalize_key
+
+if TYPE_CHECKING:
+    from src.integrations.college_scorecard_client import ScorecardStats
+
+DEFAULT_SCHOOL_ALIAS_PATH = Path(__file__).parent.parent.parent / "data" / "school_aliases.json"
+
+_ABBREVIATION_STOPWORDS = {"of", "the", "and", "at", "in", "for", "&"}
+_MIN_ABBREVIATION_LENGTH = 3
+# 이 길이 이하의 약어는 다른 학교와 겹치기 쉬워 Scorecard 확인이 필요합니다.
+_MAX_UNVERIFIED_ABBREVIATION_LENGTH = 3
+_WORD_RE = re.compile(r"[A-Za-z0-9]+|&")
+_SPACE_RE = re.compile(r"\s+")
+_INSTITUTION_WORDS = ("College", "University", "Institute")
+_PREFIX_FORM_RE = re.compile(r"^(College|University|Institute) of (?:the )?(.+)$", re.IGNORECASE)
+_SUFFIX_FORM_RE = re.compile(r"^(.+?) (College|University|Institute)$", re.IGNORECASE)
+_SPELLING_VARIANTS = (
+    (re.compile(r"\bSaint\b"), "St."),
+    (re.compile(r"\bSt\.?(?=\s)"), "Saint"),
+    (re.compile(r"\bMount\b"), "Mt."),
+    (re.compile(r"\bMt\.?(?=\s)"), "Mount"),
+    (re.compile(r"\s&\s"), " and "),
+    (re.compile(r"\sand\s"), " & "),
+)
+
+
+@dataclass
+class SchoolNameRecord:
+    """alias 생성 입력 (시드 데이터 1건 + 선택적 Scorecard 결과)."""
+
+    name: str
+    school_type: str | None = None
+    scorecard_name: str | None = None
+    scorecard_aliases: tuple[str, ...] = field(default_factory=tuple)
+    # `aliases_needing_check` 중 Scorecard 이름 검색으로 다른 기관과 겹치지 않음을 확인한 alias
+    verified_aliases: tuple[str, ...] = field(default_factory=tuple)
+
+
+def _clean(name: str) -> str:
+    return _SPACE_RE.sub(" ", (name or "").strip())
+
+
+def abbreviation(name: str) -> str | None:
+    """의미 있는 단어의 머리글자 약어. 너무 짧으면(오탐 위험) None."""
+    words = [word for word in _WORD_RE.findall(name) if word.lower() not in _ABBREVIATION_STOPWORDS]
+    letters = "".join(word[0].upper() for word in words if word[0].isalpha())
+    return letters if len(letters) >= _MIN_ABBREVIATION_LENGTH else None
+
+
+def _word_order_variants(name: str) -> set[str]:
+    variants: set[str] = set()
+    prefix = _PREFIX_FORM_RE.match(name)
+    if prefix and "," not in prefix.group(2):
+        variants.add(f"{prefix.group(2)} {prefix.group(1).title()}")
+    suffix = _SUFFIX_FORM_RE.match(name)
+    # "X Community College" → "College of X Community"는 실제로 쓰이지 않는 표기라 제외합니다.
+    excluded = (*_INSTITUTION_WORDS, "Community")
+    if suffix and not any(word in suffix.group(1).split() for word in excluded):
+        variants.add(f"{suffix.group(2).title()} of {suffix.group(1)}")
+    return variants
+
+
+def _community_variants(name: str, school_type: str | None) -> tuple[set[str], set[str]]:
+    """(추가 표기, 생략 표기). "Community"를 뺀 표기는 다른 학교 이름일 수 있어 따로 돌려줍니다."""
+    if re.search(r"\bCommunity College\b", name):
+        return set(), {re.sub(r"\bCommunity College\b", "College", name)}
+    is_community = "community" in (school_type or "").lower()
+    if is_community and name.endswith(" College"):
+        return {f"{name[: -len(' College')]} Community College"}, set()
+    return set(), set()
+
+
+def _spelling_variants(name: str) -> set[str]:
+    variants: set[str] = set()
+    if name.lower().startswith("the "):
+        variants.add(name[4:])
+    if "," in name:
+        variants.add(_clean(name.replace(",", " ")))
+        variants.add(_clean(name.replace(",", " -")))
+    for pattern, replacement in _SPELLING_VARIANTS:
+        if pattern.search(name):
+            variants.add(_clean(pattern.sub(replacement, name)))
+    return variants
+
+
+def _alias_candidates(name: str, school_type: str | None) -> tuple[set[str], set[str]]:
+    """(바로 쓸 수 있는 alias, Scorecard 확인이 필요한 alias)."""
+    canonical = _clean(name)
+    if not canonical:
+        return set(), set()
+
+    added, dropped = _community_variants(canonical, school_type)
+    structural = {canonical} | _word_order_variants(canonical) | added
+
+    safe: set[str] = set(structural)
+    for variant in structural:
+        safe |= _spelling_variants(variant)
+    needs_check: set[str] = set(dropped)
+    for variant in dropped:
+        needs_check |= _spelling_variants(variant)
+
+    short = abbreviation(canonical)
+    if short:
+        (needs_check if len(short) <= _MAX_UNVERIFIED_ABBREVIATION_LENGTH else safe).add(short)
+
+    canonical_key = normalize_key(canonical)
+
+    def _distinct(aliases: set[str]) -> set[str]:
+        return {alias for alias in aliases if normalize_key(alias) not in ("", canonical_key)}
+
+    needs_check = _distinct(needs_check)
+    return _distinct(safe) - needs_check, needs_check
+
+
+def generate_school_aliases(name: str, school_type: str | None = None) -> set[str]:
+    """
+    학교명 하나에 대한 alias 후보를 생성합니다 (canonical 자신은 제외).
+
+    표기 변형은 어순/Community 변형 결과에도 한 번 더 적용합니다.
+    Scorecard 확인이 필요한 후보(`aliases_needing_check`)도 포함합니다.
+    """
+    safe, needs_check = _alias_candidates(name, school_type)
+    return safe | needs_check
+
+
+def aliases_needing_check(name: str, school_type: str | None = None) -> set[str]:
+    """다른 학교 이름이나 흔한 약어와 겹칠 수 있어 Scorecard로 확인해야 하는 alias 후보."""
+    return _alias_candidates(name, school_type)[1]
+
+
+def conflicts_with_scorecard(
+    alias: str,
+    own_names: Iterable[str],
+    matches: Iterable["ScorecardStats"],
+) -> bool:
+    """
+    Scorecard 검색 결과 중 이 학교가 아닌 기관의 이름/별칭이 alias와 같은지 확인합니다.
+
+    Args:
+        alias: 확인할 alias
+        own_names: 이 학교의 이름들 (시드 이름, Scorecard 공식 명칭)
+        matches: `CollegeScorecardClient.search_schools(alias)` 결과
+    """
+    alias_key = normalize_key(alias)
+    own_keys = {normalize_key(name) for name in own_names if name}
+    for match in matches:
+        if normalize_key(match.school_name or "") in own_keys:
+            continue
+        if alias_key in {normalize_key(name) for name in (match.school_name or "", *match.aliases)}:
+            return True
+    return False
+
+
+def build_school_alias_table(records: Iterable[SchoolNameRecord]) -> dict[str, list[str]]:
+    """
+    레코드 전체에 대해 canonical → alias 목록을 만듭니다.
+
+    - 서로 다른 학교에서 같은 정규화 키가 나오면 그 alias는 모호하므로 버립니다.
+    - 다른 학교의 canonical 이름과 같은 alias도 버립니다.
+    - Scorecard 확인이 필요한 alias는 `verified_aliases`에 있는 것만 씁니다.
+    """
+    canonical_by_key: dict[str, str] = {}
+    candidates: dict[str, set[str]] = {}
+    for record in records:
+        canonical = _clean(record.name)
+        if not canonical:
+            continue
+        canonical_by_key.setdefault(normalize_key(canonical), canonical)
+        aliases = candidates.setdefault(canonical, set())
+        verified = {normalize_key(alias) for alias in record.verified_aliases}
+        for source in (canonical, record.scorecard_name, *record.scorecard_aliases):
+            source = _clean(source or "")
+            if not source:
+                continue
+            aliases.add(source)
+            safe, needs_check = _alias_candidates(source, record.school_type)
+            aliases |= safe
+            aliases |= {alias for alias in needs_check if normalize_key(alias) in verified}
+
+    owners: dict[str, set[str]] = defaultdict(set)
+    for canonical, aliases in candidates.items():
+        for alias in aliases:
+            owners[normalize_key(alias)].add(canonical)
+
+    table: dict[str, list[str]] = {}
+    for canonical, aliases in sorted(candidates.items()):
+        kept: dict[str, str] = {}
+        canonical_key = normalize_key(canonical)
+        for alias in sorted(aliases):
+            key = normalize_key(alias)
+            if not key or key == canonical_key or key in kept:
+                continue
+            if len(owners[key]) > 1:
+                continue
+            if canonical_by_key.get(key, canonical) != canonical:
+                continue
+            kept[key] = alias
+        table[canonical] = sorted(kept.values())
+    return table
+
+
+def load_seed_records(schools_json: Path) -> list[SchoolNameRecord]:
+    """`schools_initial.json` 형식 파일을 레코드 목록으로 읽습니다."""
+    with schools_json.open("r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    schools = data.get("schools", []) if isinstance(data, dict) else data
+    return [
+        SchoolNameRecord(name=school["name"], school_type=school.get("type"))
+        for school in schools
+        if school.get("name")
+    ]
+
+
+def write_alias_file(
+    table: dict[str, list[str]],
+    output_path: Path = DEFAULT_SCHOOL_ALIAS_PATH,
+    version: str | None = None,
+) -> Path:
+    """alias 색인 파일 형식(`{"version", "aliases"}`)으로 저장합니다."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": version or date.today().isoformat(),
+        "aliases": table,
+    }
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fp:
+        json.dump(payload, fp, ensure_ascii=False, indent=2)
+        fp.write("\n")
+    # 실행 중인 resolver가 반쯤 쓰인 파일을 읽지 않도록 원자적으로 교체합니다.
+    tmp_path.replace(output_path)
+    return output_path
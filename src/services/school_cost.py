@@ -0,0 +1,155 @@
+"""
+학교별 크롤링 비용 기록과 추정.
+
+파이프라인은 학교를 처리할 때마다 가져온 페이지 수, 바이트 수, 소요 시간을
+`<status>.costs.json`(예: `data/crawling_status.json.costs.json`)에 남기고, 다음 실행은 이 값으로
+학교별 예상 소요 시간을 계산해 오래 걸리는 학교부터 시작합니다(LPT 스케줄링).
+
+소요 시간이 0인 기록(실패하거나 건너뛴 학교)은 시간 없이 규모(페이지/바이트)만 남깁니다.
+
+추정 규칙:
+    1. 이전 소요 시간이 있으면 지수 이동 평균(EWMA)으로 다듬은 값
+    2. 시간은 없고 바이트 수가 있으면 바이트 수 × 전체 기록의 바이트당 중앙값 시간
+    3. 바이트도 없고 페이지 수만 있으면 페이지 수 × 전체 기록의 페이지당 중앙값 시간
+    4. 기록이 없는 학교는 전체 기록의 중앙값 (기록이 전혀 없으면 `DEFAULT_COST_SECONDS`)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_COST_SECONDS = 1.0
+# 직전 실행의 비중 (일시적인 느린 응답 한 번이 추정을 뒤집지 않도록 이전 값과 섞습니다)
+DEFAULT_SMOOTHING = 0.5
+# 저장 정밀도(ms). 이보다 짧게 끝난 처리도 0(시간 없음)이 아닌 이 값으로 기록합니다.
+MIN_DURATION_SECONDS = 0.001
+_COST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SchoolCost:
+    """학교 하나를 처리하는 데 든 비용."""
+
+    pages: int = 0
+    bytes: int = 0
+    duration_s: float = 0.0
+
+
+class SchoolCostStore:
+    """학교 키 → `SchoolCost` 기록 (thread-safe, JSON 파일로 저장)."""
+
+    def __init__(self, path: Optional[Path | str] = None, *, smoothing: float = DEFAULT_SMOOTHING) -> None:
+        """
+        Args:
+            path: JSON 저장 경로 (None이면 메모리에만 보관)
+            smoothing: 새 측정값의 EWMA 가중치 (1.0이면 직전 실행 값만 사용)
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing은 0보다 크고 1 이하여야 합니다.")
+        self.path = Path(path) if path else None
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._costs: Dict[str, SchoolCost] = {}
+        if self.path is not None:
+            self._load()
+
+    @classmethod
+    def for_status(cls, status_path: Path | str, **kwargs) -> "SchoolCostStore":
+        """상태 스냅샷 옆(`<status>.costs.json`)에 저장하는 기록."""
+        status_path = Path(status_path)
+        return cls(status_path.with_name(status_path.name + ".costs.json"), **kwargs)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._costs)
+
+    def get(self, key: str) -> Optional[SchoolCost]:
+        with self._lock:
+            return self._costs.get(key)
+
+    def record(self, key: str, cost: SchoolCost) -> None:
+        """측정값을 반영합니다 (소요 시간은 이전 값과 EWMA로 섞고, 0이면 이전 값을 유지)."""
+        with self._lock:
+            previous = self._costs.get(key)
+            duration = cost.duration_s
+            if previous is not None and previous.duration_s > 0:
+                if duration > 0:
+                    duration = self.smoothing * duration + (1 - self.smoothing) * previous.duration_s
+                else:
+                    duration = previous.duration_s
+            if duration > 0:
+                # 1ms 미만으로 끝난 측정을 반올림해 0(시간 없음)으로 만들지 않습니다.
+                duration = max(round(duration, 3), MIN_DURATION_SECONDS)
+            self._costs[key] = SchoolCost(pages=cost.pages, bytes=cost.bytes, duration_s=duration)
+
+    def estimate(self, key: str) -> float:
+        """학교 하나의 예상 소요 시간(초)."""
+        return self.estimate_many([key])[0]
+
+    def estimate_many(self, keys: Iterable[str]) -> List[float]:
+        """여러 학교의 예상 소요 시간(초) (중앙값은 한 번만 계산)."""
+        with self._lock:
+            known = [cost for cost in self._costs.values() if cost.duration_s > 0]
+            median = statistics.median(cost.duration_s for cost in known) if known else DEFAULT_COST_SECONDS
+            paged = [cost.duration_s / cost.pages for cost in known if cost.pages > 0]
+            per_page = statistics.median(paged) if paged else None
+            sized = [cost.duration_s / cost.bytes for cost in known if cost.bytes > 0]
+            per_byte = statistics.median(sized) if sized else None
+
+            estimates: List[float] = []
+            for key in keys:
+                cost = self._costs.get(key)
+                if cost is not None and cost.duration_s > 0:
+                    estimates.append(cost.duration_s)
+                elif cost is not None and cost.bytes > 0 and per_byte is not None:
+                    estimates.append(cost.bytes * per_byte)
+                elif cost is not None and cost.pages > 0 and per_page is not None:
+                    estimates.append(cost.pages * per_page)
+                else:
+                    estimates.append(median)
+            return estimates
+
+    def save(self) -> None:
+        """기록을 원자적으로 저장합니다."""
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "version": _COST_VERSION,
+                "schools": {key: asdict(cost) for key, cost in self._costs.items()},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> None:
+        assert self.path is not None
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("학교별 비용 기록을 읽을 수 없어 비어 있는 상태로 시작합니다: %s", exc)
+            return
+        if data.get("version") != _COST_VERSION:
+            return
+        for key, entry in (data.get("schools") or {}).items():
+            try:
+                self._costs[key] = SchoolCost(
+                    pages=int(entry.get("pages", 0)),
+                    bytes=int(entry.get("bytes", 0)),
+                    duration_s=float(entry.get("duration_s", 0.0)),
+                )
+            except (AttributeError, TypeError, ValueError):
+                continue
@@ -0,0 +1,111 @@
+"""
+append-only 크롤링 상태 저널.
+
+학교 하나의 상태가 바뀔 때마다 전체 JSON을 다시 쓰면 실행 전체로는 O(n²) I/O가 되고,
+쓰는 도중에 죽으면 상태 파일이 깨집니다. `StatusJournal`은 상태 변경을 `<snapshot>.journal.jsonl`에
+한 줄씩 덧붙이고(상수 비용), `compact_every`건마다 또는 실행 종료 시 전체 상태를 스냅샷
+(기존 `crawling_status.json` 형식)으로 원자적으로 교체한 뒤 저널을 비웁니다.
+
+시작 시 `load()`는 스냅샷 위에 저널을 순서대로 접어(fold) 현재 상태를 만듭니다. 쓰다 만
+마지막 줄은 무시하며, 스냅샷 교체 후 저널을 비우기 전에 죽어도 같은 값을 다시 적용할 뿐입니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_COMPACT_EVERY = 500
+
+
+class StatusJournal:
+    """스냅샷 JSON + append-only JSONL 저널로 key → status 맵을 보관합니다."""
+
+    def __init__(self, snapshot_path: Path | str, *, compact_every: int = DEFAULT_COMPACT_EVERY) -> None:
+        """
+        Args:
+            snapshot_path: 스냅샷 JSON 경로 (예: data/crawling_status.json)
+            compact_every: 이 건수만큼 저널에 쌓이면 스냅샷으로 압축 (0이면 자동 압축 안 함)
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(self.snapshot_path.name + ".journal.jsonl")
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._status: Dict[str, str] = {}
+        self._pending = 0
+
+    def load(self) -> Dict[str, str]:
+        """스냅샷과 저널을 접어 현재 상태를 반환합니다 (반환값은 복사본)."""
+        status: Dict[str, str] = {}
+        if self.snapshot_path.exists():
+            try:
+                status = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.warning("상태 스냅샷을 읽을 수 없어 저널만 적용합니다: %s", exc)
+                status = {}
+        replayed = 0
+        if self.journal_path.exists():
+            with self.journal_path.open("r", encoding="utf-8") as fp:
+                for line in fp:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and "key" in entry:
+                        status[entry["key"]] = entry.get("status")
+                        replayed += 1
+        with self._lock:
+            self._status = status
+            self._pending = replayed
+        return dict(status)
+
+    def append(self, key: str, status: str) -> bool:
+        """
+        상태 변경 한 건을 저널에 기록합니다 (compact_every에 도달하면 압축).
+
+        Returns:
+            이번 기록으로 스냅샷 압축이 일어났으면 True
+        """
+        line = (json.dumps({"key": key, "status": status}, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            self._status[key] = status
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a+b") as fp:
+                # 이전 실행이 줄 중간에 중단됐으면 새 기록이 깨진 줄에 붙지 않도록 개행부터 씁니다.
+                if fp.tell() > 0:
+                    fp.seek(-1, os.SEEK_END)
+                    if fp.read(1) != b"\n":
+                        fp.write(b"\n")
+                fp.write(line)
+                fp.flush()
+                os.fsync(fp.fileno())
+            self._pending += 1
+            if self.compact_every and self._pending >= self.compact_every:
+                self._compact_locked()
+                return True
+            return False
+
+    def compact(self) -> None:
+        """현재 상태를 스냅샷으로 원자적으로 쓰고 저널을 비웁니다."""
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump(self._status, fp, ensure_ascii=False)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # 스냅샷이 교체된 뒤에만 저널을 비웁니다 (그 사이에 죽으면 같은 값이 다시 적용될 뿐).
+        if self.journal_path.exists():
+            self.journal_path.write_text("", encoding="utf-8")
+        self._pending = 0
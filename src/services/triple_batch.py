@@ -0,0 +1,181 @@
+"""
+배열 기반(columnar) Triple 배치.
+
+`NormalizedTriple`/`Triple` 인스턴스는 4개의 Python 객체를 들고 있고 "OFFERS"나 학교명 같은
+문자열 참조가 수천 번 반복됩니다. `TripleBatch`는 head/tail을 공유 엔티티 `StringInterner`의
+정수 id(`array('I')`, 4 bytes)로, relation을 별도 relation interner의 id로, confidence를
+float32(`array('f')`) 컬럼으로 저장하여 대규모 수집 결과의 병합/중복 제거를 적은 메모리로 처리합니다.
+relation을 엔티티 interner와 분리해 두므로 엔티티 interner를 그래프 색인과 공유해도
+"OFFERS" 같은 relation 문자열이 엔티티로 섞이지 않습니다.
+
+numpy 의존성 없이 표준 라이브러리 `array`만 사용하며, confidence 필터는 마스크를 한 번에
+만든 뒤 `itertools.compress`로 각 컬럼을 일괄 선택합니다.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import compress
+from typing import Iterable, Iterator, List, Optional
+
+from src.services.entity_resolution import NormalizedTriple
+from src.services.interner import StringInterner
+from src.services.prompt_templates import Triple
+
+# float32(유효숫자 약 7자리)로 저장된 값을 원래의 소수 표기로 되돌릴 때 쓰는 자릿수
+_CONFIDENCE_DIGITS = 6
+
+
+class TripleBatch:
+    """interned id 컬럼 + float32 confidence 컬럼으로 구성된 Triple 묶음."""
+
+    __slots__ = (
+        "interner",
+        "relation_interner",
+        "heads",
+        "relations",
+        "tails",
+        "confidence",
+        "_folded",
+        "_folded_keys",
+    )
+
+    def __init__(
+        self,
+        interner: Optional[StringInterner] = None,
+        relation_interner: Optional[StringInterner] = None,
+    ) -> None:
+        self.interner = interner if interner is not None else StringInterner()
+        self.relation_interner = relation_interner if relation_interner is not None else StringInterner()
+        self.heads = array("I")
+        self.relations = array("I")
+        self.tails = array("I")
+        self.confidence = array("f")
+        # 대소문자 무시 dedupe용: id → 소문자 표기의 로컬 id (공유 interner는 건드리지 않음)
+        self._folded: dict[int, int] = {}
+        self._folded_keys: dict[str, int] = {}
+
+    @classmethod
+    def from_triples(
+        cls,
+        triples: Iterable[Triple | NormalizedTriple],
+        interner: Optional[StringInterner] = None,
+        relation_interner: Optional[StringInterner] = None,
+    ) -> "TripleBatch":
+        batch = cls(interner, relation_interner)
+        batch.extend(triples)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.heads)
+
+    def __iter__(self) -> Iterator[NormalizedTriple]:
+        lookup, relation_lookup = self.interner.lookup, self.relation_interner.lookup
+        for head, relation, tail, confidence in zip(self.heads, self.relations, self.tails, self.confidence):
+            yield NormalizedTriple(
+                head=lookup(head),
+                relation=relation_lookup(relation),
+                tail=lookup(tail),
+                confidence=round(confidence, _CONFIDENCE_DIGITS),
+            )
+
+    def __getitem__(self, index: int) -> NormalizedTriple:
+        lookup = self.interner.lookup
+        return NormalizedTriple(
+            head=lookup(self.heads[index]),
+            relation=self.relation_interner.lookup(self.relations[index]),
+            tail=lookup(self.tails[index]),
+            confidence=round(self.confidence[index], _CONFIDENCE_DIGITS),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """컬럼 배열이 차지하는 바이트 수 (interner 제외)."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.heads, self.relations, self.tails, self.confidence)
+        )
+
+    def append(self, head: str, relation: str, tail: str, confidence: float) -> None:
+        intern = self.interner.intern
+        self.heads.append(intern(head))
+        self.relations.append(self.relation_interner.intern(relation))
+        self.tails.append(intern(tail))
+        self.confidence.append(confidence)
+
+    def extend(self, triples: Iterable[Triple | NormalizedTriple]) -> None:
+        for triple in triples:
+            self.append(triple.head, triple.relation, triple.tail, float(triple.confidence))
+
+    def concat(self, other: "TripleBatch") -> "TripleBatch":
+        """두 배치를 이어 붙인 새 배치 (interner가 다르면 other 쪽 id를 다시 매핑)."""
+        result = self._empty_like()
+        for source in (self, other):
+            if source.interner is not self.interner:
+                result.extend(source)
+                continue
+            result.heads.extend(source.heads)
+            result.tails.extend(source.tails)
+            result.confidence.extend(source.confidence)
+            if source.relation_interner is self.relation_interner:
+                result.relations.extend(source.relations)
+            else:
+                intern, lookup = self.relation_interner.intern, source.relation_interner.lookup
+                result.relations.extend(intern(lookup(relation)) for relation in source.relations)
+        return result
+
+    def select(self, mask: Iterable[bool]) -> "TripleBatch":
+        """mask가 참인 행만 담은 새 배치 (interner 공유)."""
+        mask = list(mask)
+        result = self._empty_like()
+        result.heads = array("I", compress(self.heads, mask))
+        result.relations = array("I", compress(self.relations, mask))
+        result.tails = array("I", compress(self.tails, mask))
+        result.confidence = array("f", compress(self.confidence, mask))
+        return result
+
+    def filter_confidence(self, min_confidence: float) -> "TripleBatch":
+        """confidence >= min_confidence 인 행만 남깁니다."""
+        # float32로 저장된 값과 비교하므로 임계값도 같은 정밀도로 맞춥니다.
+        threshold = array("f", [min_confidence])[0]
+        return self.select(value >= threshold for value in self.confidence)
+
+    def dedupe(self) -> "TripleBatch":
+        """
+        `EntityResolver._dedupe`와 같은 기준((head, tail) 대소문자 무시 + relation)으로
+        첫 번째 행만 남깁니다.
+        """
+        fold = self._fold_id
+        seen: set[tuple[int, int, int]] = set()
+        mask: List[bool] = []
+        for head, relation, tail in zip(self.heads, self.relations, self.tails):
+            key = (fold(head), relation, fold(tail))
+            if key in seen:
+                mask.append(False)
+            else:
+                seen.add(key)
+                mask.append(True)
+        return self.select(mask)
+
+    def to_normalized(self) -> List[NormalizedTriple]:
+        return list(self)
+
+    def to_triples(self) -> List[Triple]:
+        return [
+            Triple(head=item.head, relation=item.relation, tail=item.tail, confidence=item.confidence)
+            for item in self
+        ]
+
+    def _fold_id(self, value_id: int) -> int:
+        folded = self._folded.get(value_id)
+        if folded is None:
+            lowered = self.interner.lookup(value_id).lower()
+            folded = self._folded_keys.setdefault(lowered, len(self._folded_keys))
+            self._folded[value_id] = folded
+        return folded
+
+    def _empty_like(self) -> "TripleBatch":
+        result = TripleBatch(self.interner, self.relation_interner)
+        result._folded = self._folded
+        result._folded_keys = self._folded_keys
+        return result
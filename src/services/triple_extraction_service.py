@@ -10,16 +10,43 @@ Gemini API를 사용하여 HTML 콘텐츠에서 지식 그래프 Triples를 추
 
 from __future__ import annotations
 
-import json
 import os
+import time
+from collections import deque
 from typing import Any
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from google.generativeai.types import GenerateContentResponse
 
 from src.crawlers.chunking import Chunk, SemanticChunker
+from src.crawlers.parse_pool import ParsePool
 from src.services.entity_resolution import EntityResolver, NormalizedTriple
-from src.services.prompt_templates import TRIPLE_EXTRACTION_PROMPT, Triple
+from src.services.json_response_parser import iter_json_objects
+from src.services.llm_usage import UsageStats
+from src.services.prompt_templates import (
+    TRIPLE_EXTRACTION_PROMPT,
+    Triple,
+    build_triple_response_schema,
+)
+from src.services.quota_controller import (
+    QuotaController,
+    QuotaExceededError,
+    default_quota_controller,
+    is_rate_limit_error,
+    parse_retry_after,
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+TRIPLE_RESPONSE_SCHEMA: dict[str, Any] = build_triple_response_schema(EntityResolver.RELATIONS)
+
+
+def _is_schema_rejection(error: Exception) -> bool:
+    """InvalidArgument가 response_schema/mime type 자체를 거부한 것인지 (프롬프트 문제와 구분)."""
+    message = str(error).lower()
+    return "schema" in message or "response_mime_type" in message
 
 
 class TripleExtractionService:
@@ -32,6 +59,10 @@ class TripleExtractionService:
         chunk_size: int = 1000,
         overlap: int = 200,
         confidence_threshold: float = 0.8,
+        structured_output: bool = True,
+        quota_controller: QuotaController | None = None,
+        max_rate_limit_retries: int = 5,
+        parse_pool: ParsePool | None = None,
     ) -> None:
         """
         TripleExtractionService 초기화.
@@ -42,21 +73,42 @@ class TripleExtractionService:
             chunk_size: 청킹 시 최대 문자 수
             overlap: 청킹 오버랩 문자 수
             confidence_threshold: 최소 Confidence 점수 (이 값 이상만 반환)
+            structured_output: response_schema 기반 JSON 출력 모드 사용 여부
+                (모델이 거부하면 자동으로 일반 텍스트 모드로 전환)
+            quota_controller: 429/quota 전역 백오프 컨트롤러 (기본: 프로세스 공유 인스턴스)
+            max_rate_limit_retries: rate limit으로 실패한 청크를 재큐잉할 최대 횟수
+            parse_pool: 지정되면 HTML 파싱/청킹을 이 프로세스 풀에서 수행
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY 환경변수 또는 api_key 파라미터가 필요합니다.")
 
         genai.configure(api_key=self.api_key)
+        self.model_name = model_name
         self.model = genai.GenerativeModel(model_name)
-        self.chunker = SemanticChunker()
+        # ParsePool은 SemanticChunker와 같은 chunk_html 인터페이스를 제공합니다.
+        self.chunker: SemanticChunker | ParsePool = parse_pool if parse_pool is not None else SemanticChunker()
         self.resolver = EntityResolver()
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.confidence_threshold = confidence_threshold
+        self.generation_config: dict[str, Any] | None = (
+            {
+                "response_mime_type": "application/json",
+                "response_schema": TRIPLE_RESPONSE_SCHEMA,
+            }
+            if structured_output
+            else None
+        )
+        self.quota = quota_controller or default_quota_controller
+        self.max_rate_limit_retries = max_rate_limit_retries
 
     def extract_from_html(
-        self, html: str, school_name: str | None = None, source_url: str | None = None
+        self,
+        html: str,
+        school_name: str | None = None,
+        source_url: str | None = None,
+        usage: UsageStats | None = None,
     ) -> list[NormalizedTriple]:
         """
         HTML 콘텐츠에서 Triples를 추출합니다.
@@ -65,6 +117,7 @@ class TripleExtractionService:
             html: 원본 HTML 문자열
             school_name: 학교명 (컨텍스트 제공용)
             source_url: 출처 URL (메타데이터용)
+            usage: 호출별 토큰/지연 사용량을 누적할 집계 객체 (선택)
 
         Returns:
             정규화된 Triples 리스트 (Confidence >= threshold)
@@ -77,10 +130,29 @@ class TripleExtractionService:
         if not chunks:
             return []
 
-        # 2. 각 청크에서 Triple 추출
+        # 2. 각 청크에서 Triple 추출 (rate limit으로 거절된 청크는 큐 뒤로 재배치)
         all_triples: list[Triple] = []
-        for chunk in chunks:
-            triples = self._extract_from_chunk(chunk.text, school_name=school_name)
+        pending: deque[tuple[Chunk, int]] = deque((chunk, 0) for chunk in chunks)
+        while pending:
+            chunk, attempts = pending.popleft()
+            try:
+                triples = self._extract_from_chunk(chunk.text, school_name=school_name, usage=usage)
+            except QuotaExceededError:
+                if attempts >= self.max_rate_limit_retries:
+                    logger.warning(
+                        "rate limit 재시도 %d회를 넘겨 청크를 버립니다 (school=%s, url=%s, offset=%d)",
+                        attempts,
+                        school_name,
+                        source_url,
+                        chunk.start_pos,
+                    )
+                    if usage is not None:
+                        usage.dropped_chunks += 1
+                    continue
+                if usage is not None:
+                    usage.retries += 1
+                pending.append((chunk, attempts + 1))
+                continue
             all_triples.extend(triples)
 
         # 3. Entity Resolution (정규화)
@@ -95,16 +167,25 @@ class TripleExtractionService:
 
         return filtered
 
-    def _extract_from_chunk(self, text: str, school_name: str | None = None) -> list[Triple]:
+    def _extract_from_chunk(
+        self,
+        text: str,
+        school_name: str | None = None,
+        usage: UsageStats | None = None,
+    ) -> list[Triple]:
         """
         단일 텍스트 청크에서 Triples를 추출합니다.
 
         Args:
             text: 추출할 텍스트
             school_name: 학교명 (컨텍스트 제공용)
+            usage: 호출 사용량을 누적할 집계 객체 (선택)
 
         Returns:
             추출된 Triples 리스트
+
+        Raises:
+            QuotaExceededError: 429/quota 초과로 거절된 경우 (호출 측에서 재큐잉)
         """
         if not text or not text.strip():
             return []
@@ -114,65 +195,99 @@ class TripleExtractionService:
         if school_name:
             prompt = f"School context: {school_name}\n\n{prompt}"
 
+        # 다른 워커가 quota에 걸렸다면 전역 백오프가 끝날 때까지 대기
+        self.quota.wait()
+        started = time.perf_counter()
         try:
             # Gemini API 호출
-            response: GenerateContentResponse = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+            response: GenerateContentResponse = self._generate(prompt)
+        except Exception as e:
+            rate_limited = is_rate_limit_error(e)
+            if usage is not None:
+                # 429는 extract_from_html이 재큐잉해 retries로 집계하므로 실패로 세지 않습니다.
+                usage.record_call(
+                    model_name=self.model_name,
+                    latency_ms=(time.perf_counter() - started) * 1000,
+                    failed=not rate_limited,
+                )
+            if rate_limited:
+                retry_after = parse_retry_after(e)
+                self.quota.report_rate_limited(retry_after)
+                raise QuotaExceededError(str(e), retry_after=retry_after) from e
+            # 에러 발생 시 빈 리스트 반환 (로깅은 상위에서 처리)
+            print(f"Triple 추출 실패: {e}")
+            return []
+
+        self.quota.report_success()
 
-            # JSON 파싱
-            triples = self._parse_response(response_text)
-            return triples
+        if usage is not None:
+            usage.record_call(
+                model_name=self.model_name,
+                usage_metadata=getattr(response, "usage_metadata", None),
+                latency_ms=(time.perf_counter() - started) * 1000,
+            )
 
+        try:
+            response_text = response.text.strip()
         except Exception as e:
-            # 에러 발생 시 빈 리스트 반환 (로깅은 상위에서 처리)
+            # 안전 필터 등으로 candidates가 비어 있으면 response.text 접근 자체가 실패합니다.
             print(f"Triple 추출 실패: {e}")
             return []
 
+        # JSON 파싱
+        return self._parse_response(response_text)
+
+    def _generate(self, prompt: str) -> GenerateContentResponse:
+        """
+        structured output 모드로 호출하고, InvalidArgument가 나면 이번 호출만 일반 모드로 재호출합니다.
+
+        오류 메시지가 응답 스키마를 지목할 때만 모델이 structured output을 지원하지 않는 것으로 보고
+        이후 호출도 일반 모드로 전환합니다 (청크 하나의 잘못된 입력이 프로세스 전체 설정을 바꾸지 않게).
+        """
+        generation_config = self.generation_config
+        if generation_config is None:
+            return self.model.generate_content(prompt)
+        try:
+            return self.model.generate_content(prompt, generation_config=generation_config)
+        except google_exceptions.InvalidArgument as e:
+            if _is_schema_rejection(e):
+                print(f"structured output 미지원 모델로 판단하여 일반 모드로 전환합니다: {e}")
+                self.generation_config = None
+            return self.model.generate_content(prompt)
+
     def _parse_response(self, response_text: str) -> list[Triple]:
         """
         Gemini API 응답을 파싱하여 Triple 리스트로 변환합니다.
 
+        코드 펜스/앞뒤 잡음/잘린 응답이 섞여 있어도 완결된 Triple 객체는 모두 살립니다.
+
         Args:
             response_text: API 응답 텍스트 (JSON 형식)
 
         Returns:
             파싱된 Triple 리스트
         """
-        try:
-            # JSON 코드 블록 제거 (```json ... ```)
-            cleaned = response_text.strip()
-            if cleaned.startswith("```"):
-                # 첫 번째 ``` 제거
-                cleaned = cleaned.split("```", 1)[1]
-                if cleaned.startswith("json"):
-                    cleaned = cleaned[4:].strip()
-                # 마지막 ``` 제거
-                if cleaned.endswith("```"):
-                    cleaned = cleaned.rsplit("```", 1)[0].strip()
-
-            # JSON 파싱
-            data = json.loads(cleaned)
-            triples_data = data.get("triples", [])
-
-            triples: list[Triple] = []
-            for item in triples_data:
-                head = item.get("head", "").strip()
-                relation = item.get("relation", "").strip()
-                tail = item.get("tail", "").strip()
+        triples: list[Triple] = []
+        items = list(iter_json_objects(response_text, item_key="triples"))
+        for item in items:
+            try:
+                head = str(item.get("head") or "").strip()
+                relation = str(item.get("relation") or "").strip()
+                tail = str(item.get("tail") or "").strip()
                 confidence = float(item.get("confidence", 0.8))
-
-                if head and relation and tail:
-                    triples.append(
-                        Triple(
-                            head=head,
-                            relation=relation,
-                            tail=tail,
-                            confidence=confidence,
-                        )
+            except (TypeError, ValueError):
+                continue
+
+            if head and relation and tail:
+                triples.append(
+                    Triple(
+                        head=head,
+                        relation=relation,
+                        tail=tail,
+                        confidence=confidence,
                     )
+                )
 
-            return triples
-
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"응답 파싱 실패: {e}, 응답: {response_text[:200]}")
-            return []
+        if not items and '"triples"' not in response_text:
+            print(f"응답 파싱 실패: 응답: {response_text[:200]}")
+        return triples
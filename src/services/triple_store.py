@@ -0,0 +1,171 @@
+"""
+학교 단위 Triple 저장소 (페이지/실행 간 중복 병합).
+
+`EntityResolver._dedupe`는 한 페이지 안에서만 중복을 제거하므로, 수집 결과에는 같은
+`(school, OFFERS, program)` 사실이 페이지마다 반복됩니다. 이 저장소는 학교별로
+(head, relation, tail) 키 단위로 병합하면서 출처 URL별 confidence를 보존하고,
+출처들을 합친 confidence(max 또는 noisy-OR)를 계산해 compact한 JSONL로 씁니다.
+
+같은 URL을 다음 실행에서 다시 수집해도 그 URL의 confidence만 갱신(max)되므로
+noisy-OR 값이 실행 횟수만큼 부풀지 않습니다.
+
+출력 형식 (학교당 1줄):
+    {"school_name": ..., "triples": [
+        {"head", "relation", "tail", "confidence", "sources": {url: confidence}}
+    ]}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping
+
+AGGREGATIONS = ("max", "noisy_or")
+
+
+@dataclass
+class MergedTriple:
+    """여러 출처에서 관측된 하나의 사실."""
+
+    head: str
+    relation: str
+    tail: str
+    sources: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return triple_key(self.head, self.relation, self.tail)
+
+    def observe(self, source_url: str, confidence: float) -> None:
+        confidence = max(0.0, min(1.0, float(confidence)))
+        self.sources[source_url] = max(self.sources.get(source_url, 0.0), confidence)
+
+    def confidence(self, aggregation: str = "noisy_or") -> float:
+        if not self.sources:
+            return 0.0
+        if aggregation == "max":
+            return max(self.sources.values())
+        # noisy-OR: 독립적인 출처 중 하나라도 맞을 확률 = 1 - Π(1 - c_i)
+        return 1.0 - math.prod(1.0 - value for value in self.sources.values())
+
+    def to_dict(self, aggregation: str = "noisy_or") -> Dict[str, Any]:
+        return {
+            "head": self.head,
+            "relation": self.relation,
+            "tail": self.tail,
+            "confidence": round(self.confidence(aggregation), 3),
+            "sources": dict(sorted(self.sources.items())),
+        }
+
+
+def triple_key(head: str, relation: str, tail: str) -> tuple[str, str, str]:
+    """`EntityResolver._dedupe`와 같은 기준의 병합 키."""
+    return (head.lower(), relation, tail.lower())
+
+
+class SchoolTripleStore:
+    """학교별 병합 Triple을 메모리에 유지하고 JSONL로 저장/복원합니다."""
+
+    def __init__(
+        self,
+        path: Path | str = Path("data/school_triples.jsonl"),
+        *,
+        aggregation: str = "noisy_or",
+    ) -> None:
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"지원하지 않는 confidence 집계 방식: {aggregation}")
+        self.path = Path(path)
+        self.aggregation = aggregation
+        self._schools: Dict[str, Dict[tuple[str, str, str], MergedTriple]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(triples) for triples in self._schools.values())
+
+    @property
+    def school_names(self) -> List[str]:
+        return list(self._schools)
+
+    def load(self) -> "SchoolTripleStore":
+        """이전 실행의 병합 결과를 읽어 이어서 병합합니다 (파일이 없으면 빈 상태)."""
+        if not self.path.exists():
+            return self
+        with self.path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                school = record.get("school_name")
+                for item in record.get("triples", []):
+                    sources = item.get("sources") or {"": item.get("confidence", 0.0)}
+                    for url, confidence in sources.items():
+                        self.add(school, [item], source_url=url, confidence=confidence)
+        return self
+
+    def add(
+        self,
+        school_name: str | None,
+        triples: Iterable[Mapping[str, Any]],
+        *,
+        source_url: str,
+        confidence: float | None = None,
+    ) -> int:
+        """
+        한 페이지의 Triple들을 병합합니다.
+
+        Returns:
+            이 학교에 새로 생긴 고유 Triple 수
+        """
+        if not school_name:
+            return 0
+        merged = self._schools.setdefault(school_name, {})
+        added = 0
+        for item in triples:
+            head = str(item.get("head") or "").strip()
+            relation = str(item.get("relation") or "").strip()
+            tail = str(item.get("tail") or "").strip()
+            if not (head and relation and tail):
+                continue
+            key = triple_key(head, relation, tail)
+            triple = merged.get(key)
+            if triple is None:
+                triple = merged[key] = MergedTriple(head=head, relation=relation, tail=tail)
+                added += 1
+            triple.observe(source_url, item.get("confidence", 0.0) if confidence is None else confidence)
+        return added
+
+    def add_report(self, report: Mapping[str, Any]) -> int:
+        """`AutoTripleCollector`의 학교 리포트 1건(JSONL 1줄)을 병합합니다."""
+        added = 0
+        for page in report.get("triples") or []:
+            added += self.add(
+                report.get("school_name"),
+                page.get("entries") or [],
+                source_url=page.get("source_url") or "",
+            )
+        return added
+
+    def triples_for(self, school_name: str) -> List[MergedTriple]:
+        return list(self._schools.get(school_name, {}).values())
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        for school_name in sorted(self._schools):
+            triples = sorted(self._schools[school_name].values(), key=lambda t: t.key)
+            yield {
+                "school_name": school_name,
+                "triples": [triple.to_dict(self.aggregation) for triple in triples],
+            }
+
+    def save(self) -> Path:
+        """학교당 1줄 JSONL로 원자적으로 저장합니다."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            for record in self.iter_records():
+                fp.write(json.dumps(record, ensure_ascii=False))
+                fp.write("\n")
+        tmp_path.replace(self.path)
+        return self.path
@@ -1,17 +1,33 @@
 """URL 탐색기를 위한 서비스 모듈."""
 from __future__ import annotations
 
+import asyncio
+import heapq
+import logging
+import time
 from abc import ABC, abstractmethod
-from collections import deque
-from functools import lru_cache
-from typing import Iterable, List, Optional, Set
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from typing import Any, Coroutine, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from src.crawlers.link_extractor import iter_links
+from src.services.discovery_cache import DiscoveryCache
+from src.utils.host_scope import DEFAULT_SCOPE_POLICY, HostScope
+from src.utils.http_client import get_default_http_client
+from src.utils.url_canonicalizer import UrlCanonicalizer, get_default_canonicalizer
 
 DEFAULT_TARGET_KEYWORDS = ["career", "placement", "program", "academics"]
 UNSUPPORTED_EXTENSIONS = (".pdf", ".docx", ".ppt", ".pptx", ".xlsx")
+# 한 학교 서버에 동시에 보내는 요청 수와 요청 시작 간 최소 간격(초)
+DEFAULT_PER_HOST_CONCURRENCY = 2
+DEFAULT_MIN_HOST_DELAY = 0.25
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 class CrawlingStrategy(ABC):
@@ -21,6 +37,11 @@ class CrawlingStrategy(ABC):
     def search(self, base_url: str) -> Set[str]:
         ...
 
+    @property
+    def cache_key(self) -> str:
+        """탐색 결과 캐시 키에 들어갈 전략 식별자 (결과에 영향을 주는 설정을 포함)."""
+        return type(self).__name__
+
 
 class GoogleSearchStrategy(CrawlingStrategy):
     """Google Search API 연동 전략(구현 예정)."""
@@ -28,23 +49,91 @@ class GoogleSearchStrategy(CrawlingStrategy):
     def __init__(self, api_key: str):
         self.api_key = api_key
 
-    @lru_cache(maxsize=128)
     def search(self, base_url: str) -> Set[str]:
         raise NotImplementedError("Google Search integration is pending")
 
 
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """동기 API에서 코루틴을 실행합니다 (이미 이벤트 루프 안이면 별도 스레드에서 실행)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class _HostGate:
+    """호스트 하나에 대한 동시 요청 수 제한과 요청 시작 간 최소 간격."""
+
+    def __init__(self, concurrency: int, min_delay: float) -> None:
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.min_delay = min_delay
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self) -> None:
+        if self.min_delay <= 0:
+            return
+        async with self._lock:
+            delay = self._next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = time.monotonic() + self.min_delay
+
+
 class InternalLinkStrategy(CrawlingStrategy):
-    """내부 링크 탐색 중심의 기본 전략."""
+    """
+    내부 링크 탐색 중심의 기본 전략.
+
+    BFS 대신 점수가 높은 링크부터 여는 best-first 탐색을 합니다. 링크 점수는 URL 경로,
+    anchor 텍스트, 링크를 둘러싼 문단 텍스트의 키워드 적중 수에 가중치를 곱해 계산하며,
+    사이트당 페이지 예산(max_pages)을 다 쓰거나 충분한 대상(max_targets)을 찾으면 멈춥니다.
+
+    frontier 페이지는 전체 최대 `concurrency`개까지 동시에 요청하고(`asyncio.to_thread`),
+    하나가 끝날 때마다 그 시점의 최고 점수 링크를 다음으로 엽니다. 같은 호스트에는
+    `per_host_concurrency`개까지만 동시에 보내고, 요청 시작 사이에 `min_host_delay`초를 둡니다.
+
+    홈페이지가 다른 호스트로 redirect 되면 최종 호스트도 범위에 넣고(`HostScope`),
+    `host_scope="registered_domain"`(기본)이면 같은 등록 도메인의 형제 호스트도 따라갑니다.
+    discovery_cache가 있으면 학습한 최종 origin을 기록해 다음 탐색은 그 주소에서 바로 시작합니다.
+    """
+
+    URL_WEIGHT = 3.0
+    ANCHOR_WEIGHT = 2.0
+    CONTEXT_WEIGHT = 1.0
+    # 같은 점수라면 얕은 페이지를 먼저 엽니다.
+    DEPTH_PENALTY = 0.5
 
     def __init__(
         self,
         session: Optional[requests.Session] = None,
         max_depth: int = 2,
         target_keywords: Optional[Iterable[str]] = None,
+        max_pages: int = 25,
+        max_targets: int = 10,
+        concurrency: int = 4,
+        timeout: float = 30,
+        canonicalizer: Optional[UrlCanonicalizer] = None,
+        host_scope: str = DEFAULT_SCOPE_POLICY,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        min_host_delay: float = DEFAULT_MIN_HOST_DELAY,
     ):
-        self.session = session or requests.Session()
+        self.session = session or get_default_http_client().session
+        # visited/결과 URL은 정규화해서 비교하므로 `/programs/`, `?utm_*`, `#top` 등을 다시 요청하지 않습니다.
+        self.canonicalizer = canonicalizer or get_default_canonicalizer()
         self.max_depth = max_depth
         self.target_keywords = [kw.lower() for kw in (target_keywords or DEFAULT_TARGET_KEYWORDS)]
+        self.max_pages = max_pages
+        self.max_targets = max_targets
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = max(1, min(per_host_concurrency, self.concurrency))
+        self.min_host_delay = max(0.0, min_host_delay)
+        self.timeout = timeout
+        # 정책 이름을 여기서 검증해 잘못된 설정이 탐색 도중에야 드러나지 않게 합니다.
+        self.host_scope = HostScope.validate_policy(host_scope)
+        self.discovery_cache = discovery_cache
 
     def _is_keyword(self, url: str, anchor_text: str) -> bool:
         normalized_url = url.lower()
@@ -54,59 +143,165 @@ class InternalLinkStrategy(CrawlingStrategy):
             for keyword in self.target_keywords
         )
 
-    @lru_cache(maxsize=128)
+    def _keyword_hits(self, text: str) -> int:
+        text = text.lower()
+        return sum(1 for keyword in self.target_keywords if keyword in text)
+
+    def _score_link(self, url: str, anchor_text: str, context_text: str, depth: int) -> float:
+        return (
+            self.URL_WEIGHT * self._keyword_hits(urlparse(url).path)
+            + self.ANCHOR_WEIGHT * self._keyword_hits(anchor_text)
+            + self.CONTEXT_WEIGHT * self._keyword_hits(context_text)
+            - self.DEPTH_PENALTY * depth
+        )
+
+    @property
+    def cache_key(self) -> str:
+        keywords = ",".join(sorted(self.target_keywords))
+        return (
+            f"internal:depth={self.max_depth}:pages={self.max_pages}:"
+            f"targets={self.max_targets}:scope={self.host_scope}:keywords={keywords}"
+        )
+
     def search(self, base_url: str) -> Set[str]:
+        return _run_sync(self.search_async(base_url))
+
+    async def search_async(self, base_url: str) -> Set[str]:
+        urls, _ = await self.explore_async(base_url)
+        return urls
+
+    def explore(self, base_url: str) -> Tuple[Set[str], int]:
+        return _run_sync(self.explore_async(base_url))
+
+    async def explore_async(self, base_url: str) -> Tuple[Set[str], int]:
+        """
+        사이트 하나를 탐색해 (대상 URL 집합, 실제로 요청한 페이지 수)를 반환합니다.
+
+        페이지 수는 호출마다 지역 변수로 세므로, 같은 전략 인스턴스로 여러 학교를 동시에 탐색해도
+        학교별 예산과 집계가 섞이지 않습니다.
+        """
         parsed_base = urlparse(base_url)
         if not parsed_base.scheme or not parsed_base.netloc:
-            return set()
+            return set(), 0
 
-        queue = deque([(base_url, 0)])
-        visited = {base_url}
-        found_urls: Set[str] = set()
-        allowed_netloc = parsed_base.netloc
+        # 이전 탐색에서 redirect 최종 origin을 배웠으면 그 주소에서 바로 시작합니다.
+        known_origin = self.discovery_cache.origin_for(base_url) if self.discovery_cache is not None else None
+        start_url = known_origin or base_url
+        scope = HostScope.for_site(base_url, known_origin, policy=self.host_scope)
 
-        while queue:
-            current_url, current_depth = queue.popleft()
+        # (-score, 삽입 순서, url, depth): 점수가 같으면 먼저 발견한 링크가 우선합니다.
+        frontier: List[Tuple[float, int, str, int]] = [(0.0, 0, start_url, 0)]
+        sequence = count(1)
+        canonicalizer = self.canonicalizer
+        visited = {canonicalizer.dedupe_key(start_url)}
+        found_scores: Dict[str, float] = {}
+        host_gates: Dict[str, _HostGate] = {}
+        in_flight: Dict[asyncio.Task, int] = {}
+        pages_fetched = 0
 
-            try:
-                response = self.session.get(current_url, timeout=30)
-                response.raise_for_status()
-            except requests.exceptions.ConnectionError as exc:
-                if current_url == base_url:
-                    raise exc
-                continue
-            except requests.exceptions.RequestException:
-                continue
+        def _has_budget() -> bool:
+            return pages_fetched < self.max_pages and len(found_scores) < self.max_targets
 
-            soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            while True:
+                while frontier and _has_budget() and len(in_flight) < self.concurrency:
+                    _, _, url, depth = heapq.heappop(frontier)
+                    pages_fetched += 1
+                    host = urlparse(url).netloc
+                    gate = host_gates.get(host)
+                    if gate is None:
+                        gate = host_gates[host] = _HostGate(self.per_host_concurrency, self.min_host_delay)
+                    in_flight[asyncio.create_task(self._fetch(url, start_url, gate))] = depth
+                if not in_flight:
+                    break
 
-            for link in soup.find_all("a", href=True):
-                absolute_url = urljoin(current_url, link["href"])
-                parsed_link = urlparse(absolute_url)
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    current_depth = in_flight.pop(task)
+                    fetched = task.result()
+                    if fetched is None:
+                        continue
+                    current_url, final_url, html = fetched
+                    if current_depth == 0 and final_url != current_url:
+                        scope = self._learn_origin(base_url, final_url, scope)
+                    next_depth = current_depth + 1
+                    if next_depth > self.max_depth:
+                        continue
 
-                if parsed_link.scheme not in ("http", "https"):
-                    continue
-                if parsed_link.netloc != allowed_netloc:
-                    continue
+                    # 상대 링크는 redirect 이후의 실제 주소를 기준으로 풉니다.
+                    for link in iter_links(html, final_url):
+                        absolute_url = canonicalizer.canonicalize(link.url)
+                        parsed_link = urlparse(absolute_url)
 
-                next_depth = current_depth + 1
-                if next_depth > self.max_depth:
-                    continue
-                if absolute_url in visited:
-                    continue
+                        if parsed_link.scheme not in ("http", "https"):
+                            continue
+                        if not scope.contains(absolute_url):
+                            continue
+                        link_key = canonicalizer.dedupe_key(absolute_url)
+                        if link_key in visited:
+                            continue
 
-                visited.add(absolute_url)
+                        visited.add(link_key)
 
-                if absolute_url.lower().endswith(UNSUPPORTED_EXTENSIONS):
-                    continue
+                        if absolute_url.lower().endswith(UNSUPPORTED_EXTENSIONS):
+                            continue
 
-                if self._is_keyword(absolute_url, link.get_text("", strip=True)):
-                    found_urls.add(absolute_url)
-                    continue
+                        score = self._score_link(absolute_url, link.anchor_text, link.context_text, next_depth)
+                        if self._is_keyword(absolute_url, link.anchor_text):
+                            found_scores[absolute_url] = score
+                            continue
 
-                queue.append((absolute_url, next_depth))
+                        # max_depth 깊이의 페이지는 열어도 더 깊은(허용되지 않는) 링크만 나오므로 넣지 않습니다.
+                        if next_depth < self.max_depth:
+                            heapq.heappush(frontier, (-score, next(sequence), absolute_url, next_depth))
+                if len(found_scores) >= self.max_targets:
+                    break
+        finally:
+            # 목표를 채웠으면 남은 요청 결과는 기다리지 않습니다.
+            for task in in_flight:
+                task.cancel()
 
-        return found_urls
+        logger.debug(
+            "InternalLinkStrategy: %s pages=%d found=%d frontier_left=%d",
+            base_url,
+            pages_fetched,
+            len(found_scores),
+            len(frontier),
+        )
+        # 예산보다 많이 찾았으면 점수가 높은 대상만 남깁니다.
+        ranked = sorted(found_scores, key=found_scores.__getitem__, reverse=True)
+        return set(ranked[: self.max_targets]), pages_fetched
+
+    def _learn_origin(self, base_url: str, final_url: str, scope: HostScope) -> HostScope:
+        scope = scope.with_redirect(final_url)
+        if self.discovery_cache is not None:
+            self.discovery_cache.record_origin(base_url, final_url)
+        logger.debug("홈페이지 redirect 학습: %s -> %s (hosts=%s)", base_url, final_url, sorted(scope.hosts))
+        return scope
+
+    async def _fetch(
+        self, url: str, start_url: str, gate: _HostGate
+    ) -> Optional[Tuple[str, str, str]]:
+        """(요청 URL, redirect 최종 URL, HTML)을 반환합니다 (실패하면 None)."""
+        async with gate.semaphore:
+            await gate.wait_turn()
+            try:
+                response = await asyncio.to_thread(self.session.get, url, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.exceptions.ConnectionError as exc:
+                # 홈페이지 자체에 연결할 수 없으면 호출 측이 알 수 있도록 전파합니다.
+                if url == start_url:
+                    raise exc
+                return None
+            except requests.exceptions.RequestException:
+                return None
+        final_url = getattr(response, "url", None)
+        if not isinstance(final_url, str) or not final_url:
+            final_url = url
+        elif final_url != url:
+            # redirect를 기억해 두면 다른 페이지가 옛 주소로 링크해도 같은 URL로 정규화됩니다.
+            self.canonicalizer.add_redirect(url, final_url)
+        return url, final_url, response.text
 
 
 class UrlFinder:
@@ -117,18 +312,48 @@ class UrlFinder:
         strategies: Optional[List[CrawlingStrategy]] = None,
         google_api_key: Optional[str] = None,
         max_depth: int = 2,
+        session: Optional[requests.Session] = None,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        host_scope: str = DEFAULT_SCOPE_POLICY,
     ):
-        self.session = requests.Session()
+        # 주입하지 않으면 프로세스 공유 연결 풀을 사용합니다 (닫지 않음).
+        self.session = session or get_default_http_client().session
+        # 전략별 결과 캐시 (기본은 이 인스턴스 전용 메모리 캐시, 경로를 주면 실행 간 재사용)
+        self.discovery_cache = discovery_cache if discovery_cache is not None else DiscoveryCache()
         default_strategies: List[CrawlingStrategy] = strategies or [
-            InternalLinkStrategy(session=self.session, max_depth=max_depth)
+            InternalLinkStrategy(
+                session=self.session,
+                max_depth=max_depth,
+                host_scope=host_scope,
+                discovery_cache=self.discovery_cache,
+            )
         ]
         if google_api_key:
             default_strategies.append(GoogleSearchStrategy(google_api_key))
         self.strategies = default_strategies
 
     def find_target_urls(self, school_homepage_url: str) -> List[str]:
-        """대상 학교 홈페이지에서 타겟 URL 목록을 반환합니다."""
+        """대상 학교 홈페이지에서 타겟 URL 목록을 반환합니다 (전략들은 동시에 실행)."""
+        return _run_sync(self.find_target_urls_async(school_homepage_url))
+
+    async def find_target_urls_async(self, school_homepage_url: str) -> List[str]:
+        # 전략 하나라도 예외를 던지면 그대로 전파합니다 (예: Google API 키 오류).
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._search_cached, strategy, school_homepage_url) for strategy in self.strategies)
+        )
         found_urls: Set[str] = set()
-        for strategy in self.strategies:
-            found_urls |= strategy.search(school_homepage_url)
+        for urls in results:
+            found_urls |= urls
         return list(found_urls)
+
+    def invalidate(self, school_homepage_url: Optional[str] = None) -> int:
+        """학교 사이트가 바뀌었을 때 캐시된 탐색 결과를 지웁니다 (None이면 전체)."""
+        return self.discovery_cache.invalidate(school_homepage_url)
+
+    def _search_cached(self, strategy: CrawlingStrategy, school_homepage_url: str) -> Set[str]:
+        cached = self.discovery_cache.get(school_homepage_url, strategy.cache_key)
+        if cached is not None:
+            return cached
+        urls = strategy.search(school_homepage_url)
+        self.discovery_cache.put(school_homepage_url, strategy.cache_key, urls)
+        return urls
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 from typing import Any
 
+from src.crawlers.parse_pool import ParsePool
 from src.services.triple_extraction_service import TripleExtractionService
 from src.services.entity_resolution import NormalizedTriple
+from src.services.llm_usage import UsageStats
 
 
 class WebPageAnalyzer:
@@ -20,6 +22,7 @@ class WebPageAnalyzer:
         gemini_api_key: str | None = None,
         model_name: str = "gemini-2.0-flash",
         confidence_threshold: float = 0.8,
+        parse_pool: ParsePool | None = None,
     ) -> None:
         """
         WebPageAnalyzer 초기화.
@@ -28,11 +31,13 @@ class WebPageAnalyzer:
             gemini_api_key: Gemini API 키 (없으면 GEMINI_API_KEY 환경변수 사용)
             model_name: 사용할 Gemini 모델명
             confidence_threshold: 최소 Confidence 점수
+            parse_pool: HTML 파싱/청킹을 위임할 프로세스 풀 (선택)
         """
         self.triple_extractor = TripleExtractionService(
             api_key=gemini_api_key,
             model_name=model_name,
             confidence_threshold=confidence_threshold,
+            parse_pool=parse_pool,
         )
 
     def analyze_html(
@@ -40,6 +45,7 @@ class WebPageAnalyzer:
         html: str,
         school_name: str | None = None,
         source_url: str | None = None,
+        usage: UsageStats | None = None,
     ) -> dict[str, Any]:
         """
         HTML 콘텐츠를 분석하여 Triples를 추출합니다.
@@ -48,6 +54,7 @@ class WebPageAnalyzer:
             html: 분석할 HTML 문자열
             school_name: 학교명 (컨텍스트 제공용)
             source_url: 출처 URL (메타데이터용)
+            usage: LLM 호출 사용량을 누적할 집계 객체 (선택)
 
         Returns:
             분석 결과 딕셔너리:
@@ -71,6 +78,7 @@ class WebPageAnalyzer:
             html=html,
             school_name=school_name,
             source_url=source_url,
+            usage=usage,
         )
 
         return {
@@ -85,6 +93,7 @@ class WebPageAnalyzer:
         html: str,
         school_name: str | None = None,
         source_url: str | None = None,
+        usage: UsageStats | None = None,
     ) -> list[NormalizedTriple]:
         """
         HTML에서 Triples만 추출합니다 (간편 메서드).
@@ -93,9 +102,15 @@ class WebPageAnalyzer:
             html: 분석할 HTML 문자열
             school_name: 학교명
             source_url: 출처 URL
+            usage: LLM 호출 사용량을 누적할 집계 객체 (선택)
 
         Returns:
             정규화된 Triples 리스트
         """
-        result = self.analyze_html(html=html, school_name=school_name, source_url=source_url)
+        result = self.analyze_html(
+            html=html,
+            school_name=school_name,
+            source_url=source_url,
+            usage=usage,
+        )
         return result["triples"]
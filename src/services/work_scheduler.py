@@ -0,0 +1,135 @@
+"""
+비용 추정 기반 work-stealing 스케줄러.
+
+학교 목록을 받은 순서대로 스레드 풀에 넣으면 목록 끝에 있는 대형 대학 몇 곳이 마지막에 시작되어
+전체 실행 시간(makespan)의 꼬리를 늘립니다. `WorkStealingScheduler`는
+
+1. 작업을 예상 비용이 큰 순서로 정렬한 뒤(LPT), 누적 예상 비용이 가장 작은 워커 큐에 차례로 배정하고
+2. 각 워커는 자기 큐 앞(가장 비싼 작업)부터 처리하며
+3. 자기 큐가 비면 남은 예상 비용이 가장 큰 워커 큐의 뒤(가장 싼 작업)를 훔쳐 옵니다.
+
+추정이 틀려 한 워커가 늦어져도 다른 워커가 그 큐의 남은 작업을 가져가므로 유휴 워커가 생기지 않습니다.
+결과는 작업마다 `concurrent.futures.Future`로 돌려주므로 호출 측은 `as_completed`로 기다리면 됩니다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_Task = Tuple[float, Callable[..., Any], Any, Future]
+
+
+class WorkStealingScheduler:
+    """워커별 deque + 작업 훔치기로 예상 비용이 큰 작업부터 처리하는 스레드 풀."""
+
+    def __init__(self, max_workers: int, *, thread_name_prefix: str = "steal") -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers는 0보다 커야 합니다.")
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._queues: List[Deque[_Task]] = [deque() for _ in range(max_workers)]
+        # 워커 큐별 남은 예상 비용 (훔칠 대상 선택용)
+        self._remaining: List[float] = [0.0] * max_workers
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self.steals = 0
+
+    def __enter__(self) -> "WorkStealingScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def submit_all(
+        self,
+        fn: Callable[[Any], Any],
+        items: Sequence[Any],
+        costs: Sequence[float],
+    ) -> List[Future]:
+        """
+        작업 전체를 LPT 순서로 배정하고 워커를 시작합니다.
+
+        Args:
+            fn: 작업 하나를 처리할 함수 (`fn(item)`)
+            items: 작업 목록
+            costs: 작업별 예상 비용 (items와 같은 길이)
+
+        Returns:
+            items와 같은 순서의 Future 목록
+        """
+        if len(items) != len(costs):
+            raise ValueError("items와 costs의 길이가 같아야 합니다.")
+        if self._threads:
+            raise RuntimeError("submit_all은 한 번만 호출할 수 있습니다.")
+
+        futures: List[Future] = [Future() for _ in items]
+        order = sorted(range(len(items)), key=lambda index: costs[index], reverse=True)
+        # (누적 예상 비용, 워커 번호) 최소 힙: 비싼 작업부터 가장 한가한 워커에 배정 (greedy LPT)
+        loads = [(0.0, worker) for worker in range(self.max_workers)]
+        for index in order:
+            load, worker = heapq.heappop(loads)
+            cost = max(0.0, float(costs[index]))
+            self._queues[worker].append((cost, fn, items[index], futures[index]))
+            self._remaining[worker] += cost
+            heapq.heappush(loads, (load + cost, worker))
+
+        for worker in range(min(self.max_workers, len(items))):
+            thread = threading.Thread(
+                target=self._work,
+                args=(worker,),
+                name=f"{self.thread_name_prefix}-{worker}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+        return futures
+
+    def shutdown(self) -> None:
+        """모든 작업이 끝날 때까지 기다립니다."""
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"workers": len(self._threads), "steals": self.steals}
+
+    def _work(self, worker: int) -> None:
+        while True:
+            task = self._next_task(worker)
+            if task is None:
+                return
+            _, fn, item, future = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(item)
+            except BaseException as exc:  # Future로 호출 측에 전달
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def _next_task(self, worker: int) -> Optional[_Task]:
+        with self._lock:
+            own = self._queues[worker]
+            if own:
+                task = own.popleft()
+                self._remaining[worker] -= task[0]
+                return task
+            # 남은 예상 비용이 가장 큰 워커의 가장 싼 작업을 훔칩니다 (그 워커의 다음 작업은 건드리지 않음).
+            victims = [index for index, queue in enumerate(self._queues) if queue]
+            if not victims:
+                return None
+            victim = max(victims, key=lambda index: self._remaining[index])
+            task = self._queues[victim].pop()
+            self._remaining[victim] -= task[0]
+            self.steals += 1
+            logger.debug("워커 %d가 워커 %d의 작업을 가져옴", worker, victim)
+            return task
@@ -31,6 +31,11 @@ class Config:
     MAX_RETRY: int = int(os.getenv('MAX_RETRY', '3'))
     CRAWL_TIMEOUT: int = int(os.getenv('CRAWL_TIMEOUT', '30'))
     USER_AGENT: str = os.getenv('USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    HTTP_POOL_SIZE: int = int(os.getenv('HTTP_POOL_SIZE', '10'))
+
+    # Distributed Crawling (작업 큐: sqlite:///path 또는 postgresql://..., 비어 있으면 단일 프로세스 크롤링)
+    CRAWL_QUEUE_URL: str = os.getenv('CRAWL_QUEUE_URL', '')
+    CRAWL_LEASE_SECONDS: float = float(os.getenv('CRAWL_LEASE_SECONDS', '300'))
     
     # Logging
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
@@ -0,0 +1,128 @@
+"""
+링크 탐색의 호스트 범위(scope) 판정.
+
+홈페이지가 `occ.cccd.edu` → `www.occ.cccd.edu`처럼 다른 호스트로 redirect 되면 입력 URL의
+netloc과 정확히 같은 링크만 따라가는 방식으로는 내부 링크를 하나도 찾지 못합니다.
+`HostScope`는 시작 URL과 redirect 최종 URL의 호스트를 모두 허용하고, 정책에 따라
+같은 등록 도메인(`*.cccd.edu`)의 형제 호스트까지 범위에 넣습니다.
+
+정책:
+    - "exact": 시작/최종 호스트만 허용 (`www.` 유무는 같은 호스트로 취급)
+    - "registered_domain": 시작/최종 호스트의 등록 도메인 아래 모든 호스트 허용 (기본값)
+"""
+
+from __future__ import annotations
+
+import ipaddress
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+from urllib.parse import urlsplit
+
+SCOPE_POLICIES = ("exact", "registered_domain")
+DEFAULT_SCOPE_POLICY = "registered_domain"
+
+_US_STATES = (
+    "ak", "al", "ar", "az", "ca", "co", "ct", "dc", "de", "fl", "ga", "hi", "ia", "id", "il", "in", "ks",
+    "ky", "la", "ma", "md", "me", "mi", "mn", "mo", "ms", "mt", "nc", "nd", "ne", "nh", "nj", "nm", "nv",
+    "ny", "oh", "ok", "or", "pa", "ri", "sc", "sd", "tn", "tx", "ut", "va", "vt", "wa", "wi", "wv", "wy",
+)
+
+# 여러 라벨로 된 공용 접미사 (tldextract 의존성 없이 학교 사이트에 나오는 것만)
+# 미국 주 도메인: `<st>.us`, 학군 `k12.<st>.us`, 커뮤니티 칼리지 `cc.<st>.us`
+_MULTI_LABEL_SUFFIXES = frozenset(
+    {
+        "ac.jp", "ac.kr", "ac.nz", "ac.uk", "co.jp", "co.kr", "co.uk", "com.au", "com.cn",
+        "edu.au", "edu.cn", "edu.hk", "edu.sg", "edu.tw", "or.kr", "org.au", "org.uk",
+    }
+    | {f"{state}.us" for state in _US_STATES}
+    | {f"{kind}.{state}.us" for kind in ("k12", "cc") for state in _US_STATES}
+)
+
+
+def url_host(url: str) -> str:
+    """URL의 호스트 (소문자, 포트/끝 점 제거, 파싱 불가면 빈 문자열)."""
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+    return host.rstrip(".").lower()
+
+
+def _strip_www(host: str) -> str:
+    return host[4:] if host.startswith("www.") else host
+
+
+def registered_domain(host: str) -> str:
+    """
+    호스트의 등록 도메인 (`www.occ.cccd.edu` → `cccd.edu`, `www.ox.ac.uk` → `ox.ac.uk`,
+    `www.lausd.k12.ca.us` → `lausd.k12.ca.us`).
+
+    IP 주소나 라벨이 하나뿐인 호스트는 그대로 반환합니다.
+    """
+    host = host.rstrip(".").lower()
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return host
+    except ValueError:
+        pass
+    labels = [label for label in host.split(".") if label]
+    if len(labels) <= 2:
+        return ".".join(labels)
+    suffix_width = 1
+    for width in (3, 2):
+        if len(labels) > width and ".".join(labels[-width:]) in _MULTI_LABEL_SUFFIXES:
+            suffix_width = width
+            break
+    return ".".join(labels[-(suffix_width + 1):])
+
+
+@dataclass(frozen=True)
+class HostScope:
+    """탐색 범위에 드는 호스트 집합."""
+
+    policy: str
+    hosts: FrozenSet[str]
+    domains: FrozenSet[str]
+
+    @classmethod
+    def validate_policy(cls, policy: str) -> str:
+        """정책 이름을 검증해 그대로 돌려줍니다 (지원하지 않으면 ValueError)."""
+        if policy not in SCOPE_POLICIES:
+            raise ValueError(f"지원하지 않는 host scope 정책: {policy} (가능: {', '.join(SCOPE_POLICIES)})")
+        return policy
+
+    @classmethod
+    def for_site(
+        cls,
+        start_url: str,
+        final_url: Optional[str] = None,
+        *,
+        policy: str = DEFAULT_SCOPE_POLICY,
+    ) -> "HostScope":
+        cls.validate_policy(policy)
+        hosts = {url_host(url) for url in (start_url, final_url) if url}
+        hosts.discard("")
+        return cls(
+            policy=policy,
+            hosts=frozenset(_strip_www(host) for host in hosts),
+            domains=frozenset(registered_domain(host) for host in hosts),
+        )
+
+    def with_redirect(self, final_url: str) -> "HostScope":
+        """redirect 최종 URL의 호스트를 범위에 추가한 새 scope."""
+        host = url_host(final_url)
+        if not host or _strip_www(host) in self.hosts:
+            return self
+        return HostScope(
+            policy=self.policy,
+            hosts=self.hosts | {_strip_www(host)},
+            domains=self.domains | {registered_domain(host)},
+        )
+
+    def contains(self, url: str) -> bool:
+        host = url_host(url)
+        if not host:
+            return False
+        if _strip_www(host) in self.hosts:
+            return True
+        return self.policy == "registered_domain" and registered_domain(host) in self.domains
@@ -0,0 +1,155 @@
+"""
+공유 HTTP 연결 풀.
+
+학교마다 `requests.Session`을 새로 만들면 같은 호스트라도 매번 TCP/TLS 핸드셰이크를 다시 합니다.
+`PooledHttpClient`는 keep-alive 연결 풀을 가진 세션 하나를 만들어 크롤러/UrlFinder/Scorecard
+클라이언트에 주입할 수 있게 하고, 새로 연 연결 수와 재사용된 요청 수를 집계합니다.
+
+주입받은 세션은 소유자가 아니므로 사용하는 쪽에서 닫지 않습니다 (`PooledHttpClient.close()`만 닫음).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.utils.config import config
+
+# 풀에 캐시할 호스트 수의 하한 (워커 수가 적어도 홈페이지/하위 도메인이 여러 개일 수 있음)
+_MIN_HOST_POOLS = 16
+
+
+@dataclass(frozen=True)
+class HttpPoolStats:
+    """연결 재사용 통계 스냅샷."""
+
+    requests: int
+    connections_opened: int
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.connections_reused / self.requests if self.requests else 0.0
+
+    def since(self, earlier: "HttpPoolStats") -> "HttpPoolStats":
+        """earlier 스냅샷 이후에 늘어난 만큼의 통계 (공유 클라이언트에서 실행 한 번의 몫을 셀 때)."""
+        return HttpPoolStats(
+            requests=self.requests - earlier.requests,
+            connections_opened=self.connections_opened - earlier.connections_opened,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["connections_reused"] = self.connections_reused
+        data["reuse_ratio"] = round(self.reuse_ratio, 4)
+        return data
+
+
+class _PoolCounters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def request_sent(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def snapshot(self) -> HttpPoolStats:
+        with self._lock:
+            return HttpPoolStats(requests=self.requests, connections_opened=self.connections_opened)
+
+
+def _counting_pool(base: type, counters: _PoolCounters) -> type:
+    class _CountingPool(base):  # type: ignore[misc, valid-type]
+        def _new_conn(self):  # noqa: ANN202 - urllib3 내부 시그니처
+            counters.connection_opened()
+            return super()._new_conn()
+
+    _CountingPool.__name__ = f"Counting{base.__name__}"
+    return _CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """요청 수와 새 연결 수를 세는 HTTPAdapter."""
+
+    def __init__(self, counters: _PoolCounters, **kwargs: Any) -> None:
+        self._counters = counters
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._counters),
+            "https": _counting_pool(HTTPSConnectionPool, self._counters),
+        }
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        self._counters.request_sent()
+        return super().send(request, *args, **kwargs)
+
+
+class PooledHttpClient:
+    """워커 수에 맞춘 keep-alive 연결 풀을 가진 공유 세션."""
+
+    def __init__(
+        self,
+        pool_size: int = config.HTTP_POOL_SIZE,
+        *,
+        max_hosts: Optional[int] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            pool_size: 호스트당 유지할 연결 수 (보통 동시 워커 수)
+            max_hosts: 연결 풀을 유지할 호스트 수 (None이면 pool_size 기준으로 계산)
+            user_agent: 요청 User-Agent (None이면 config.USER_AGENT)
+        """
+        self.pool_size = max(1, int(pool_size))
+        self._counters = _PoolCounters()
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": user_agent or config.USER_AGENT})
+        adapter = _CountingAdapter(
+            self._counters,
+            pool_connections=max_hosts or max(_MIN_HOST_POOLS, self.pool_size * 4),
+            pool_maxsize=self.pool_size,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def stats(self) -> HttpPoolStats:
+        return self._counters.snapshot()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "PooledHttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+_default_client: Optional[PooledHttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_http_client() -> PooledHttpClient:
+    """프로세스 전역 공유 클라이언트 (세션을 주입받지 않은 컴포넌트의 기본값)."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = PooledHttpClient()
+        return _default_client
@@ -0,0 +1,159 @@
+"""
+URL 정규화(canonicalization).
+
+frontier/visited 집합과 캐시 키에 원본 절대 URL을 그대로 쓰면 `/programs`, `/programs/`,
+`/programs?utm_source=x`, `/Programs#top`, `http://` 와 `https://` 가 모두 다른 URL로 취급되어
+같은 페이지를 여러 번 요청합니다.
+
+- `canonicalize(url)`: 요청에 그대로 쓸 수 있는 정규화 URL
+  (scheme/host 소문자, 기본 포트·fragment·추적 파라미터 제거, 쿼리 정렬, 끝 슬래시 제거,
+  알려진 redirect alias 적용)
+- `dedupe_key(url)`: 중복 판정 키 (위에 더해 scheme과 path 대소문자 무시)
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset(
+    {
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "dclid",
+        "fbclid",
+        "gclid",
+        "gclsrc",
+        "hsctatracking",
+        "mc_cid",
+        "mc_eid",
+        "mkt_tok",
+        "msclkid",
+        "yclid",
+    }
+)
+# RFC 3986 unreserved 문자는 percent-encoding을 풀고, 나머지 escape는 대문자로 통일합니다.
+_PERCENT_RE = re.compile(r"%([0-9a-fA-F]{2})")
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+_MAX_ALIAS_HOPS = 5
+
+
+def _normalize_escapes(value: str) -> str:
+    def _replace(match: re.Match) -> str:
+        char = chr(int(match.group(1), 16))
+        return char if char in _UNRESERVED else f"%{match.group(1).upper()}"
+
+    return _PERCENT_RE.sub(_replace, value)
+
+
+class UrlCanonicalizer:
+    """URL 정규화 규칙과 학습한 redirect alias를 보관합니다 (thread-safe)."""
+
+    def __init__(
+        self,
+        *,
+        tracking_params: Iterable[str] = TRACKING_PARAMS,
+        tracking_prefixes: Iterable[str] = TRACKING_PARAM_PREFIXES,
+        strip_trailing_slash: bool = True,
+    ) -> None:
+        self.tracking_params = frozenset(param.lower() for param in tracking_params)
+        self.tracking_prefixes = tuple(prefix.lower() for prefix in tracking_prefixes)
+        self.strip_trailing_slash = strip_trailing_slash
+        self._aliases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def canonicalize(self, url: str) -> str:
+        """요청과 저장에 사용할 정규화 URL (http(s)가 아니면 입력을 그대로 반환)."""
+        normalized = self._normalize(url)
+        if normalized is None:
+            return url
+        with self._lock:
+            for _ in range(_MAX_ALIAS_HOPS):
+                target = self._aliases.get(self._key_of(normalized))
+                if target is None or target == normalized:
+                    break
+                normalized = target
+        return normalized
+
+    def dedupe_key(self, url: str, *, resolve_aliases: bool = True) -> str:
+        """
+        중복 판정 키: scheme(http/https)과 path 대소문자를 구분하지 않습니다.
+
+        resolve_aliases가 False면 학습한 redirect alias를 적용하지 않아, alias를 모르는
+        다른 프로세스에서도 같은 키가 나옵니다 (디스크에 저장하는 캐시 키용).
+        """
+        if resolve_aliases:
+            return self._key_of(self.canonicalize(url))
+        normalized = self._normalize(url)
+        return self._key_of(normalized if normalized is not None else url)
+
+    def add_redirect(self, source_url: str, target_url: str) -> None:
+        """`source_url`이 `target_url`로 redirect 됨을 기록합니다 (이후 source는 target으로 정규화)."""
+        source = self._normalize(source_url)
+        target = self._normalize(target_url)
+        if source is None or target is None or self._key_of(source) == self._key_of(target):
+            return
+        with self._lock:
+            self._aliases[self._key_of(source)] = target
+
+    def redirect_aliases(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._aliases)
+
+    def _normalize(self, url: str) -> Optional[str]:
+        try:
+            parts = urlsplit(url.strip())
+            port = parts.port
+        except ValueError:
+            return None
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            return None
+
+        host = parts.hostname.rstrip(".")
+        if ":" in host:  # IPv6
+            host = f"[{host}]"
+        netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+        if parts.username:
+            userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+            netloc = f"{userinfo}@{netloc}"
+
+        path = _normalize_escapes(parts.path) or "/"
+        if self.strip_trailing_slash and len(path) > 1:
+            path = path.rstrip("/") or "/"
+
+        query_pairs = [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not self._is_tracking(key)
+        ]
+        query = urlencode(sorted(query_pairs))
+        return urlunsplit((scheme, netloc, path, query, ""))
+
+    def _is_tracking(self, param: str) -> bool:
+        lowered = param.lower()
+        return lowered in self.tracking_params or lowered.startswith(self.tracking_prefixes)
+
+    @staticmethod
+    def _key_of(normalized: str) -> str:
+        parts = urlsplit(normalized)
+        return urlunsplit(("", parts.netloc, parts.path.lower(), parts.query, ""))
+
+
+_default_canonicalizer: Optional[UrlCanonicalizer] = None
+_default_canonicalizer_lock = threading.Lock()
+
+
+def get_default_canonicalizer() -> UrlCanonicalizer:
+    """프로세스 공유 정규화기 (한 컴포넌트가 학습한 redirect alias를 다른 컴포넌트도 사용)."""
+    global _default_canonicalizer
+    with _default_canonicalizer_lock:
+        if _default_canonicalizer is None:
+            _default_canonicalizer = UrlCanonicalizer()
+        return _default_canonicalizer
@@ -0,0 +1,75 @@
+"""
+스트리밍 링크 추출기 테스트.
+"""
+
+import pytest
+
+from src.crawlers.link_extractor import FEED_CHUNK_CHARS, iter_links
+
+
+@pytest.mark.unit
+def test_iter_links_resolves_urls_and_collects_text():
+    html = """
+    <ul>
+      <li>Explore our degree <b>programs</b>: <a href="/study?x=1&amp;y=2">Study <i>here</i></a></li>
+      <li><a href="https://other.edu/">Other</a> trailing</li>
+    </ul>
+    <script>var a = "<a href='/fake'>fake</a>";</script>
+    <a name="anchor-without-href">No href</a>
+    """
+
+    links = list(iter_links(html, "https://example.edu/home/"))
+
+    assert [link.url for link in links] == ["https://example.edu/study?x=1&y=2", "https://other.edu/"]
+    assert links[0].anchor_text == "Study here"
+    assert links[0].context_text == "Explore our degree programs: Study here"
+    assert links[1].context_text == "Other"
+
+
+@pytest.mark.unit
+def test_iter_links_handles_tags_split_across_chunks():
+    padding = "x" * (FEED_CHUNK_CHARS - 10)
+    html = f"<p>{padding}</p><a href='/career-outcomes'>Career Outcomes</a><a href='/unclosed'>Open"
+
+    links = list(iter_links(html, "https://example.edu"))
+
+    assert [link.url for link in links] == [
+        "https://example.edu/career-outcomes",
+        "https://example.edu/unclosed",
+    ]
+    assert links[1].anchor_text == "Open"
+
+
+@pytest.mark.unit
+def test_iter_links_skips_non_navigable_hrefs():
+    html = """
+    <a href="#top">Top</a><a href="mailto:a@b.edu">Mail</a><a href="JavaScript:void(0)">JS</a>
+    <a href="tel:123">Call</a><a href="">Empty</a><a href="ftp://files.edu/x">FTP</a>
+    <a href="//cdn.example.edu/page">Protocol relative</a><a href="programs">Programs</a>
+    """
+
+    urls = [link.url for link in iter_links(html, "https://example.edu/a/")]
+
+    assert urls == ["https://cdn.example.edu/page", "https://example.edu/a/programs"]
+
+
+@pytest.mark.unit
+def test_iter_links_stops_parsing_at_link_cap(monkeypatch):
+    """max_links에 도달하면 남은 청크는 parser에 넘기지 않습니다."""
+    from src.crawlers import link_extractor
+
+    fed = []
+    original_feed = link_extractor._LinkParser.feed
+
+    def _counting_feed(self, data):
+        fed.append(len(data))
+        return original_feed(self, data)
+
+    monkeypatch.setattr(link_extractor._LinkParser, "feed", _counting_feed)
+    html = "".join(f"<a href='/page/{i}'>Page {i}</a>" for i in range(20000))
+
+    links = list(iter_links(html, "https://example.edu", max_links=3, collect_context=False))
+
+    assert [link.url for link in links] == [f"https://example.edu/page/{i}" for i in range(3)]
+    assert links[0].context_text == links[0].anchor_text == "Page 0"
+    assert len(fed) == 1 < len(html) // FEED_CHUNK_CHARS
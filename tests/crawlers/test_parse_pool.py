@@ -0,0 +1,46 @@
+import pytest
+
+from src.crawlers.chunking import SemanticChunker
+from src.crawlers.parse_pool import ParsePool, chunk_html_compact
+
+PAGE_HTML = "<html><body>" + "".join(
+    f"<section><p>Program {index} prepares students for careers in nursing, welding and software. "
+    f"Graduates report strong placement outcomes at regional employers.</p></section>"
+    for index in range(80)
+) + "</body></html>"
+
+
+@pytest.mark.unit
+def test_compact_chunks_match_semantic_chunker():
+    expected = SemanticChunker().chunk_html(PAGE_HTML, chunk_size=300, overlap=50)
+
+    compact = chunk_html_compact(PAGE_HTML, 300, 50)
+
+    assert compact == [(chunk.text, chunk.start_pos, chunk.end_pos) for chunk in expected]
+
+
+@pytest.mark.unit
+def test_parse_pool_offloads_large_pages_to_worker_processes():
+    expected = SemanticChunker().chunk_html(PAGE_HTML, chunk_size=300, overlap=50)
+
+    with ParsePool(workers=1, min_offload_chars=1024) as pool:
+        chunks = pool.chunk_html(PAGE_HTML, chunk_size=300, overlap=50)
+        small = pool.chunk_html("<p>Short page about the welding program and its outcomes.</p>")
+        stats = pool.stats()
+
+    assert chunks == expected
+    assert small and small[0].text.startswith("Short page")
+    assert stats["offloaded"] == 1
+    assert stats["inline"] == 1
+
+
+@pytest.mark.unit
+def test_parse_pool_without_workers_parses_inline():
+    pool = ParsePool(workers=0, min_offload_chars=0)
+
+    chunks = pool.chunk_html(PAGE_HTML, chunk_size=300, overlap=50)
+
+    assert chunks == SemanticChunker().chunk_html(PAGE_HTML, chunk_size=300, overlap=50)
+    assert pool.stats() == {"workers": 0, "offloaded": 0, "inline": 1}
+    with pytest.raises(ValueError):
+        pool.chunk_html(PAGE_HTML, chunk_size=100, overlap=100)
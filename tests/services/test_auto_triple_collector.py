@@ -14,6 +14,7 @@ import pytest
 
 from src.services.auto_triple_collector import AutoTripleCollector
 from src.services.entity_resolution import NormalizedTriple
+from src.services.triple_store import SchoolTripleStore
 
 
 # ---------------------------------------------------------------------------
@@ -74,7 +75,7 @@ def test_init_with_gemini_key(mock_analyzer_cls, schools_file, output_file):
         gemini_api_key="fake-key",
     )
 
-    mock_analyzer_cls.assert_called_once_with(gemini_api_key="fake-key")
+    mock_analyzer_cls.assert_called_once_with(gemini_api_key="fake-key", parse_pool=None)
     assert collector.analyzer is not None
     assert len(collector.schools) == 2
 
@@ -169,6 +170,45 @@ def test_discover_candidate_urls_max_targets(mock_analyzer_cls, schools_file, ou
     assert len(urls) <= AutoTripleCollector.MAX_TARGETS
 
 
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_discover_candidate_urls_dedupes_url_variants(mock_analyzer_cls, schools_file, output_file):
+    """끝 슬래시/추적 파라미터/fragment 변형은 후보 하나로 합쳐져 슬롯을 낭비하지 않습니다."""
+    mock_analyzer_cls.return_value = MagicMock()
+    collector = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k")
+    html = """
+    <a href="/programs">Programs</a><a href="/programs/">Programs</a>
+    <a href="/Programs#top">Programs</a><a href="/programs?utm_source=nav">Programs</a>
+    <a href="/career-outcomes/">Career Outcomes</a>
+    """
+
+    urls = collector._discover_candidate_urls(html, "https://school.edu")
+
+    assert urls[:2] == ["https://school.edu/programs", "https://school.edu/career-outcomes"]
+    # 폴백 경로 /programs, /career-outcomes도 이미 있는 후보로 인식됩니다.
+    assert len(urls) == len({url.lower().rstrip("/") for url in urls}) == AutoTripleCollector.MAX_TARGETS
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_discover_candidate_urls_after_homepage_redirect(mock_analyzer_cls, schools_file, output_file):
+    """redirect 최종 호스트와 같은 등록 도메인의 링크를 후보로 인정합니다."""
+    mock_analyzer_cls.return_value = MagicMock()
+    collector = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k")
+    html = """
+    <a href="/career-services">Career Services</a>
+    <a href="https://counseling.cccd.edu/programs">Programs</a>
+    <a href="https://other.edu/programs">Other programs</a>
+    """
+
+    urls = collector._discover_candidate_urls(
+        html, "https://www.occ.cccd.edu/home", site_url="https://occ.cccd.edu"
+    )
+
+    assert urls[:2] == ["https://www.occ.cccd.edu/career-services", "https://counseling.cccd.edu/programs"]
+    assert not any("other.edu" in url for url in urls)
+
+
 # ---------------------------------------------------------------------------
 # Triple 직렬화 테스트
 # ---------------------------------------------------------------------------
@@ -427,3 +467,369 @@ def test_run_summary_counts_triples(mock_analyzer_cls, mock_crawler_cls, tmp_pat
 
     assert summary["schools_with_triples"] == 1
     assert summary["triples_collected"] > 0
+    # 실제로 가져온 페이지 수/바이트 (홈페이지 + 후보 페이지), JSONL 줄에는 넣지 않습니다.
+    assert summary["pages_fetched"] > 1
+    assert summary["bytes_fetched"] == len(SAMPLE_HTML.encode("utf-8")) + (summary["pages_fetched"] - 1) * len(
+        page_resp.text
+    )
+    assert "pages_fetched" not in json.loads(output_file.read_text(encoding="utf-8"))
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_run_merges_triples_across_pages(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """triple_store가 지정되면 페이지마다 반복된 Triple이 학교 단위로 병합됩니다."""
+    fake_triple = NormalizedTriple("School A", "OFFERS", "CS", 0.9)
+    mock_analyzer = MagicMock()
+    mock_analyzer.extract_triples.return_value = [fake_triple]
+    mock_analyzer_cls.return_value = mock_analyzer
+
+    homepage_resp = MagicMock()
+    homepage_resp.text = SAMPLE_HTML
+    page_resp = MagicMock()
+    page_resp.text = "<html><body>Program page</body></html>"
+
+    mock_crawler = MagicMock()
+    mock_crawler.__enter__ = lambda s: s
+    mock_crawler.__exit__ = MagicMock(return_value=False)
+    mock_crawler.fetch.side_effect = [homepage_resp] + [page_resp] * 20
+    mock_crawler.ssl_error_detected = False
+    mock_crawler.base_url = "https://schoola.edu"
+    mock_crawler_cls.return_value = mock_crawler
+
+    schools_file = _make_schools_json(tmp_path, [
+        {"name": "School A", "website": "https://schoola.edu"},
+    ])
+    merged_path = tmp_path / "merged.jsonl"
+    store = SchoolTripleStore(merged_path)
+
+    collector = AutoTripleCollector(
+        schools_file, output_path=tmp_path / "out.jsonl", gemini_api_key="k", triple_store=store
+    )
+    summary = collector.run()
+
+    assert summary["triples_collected"] > 1
+    assert summary["unique_triples"] == 1
+    record = json.loads(merged_path.read_text(encoding="utf-8"))
+    assert len(record["triples"][0]["sources"]) == summary["triples_collected"]
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_run_summary_aggregates_usage(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """페이지별 토큰 사용량이 학교 리포트와 summary["usage"]에 합산됩니다."""
+    fake_triple = NormalizedTriple("School A", "OFFERS", "CS", 0.9)
+
+    def _fake_extract(html, school_name, source_url, usage=None):
+        usage.record_call(
+            model_name="gemini-2.0-flash",
+            usage_metadata=MagicMock(
+                prompt_token_count=100,
+                candidates_token_count=20,
+                total_token_count=120,
+            ),
+            latency_ms=5.0,
+        )
+        return [fake_triple]
+
+    mock_analyzer = MagicMock()
+    mock_analyzer.extract_triples.side_effect = _fake_extract
+    mock_analyzer_cls.return_value = mock_analyzer
+
+    homepage_resp = MagicMock()
+    homepage_resp.text = SAMPLE_HTML
+    page_resp = MagicMock()
+    page_resp.text = "<html><body>Program page</body></html>"
+
+    mock_crawler = MagicMock()
+    mock_crawler.__enter__ = lambda s: s
+    mock_crawler.__exit__ = MagicMock(return_value=False)
+    mock_crawler.fetch.side_effect = [homepage_resp] + [page_resp] * 20
+    mock_crawler.ssl_error_detected = False
+    mock_crawler.base_url = "https://schoola.edu"
+    mock_crawler_cls.return_value = mock_crawler
+
+    schools_file = _make_schools_json(tmp_path, [
+        {"name": "School A", "website": "https://schoola.edu"},
+    ])
+    output_file = tmp_path / "out.jsonl"
+
+    collector = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k")
+    summary = collector.run()
+
+    report = json.loads(output_file.read_text(encoding="utf-8").strip())
+    pages = len(report["triples"])
+    assert pages > 0
+    assert report["triples"][0]["usage"]["total_tokens"] == 120
+    assert report["usage"]["calls"] == pages
+    assert summary["usage"]["prompt_tokens"] == 100 * pages
+    assert summary["usage"]["output_tokens"] == 20 * pages
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_deferred_mode_queues_pages_then_drains(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """deferred 모드에서는 크롤링 시 추출하지 않고, drain 단계에서 큐를 처리해 리포트를 씁니다."""
+    from src.services.extraction_queue import ExtractionQueue
+
+    fake_triple = NormalizedTriple("School A", "OFFERS", "CS", 0.9)
+    mock_analyzer = MagicMock()
+    mock_analyzer.extract_triples.return_value = [fake_triple]
+    mock_analyzer_cls.return_value = mock_analyzer
+
+    homepage_resp = MagicMock()
+    homepage_resp.text = SAMPLE_HTML
+    page_resp = MagicMock()
+    page_resp.text = "<html><body>Program page</body></html>"
+
+    mock_crawler = MagicMock()
+    mock_crawler.__enter__ = lambda s: s
+    mock_crawler.__exit__ = MagicMock(return_value=False)
+    mock_crawler.fetch.side_effect = [homepage_resp] + [page_resp] * 20
+    mock_crawler.ssl_error_detected = False
+    mock_crawler.base_url = "https://schoola.edu"
+    mock_crawler_cls.return_value = mock_crawler
+
+    schools_file = _make_schools_json(tmp_path, [
+        {"name": "School A", "website": "https://schoola.edu"},
+    ])
+    queue = ExtractionQueue(tmp_path / "queue.sqlite3")
+    collector = AutoTripleCollector(
+        schools_file,
+        output_path=tmp_path / "crawl.jsonl",
+        gemini_api_key="k",
+        extraction_queue=queue,
+    )
+
+    crawl_summary = collector.run()
+    assert crawl_summary["pages_queued"] > 0
+    assert crawl_summary["triples_collected"] == 0
+    mock_analyzer.extract_triples.assert_not_called()
+
+    output = tmp_path / "extracted.jsonl"
+    drain_summary = collector.drain_extraction_queue(workers=2, output_path=output)
+
+    assert drain_summary["pages_extracted"] == crawl_summary["pages_queued"]
+    assert drain_summary["triples_collected"] == crawl_summary["pages_queued"]
+    report = json.loads(output.read_text(encoding="utf-8").strip())
+    assert report["school_name"] == "School A"
+    assert report["triples"][0]["entries"][0]["tail"] == "CS"
+
+    # 재실행 시 done 항목은 다시 추출하지 않습니다.
+    mock_analyzer.extract_triples.reset_mock()
+    collector.drain_extraction_queue(workers=1, output_path=output)
+    mock_analyzer.extract_triples.assert_not_called()
+    queue.close()
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_drain_retries_failed_llm_calls_and_recovers_leased_items(mock_analyzer_cls, tmp_path):
+    """LLM 호출 실패는 queue.fail로 재시도되고, 이전 실행이 잡아 둔 항목은 시작 시 복구됩니다."""
+    from src.services.extraction_queue import ExtractionQueue
+
+    calls = {"n": 0}
+
+    def _extract(html, school_name=None, source_url=None, usage=None):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            usage.record_call(model_name=None, failed=True)  # 청크 호출 실패 (서비스가 삼킨 경우)
+            return []
+        if calls["n"] == 2:
+            raise RuntimeError("boom")
+        return [NormalizedTriple("School A", "OFFERS", "CS", 0.9)]
+
+    mock_analyzer = MagicMock()
+    mock_analyzer.extract_triples.side_effect = _extract
+    mock_analyzer_cls.return_value = mock_analyzer
+
+    schools_file = _make_schools_json(tmp_path, [{"name": "School A", "website": "https://schoola.edu"}])
+    queue = ExtractionQueue(tmp_path / "queue.sqlite3")
+    queue.enqueue("School A", "https://schoola.edu/programs", "<html>p</html>", website="https://schoola.edu")
+    assert queue.claim("dead-worker", limit=1)  # 이전 drain이 죽으며 processing으로 남은 항목
+
+    collector = AutoTripleCollector(
+        schools_file,
+        output_path=tmp_path / "crawl.jsonl",
+        gemini_api_key="k",
+        extraction_queue=queue,
+    )
+    summary = collector.drain_extraction_queue(workers=1, output_path=tmp_path / "out.jsonl", max_attempts=4)
+
+    assert summary["pages_failed"] == 2
+    assert summary["pages_extracted"] == 1
+    assert summary["triples_collected"] == 1
+    assert summary["queue"]["done"] == 1
+    queue.close()
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_parallel_run_matches_sequential_summary(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """workers>1이어도 모든 학교가 한 줄씩 기록되고 summary 형식이 같습니다."""
+    import threading
+    import time
+
+    mock_analyzer = MagicMock()
+    mock_analyzer.extract_triples.return_value = [NormalizedTriple("S", "OFFERS", "CS", 0.9)]
+    mock_analyzer_cls.return_value = mock_analyzer
+
+    active_by_domain: dict = {}
+    overlaps = []
+    lock = threading.Lock()
+
+    def _make_crawler(name, website, session=None):
+        domain = website.split("//")[1].split(".", 1)[1]
+        crawler = MagicMock()
+
+        def _enter(_self):
+            with lock:
+                active_by_domain[domain] = active_by_domain.get(domain, 0) + 1
+                if active_by_domain[domain] > 1:
+                    overlaps.append(domain)
+            time.sleep(0.01)
+            return crawler
+
+        def _exit(*_args):
+            with lock:
+                active_by_domain[domain] -= 1
+            return False
+
+        homepage = MagicMock()
+        homepage.text = SAMPLE_HTML
+        page = MagicMock()
+        page.text = "<html><body>Program page</body></html>"
+        crawler.__enter__ = _enter
+        crawler.__exit__ = _exit
+        crawler.fetch.side_effect = [homepage] + [page] * 20
+        crawler.ssl_error_detected = False
+        crawler.base_url = website
+        return crawler
+
+    mock_crawler_cls.side_effect = _make_crawler
+    schools = [
+        {"name": f"School {index}", "website": f"https://c{index}.district{index % 2}.edu"}
+        for index in range(6)
+    ]
+    schools_file = _make_schools_json(tmp_path, schools)
+
+    sequential = AutoTripleCollector(
+        schools_file, output_path=tmp_path / "seq.jsonl", gemini_api_key="k"
+    ).run()
+    parallel = AutoTripleCollector(
+        schools_file, output_path=tmp_path / "par.jsonl", gemini_api_key="k"
+    ).run(workers=4)
+
+    assert overlaps == []
+    assert parallel.keys() == sequential.keys()
+    assert parallel["schools_processed"] == sequential["schools_processed"] == 6
+    assert parallel["triples_collected"] == sequential["triples_collected"]
+    lines = (tmp_path / "par.jsonl").read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["school_name"] for line in lines) == sorted(s["name"] for s in schools)
+
+
+def _crawler_factory(interrupt_on: str | None = None, created: list | None = None):
+    """학교마다 새 mock 크롤러를 만들고, interrupt_on 학교에서 수집을 강제로 중단시킵니다."""
+
+    def _make_crawler(name, website, session=None):
+        if created is not None:
+            created.append(name)
+        if name == interrupt_on:
+            raise KeyboardInterrupt
+        homepage = MagicMock()
+        homepage.text = SAMPLE_HTML
+        page = MagicMock()
+        page.text = f"<html><body>{name} program page</body></html>"
+        crawler = MagicMock()
+        crawler.__enter__ = lambda s: s
+        crawler.__exit__ = MagicMock(return_value=False)
+        crawler.fetch.side_effect = [homepage] + [page] * 20
+        crawler.ssl_error_detected = False
+        crawler.base_url = website
+        return crawler
+
+    return _make_crawler
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_resume_skips_completed_schools_and_appends(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """중단 후 resume=True로 실행하면 완료된 학교는 건너뛰고 출력 파일에 이어 씁니다."""
+    mock_analyzer = MagicMock()
+    mock_analyzer.extract_triples.return_value = [NormalizedTriple("S", "OFFERS", "CS", 0.9)]
+    mock_analyzer_cls.return_value = mock_analyzer
+    schools_file = _make_schools_json(tmp_path, SAMPLE_SCHOOLS)
+    output_file = tmp_path / "out.jsonl"
+
+    mock_crawler_cls.side_effect = _crawler_factory(interrupt_on="MIT")
+    collector = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k")
+    with pytest.raises(KeyboardInterrupt):
+        collector.run()
+    # 체크포인트 기록 전에 죽은 것처럼 반쯤 쓰인 줄을 남깁니다.
+    with output_file.open("a", encoding="utf-8") as fp:
+        fp.write('{"school_name": "MIT", "tri')
+
+    created: list = []
+    mock_crawler_cls.side_effect = _crawler_factory(created=created)
+    resumed = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k")
+    assert resumed.can_resume() is True
+    summary = resumed.run(resume=True)
+
+    assert created == ["MIT"]
+    assert summary["schools_resumed"] == 1
+    assert summary["schools_with_triples"] == 2
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["school_name"] for line in lines] == ["Stanford University", "MIT"]
+    assert all("content_hashes" not in json.loads(line) for line in lines)
+    # 페이지별 본문 해시는 출력 JSONL이 아니라 체크포인트에 남습니다.
+    page_hashes = resumed.checkpoint.load().completed["MIT"]["content_hashes"]
+    assert page_hashes and all(len(value) == 64 for value in page_hashes.values())
+    assert resumed.can_resume() is False
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_can_resume_refuses_changed_schools_file_or_limit(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """학교 목록 파일 내용이나 limit이 바뀌면 끝나지 않은 체크포인트를 자동으로 이어 받지 않습니다."""
+    mock_analyzer_cls.return_value = MagicMock(extract_triples=MagicMock(return_value=[]))
+    schools_file = _make_schools_json(tmp_path, SAMPLE_SCHOOLS)
+    output_file = tmp_path / "out.jsonl"
+
+    mock_crawler_cls.side_effect = _crawler_factory(interrupt_on="MIT")
+    with pytest.raises(KeyboardInterrupt):
+        AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k").run()
+
+    collector = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k")
+    assert collector.can_resume() is True
+    assert collector.can_resume(limit=1) is False
+
+    _make_schools_json(tmp_path, SAMPLE_SCHOOLS + [{"name": "Caltech", "website": "https://caltech.edu"}])
+    assert AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k").can_resume() is False
+
+
+@pytest.mark.unit
+@patch("src.services.auto_triple_collector.SchoolCrawler")
+@patch("src.services.auto_triple_collector.WebPageAnalyzer")
+def test_run_without_resume_starts_fresh(mock_analyzer_cls, mock_crawler_cls, tmp_path):
+    """resume=False(--force)면 체크포인트가 있어도 모든 학교를 다시 수집합니다."""
+    mock_analyzer_cls.return_value = MagicMock(extract_triples=MagicMock(return_value=[]))
+    schools_file = _make_schools_json(tmp_path, SAMPLE_SCHOOLS)
+    output_file = tmp_path / "out.jsonl"
+
+    mock_crawler_cls.side_effect = _crawler_factory(interrupt_on="MIT")
+    with pytest.raises(KeyboardInterrupt):
+        AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k").run()
+
+    created: list = []
+    mock_crawler_cls.side_effect = _crawler_factory(created=created)
+    summary = AutoTripleCollector(schools_file, output_path=output_file, gemini_api_key="k").run()
+
+    assert created == ["Stanford University", "MIT"]
+    assert "schools_resumed" not in summary
+    assert len(output_file.read_text(encoding="utf-8").splitlines()) == 2
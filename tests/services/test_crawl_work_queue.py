@@ -0,0 +1,137 @@
+import threading
+
+import pytest
+
+from src.services.crawl_work_queue import CrawlWorkQueue, run_queue_worker
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _schools(*names_and_costs):
+    return [(f"https://{name}.edu", {"name": name, "website": f"https://{name}.edu"}, cost) for name, cost in names_and_costs]
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return tmp_path / "crawl_queue.sqlite3"
+
+
+@pytest.mark.unit
+def test_claims_most_expensive_first_and_never_twice(queue_path):
+    """여러 워커(각자 연결)가 동시에 claim해도 한 학교는 한 워커에게만 갑니다."""
+    producer = CrawlWorkQueue.sqlite(queue_path)
+    assert producer.enqueue(_schools(*((f"s{index}", float(index)) for index in range(40)))) == 40
+    assert producer.claim("probe")[0].school_key == "https://s39.edu"
+
+    claimed = []
+    claimed_lock = threading.Lock()
+
+    def _worker(worker_id: str) -> None:
+        queue = CrawlWorkQueue.sqlite(queue_path)
+        while True:
+            leases = queue.claim(worker_id, limit=2)
+            if not leases:
+                return
+            with claimed_lock:
+                claimed.extend(lease.school_key for lease in leases)
+
+    threads = [threading.Thread(target=_worker, args=(f"w{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(claimed) == len(set(claimed)) == 39
+    assert producer.stats()["leased"] == 40
+
+
+@pytest.mark.unit
+def test_expired_lease_is_requeued_until_max_attempts(queue_path):
+    """heartbeat가 끊긴 워커의 학교는 다른 워커가 다시 받고, 시도 한도를 넘기면 failed가 됩니다."""
+    clock = _Clock()
+    queue = CrawlWorkQueue.sqlite(queue_path, lease_seconds=60, max_attempts=2, clock=clock)
+    queue.enqueue(_schools(("alpha", 1.0)))
+
+    dead = queue.claim("dead-worker")[0]
+    clock.now += 30
+    assert queue.heartbeat(dead)  # 연장: 만료 시각 = 30 + 60
+    clock.now += 50
+    assert queue.claim("other") == []  # 아직 만료 전
+
+    clock.now += 30
+    retry = queue.claim("other")[0]
+    assert (retry.school_key, retry.attempts) == ("https://alpha.edu", 2)
+    assert not queue.heartbeat(dead)
+    assert not queue.complete(dead, {"late": True})  # lease를 잃은 워커의 완료는 무시
+
+    clock.now += 61
+    assert queue.claim("third") == []
+    assert queue.stats()["failed"] == 1
+
+
+@pytest.mark.unit
+def test_enqueue_requeues_finished_schools_only_when_asked(queue_path):
+    queue = CrawlWorkQueue.sqlite(queue_path)
+    queue.enqueue(_schools(("alpha", 1.0), ("beta", 2.0)))
+    beta = queue.claim("w1")[0]
+    queue.complete(beta, {"success": True})
+
+    assert queue.enqueue(_schools(("alpha", 1.0), ("beta", 2.0)), requeue_finished=False) == 0
+    assert queue.stats() == {"queued": 1, "leased": 0, "done": 1, "failed": 0}
+    assert queue.enqueue(_schools(("alpha", 1.0), ("beta", 2.0))) == 1  # 대기 중인 alpha는 그대로
+    assert queue.stats() == {"queued": 2, "leased": 0, "done": 0, "failed": 0}
+
+
+@pytest.mark.unit
+def test_run_queue_worker_completes_and_retries_failures(queue_path):
+    queue = CrawlWorkQueue.sqlite(queue_path, max_attempts=2)
+    queue.enqueue(_schools(("alpha", 1.0), ("broken", 2.0)))
+    processed = []
+
+    def _process(school):
+        processed.append(school["name"])
+        if school["name"] == "broken":
+            raise RuntimeError("boom")
+        return {"success": True}
+
+    summary = run_queue_worker(queue, _process, worker_id="w1")
+
+    assert summary == {"completed": 1, "failed": 2, "lost": 0}
+    assert processed == ["broken", "broken", "alpha"]
+    assert queue.stats() == {"queued": 0, "leased": 0, "done": 1, "failed": 1}
+
+
+@pytest.mark.unit
+def test_from_url_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        CrawlWorkQueue.from_url("redis://localhost/0")
+
+
+@pytest.mark.unit
+def test_crawl_worker_fails_unsuccessful_school_through_main_callback(queue_path, monkeypatch):
+    """main의 큐 콜백은 크롤링에 실패한 학교를 complete가 아닌 fail로 기록합니다."""
+    from unittest.mock import MagicMock
+
+    from src import main
+
+    monkeypatch.setattr(main, "crawl_single_school", MagicMock(return_value={"success": False}))
+    monkeypatch.setattr(main, "_record_crawl_audit", MagicMock())
+    monkeypatch.setattr(main, "_update_school_crawl_metadata", MagicMock())
+    skip_manager = MagicMock()
+    skip_manager.should_skip.return_value = (False, None)
+    monkeypatch.setattr(main, "failed_site_manager", skip_manager)
+
+    queue = CrawlWorkQueue.sqlite(queue_path, max_attempts=2)
+    queue.enqueue(_schools(("alpha", 1.0)))
+
+    summary = run_queue_worker(queue, main._crawl_queued_school, worker_id="w0")
+
+    assert summary == {"completed": 0, "failed": 2, "lost": 0}
+    assert main.crawl_single_school.call_count == 2
+    assert queue.stats()["failed"] == 1
@@ -1,5 +1,8 @@
 """CrawlingPipeline 실패 시나리오(RED) 테스트."""
 
+import itertools
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -83,3 +86,240 @@ def test_pipeline_warns_when_no_triples(mock_warning, schools_list, tmp_path):
     pipeline.run([schools_list[0]])
 
     assert mock_warning.called
+
+
+@pytest.mark.unit
+def test_pipeline_resumes_from_status_journal(schools_list, tmp_path):
+    """저널에 완료로 기록된 학교는 재시작 후 다시 처리하지 않습니다."""
+    status_path = tmp_path / "status.json"
+    url_finder = MagicMock()
+    url_finder.find_target_urls.return_value = ["https://alpha.edu/career"]
+    collector = MagicMock()
+    collector.run.return_value = {"triples_collected": 1}
+
+    first = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=MagicMock(return_value=collector),
+        status_path=status_path,
+        max_workers=1,
+    )
+    first._record_status(schools_list[0], "completed")  # 실행 도중 중단된 상황: 스냅샷 없이 저널만 존재
+    assert not status_path.exists()
+
+    collector_cls = MagicMock(return_value=collector)
+    second = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=collector_cls,
+        status_path=status_path,
+        max_workers=1,
+    )
+    second.run(schools_list)
+
+    assert collector_cls.call_count == 1
+    assert json.loads(status_path.read_text(encoding="utf-8")) == {
+        "https://alpha.edu": "completed",
+        "https://beta.edu": "completed",
+    }
+
+
+@pytest.mark.unit
+def test_pipeline_shares_parse_pool_with_collectors(schools_list, tmp_path):
+    """parse_workers를 지정하면 run() 동안 하나의 ParsePool을 collector에 넘기고 끝나면 닫습니다."""
+    url_finder = MagicMock()
+    url_finder.find_target_urls.return_value = ["https://alpha.edu/career"]
+    collector = MagicMock()
+    collector.run.return_value = {"triples_collected": 1}
+    collector_cls = MagicMock(return_value=collector)
+
+    pipeline = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=collector_cls,
+        status_path=tmp_path / "status.json",
+        max_workers=2,
+        parse_workers=2,
+    )
+    pipeline.run(schools_list)
+
+    pools = {id(call.kwargs["parse_pool"]) for call in collector_cls.call_args_list}
+    assert collector_cls.call_count == 2
+    assert len(pools) == 1
+    assert not collector_cls.call_args.kwargs["parse_pool"].enabled
+    assert pipeline._parse_pool is None
+
+
+@pytest.mark.unit
+def test_pipeline_starts_most_expensive_school_first(schools_list, tmp_path):
+    """이전 실행에서 오래 걸린 학교를 먼저 처리하고, 이번 실행의 비용을 다시 기록합니다."""
+    status_path = tmp_path / "status.json"
+    costs_path = tmp_path / "status.json.costs.json"
+    costs_path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "schools": {
+                    "https://alpha.edu": {"pages": 2, "bytes": 1000, "duration_s": 1.0},
+                    "https://beta.edu": {"pages": 30, "bytes": 900000, "duration_s": 120.0},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    url_finder = MagicMock()
+    url_finder.find_target_urls.side_effect = lambda homepage: [f"{homepage}/career"]
+    collector = MagicMock()
+    collector.run.return_value = {"triples_collected": 1, "pages_fetched": 3, "bytes_fetched": 2048}
+    collector_cls = MagicMock(return_value=collector)
+
+    pipeline = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=collector_cls,
+        status_path=status_path,
+        max_workers=1,
+    )
+    pipeline.run(schools_list)
+
+    started = [call.kwargs["school"]["name"] for call in collector_cls.call_args_list]
+    assert started == ["School Beta", "School Alpha"]
+    saved = json.loads(costs_path.read_text(encoding="utf-8"))["schools"]
+    assert saved["https://alpha.edu"]["pages"] == 3
+    assert saved["https://alpha.edu"]["bytes"] == 2048
+
+
+@pytest.mark.unit
+def test_pipeline_saves_costs_when_status_is_compacted(schools_list, tmp_path):
+    """상태 스냅샷을 압축할 때 비용 기록도 저장되어, 실행 도중 중단돼도 남습니다."""
+    costs_path = tmp_path / "status.json.costs.json"
+    seen_on_second_school = {}
+    url_finder = MagicMock()
+    url_finder.find_target_urls.side_effect = lambda homepage: [f"{homepage}/career"]
+
+    def _collector(school, candidate_urls, http_client=None):
+        collector = MagicMock()
+        if school["name"] == "School Beta":
+            seen_on_second_school.update(json.loads(costs_path.read_text(encoding="utf-8"))["schools"])
+        collector.run.return_value = {"triples_collected": 1, "pages_fetched": 3, "bytes_fetched": 2048}
+        return collector
+
+    pipeline = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=MagicMock(side_effect=_collector),
+        status_path=tmp_path / "status.json",
+        max_workers=1,
+        status_compact_every=1,
+        clock=itertools.count(step=5.0).__next__,
+    )
+    pipeline.run(schools_list)
+
+    assert seen_on_second_school["https://alpha.edu"]["bytes"] == 2048
+    assert seen_on_second_school["https://alpha.edu"]["duration_s"] == 5.0
+
+
+@pytest.mark.unit
+def test_pipelines_share_schools_through_work_queue(tmp_path):
+    """같은 작업 큐를 쓰는 두 파이프라인(노드)은 학교를 나눠 한 번씩만 처리합니다."""
+    from src.services.crawl_work_queue import CrawlWorkQueue
+
+    schools = [{"name": f"School {index}", "website": f"https://s{index}.edu"} for index in range(12)]
+    queue_path = tmp_path / "crawl_queue.sqlite3"
+    url_finder = MagicMock()
+    url_finder.find_target_urls.side_effect = lambda homepage: [f"{homepage}/career"]
+    collector = MagicMock()
+    collector.run.return_value = {"triples_collected": 1}
+    collector_classes = [MagicMock(return_value=collector), MagicMock(return_value=collector)]
+
+    pipelines = [
+        CrawlingPipeline(
+            url_finder=url_finder,
+            collector_cls=collector_cls,
+            status_path=tmp_path / f"node{index}" / "status.json",
+            max_workers=2,
+            work_queue=CrawlWorkQueue.sqlite(queue_path),
+        )
+        for index, collector_cls in enumerate(collector_classes)
+    ]
+    totals = []
+    threads = [threading.Thread(target=lambda p=pipeline: totals.append(p.run(schools))) for pipeline in pipelines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    processed = [call.kwargs["school"]["name"] for cls in collector_classes for call in cls.call_args_list]
+    assert sorted(processed) == sorted(school["name"] for school in schools)
+    assert sum(totals) == len(schools)
+    assert CrawlWorkQueue.sqlite(queue_path).stats()["done"] == len(schools)
+
+
+@pytest.mark.unit
+def test_queue_mode_fails_school_when_collector_raises(tmp_path):
+    """작업 큐 모드에서 collector가 실패한 학교는 done이 아닌 fail로 기록되고 다시 시도됩니다."""
+    from src.services.crawl_work_queue import CrawlWorkQueue
+
+    queue_path = tmp_path / "crawl_queue.sqlite3"
+    url_finder = MagicMock()
+    url_finder.find_target_urls.return_value = ["https://broken.edu/career"]
+    collector_cls = MagicMock(side_effect=RuntimeError("collector down"))
+
+    pipeline = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=collector_cls,
+        status_path=tmp_path / "status.json",
+        max_workers=1,
+        work_queue=CrawlWorkQueue.sqlite(queue_path, max_attempts=2),
+    )
+    total = pipeline.run([{"name": "Broken", "website": "https://broken.edu"}])
+
+    assert total == 0
+    assert collector_cls.call_count == 2
+    stats = CrawlWorkQueue.sqlite(queue_path).stats()
+    assert stats["failed"] == 1 and stats["done"] == 0
+
+
+@pytest.mark.unit
+def test_pipeline_shares_one_http_client_with_url_finder_and_collectors(schools_list, tmp_path):
+    """UrlFinder를 넘기지 않으면 파이프라인이 만든 연결 풀 하나를 UrlFinder와 collector가 함께 씁니다."""
+    collector = MagicMock()
+    collector.run.return_value = {"triples_collected": 1}
+    collector_cls = MagicMock(return_value=collector)
+
+    pipeline = CrawlingPipeline(
+        url_finder=None,
+        collector_cls=collector_cls,
+        status_path=tmp_path / "status.json",
+        max_workers=2,
+    )
+    assert pipeline.url_finder.session is pipeline.http_client.session
+
+    with patch.object(pipeline.url_finder, "find_target_urls", return_value=["https://alpha.edu/career"]), patch.object(
+        pipeline.http_client, "close"
+    ) as close:
+        pipeline.run(schools_list)
+
+    clients = {id(call.kwargs["http_client"]) for call in collector_cls.call_args_list}
+    assert collector_cls.call_count == 2
+    assert clients == {id(pipeline.http_client)}
+    # 파이프라인이 만든 풀은 run()이 끝나면 닫습니다.
+    close.assert_called_once()
+
+
+@pytest.mark.unit
+def test_pipeline_does_not_close_injected_http_client(schools_list, tmp_path):
+    """주입받은 연결 풀은 collector에 그대로 넘기고 run() 뒤에도 닫지 않습니다."""
+    http_client = MagicMock()
+    url_finder = MagicMock()
+    url_finder.find_target_urls.return_value = ["https://alpha.edu/career"]
+    collector = MagicMock()
+    collector.run.return_value = {"triples_collected": 1}
+    collector_cls = MagicMock(return_value=collector)
+
+    pipeline = CrawlingPipeline(
+        url_finder=url_finder,
+        collector_cls=collector_cls,
+        status_path=tmp_path / "status.json",
+        max_workers=1,
+        http_client=http_client,
+    )
+    pipeline.run(schools_list)
+
+    assert all(call.kwargs["http_client"] is http_client for call in collector_cls.call_args_list)
+    http_client.close.assert_not_called()
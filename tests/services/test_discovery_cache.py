@@ -0,0 +1,96 @@
+"""
+DiscoveryCache 단위 테스트.
+"""
+
+import pytest
+
+from src.services.discovery_cache import DiscoveryCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = DiscoveryCache(ttl_seconds=100, empty_ttl_seconds=10, clock=clock)
+    cache.put("https://a.edu", "internal", {"https://a.edu/programs"})
+    cache.put("https://b.edu", "internal", set())
+
+    clock.now += 50
+    assert cache.get("http://a.edu/", "internal") == {"https://a.edu/programs"}
+    assert cache.get("https://b.edu", "internal") is None  # 빈 결과는 짧게 보관
+    assert cache.get("https://a.edu", "other-config") is None
+
+    clock.now += 51
+    assert cache.get("https://a.edu", "internal") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_persists_between_instances_and_invalidates(tmp_path):
+    path = tmp_path / "discovery_cache.json"
+    first = DiscoveryCache(path)
+    first.put("https://a.edu", "internal", {"https://a.edu/careers"})
+    first.put("https://b.edu", "internal", {"https://b.edu/programs"})
+    first.close()
+
+    second = DiscoveryCache(path)
+    assert second.get("https://a.edu", "internal") == {"https://a.edu/careers"}
+
+    assert second.invalidate("https://a.edu/") == 1
+    assert DiscoveryCache(path).get("https://a.edu", "internal") is None
+    assert DiscoveryCache(path).get("https://b.edu", "internal") == {"https://b.edu/programs"}
+    assert second.invalidate() == 1
+    assert len(DiscoveryCache(path)) == 0
+
+
+@pytest.mark.unit
+def test_broken_cache_file_starts_empty(tmp_path):
+    path = tmp_path / "discovery_cache.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert len(DiscoveryCache(path)) == 0
+
+
+@pytest.mark.unit
+def test_homepage_key_ignores_redirect_aliases_learned_in_memory(tmp_path):
+    """redirect alias는 저장되지 않으므로, 다음 프로세스(새 정규화기)에서도 같은 키로 찾습니다."""
+    from src.utils.url_canonicalizer import UrlCanonicalizer
+
+    path = tmp_path / "discovery_cache.json"
+    canonicalizer = UrlCanonicalizer()
+    canonicalizer.add_redirect("https://occ.cccd.edu", "https://www.occ.cccd.edu/home")
+    with DiscoveryCache(path, canonicalizer=canonicalizer) as first:
+        first.put("https://occ.cccd.edu", "internal", {"https://www.occ.cccd.edu/programs"})
+
+    nightly = DiscoveryCache(path, canonicalizer=UrlCanonicalizer())
+    assert nightly.get("https://occ.cccd.edu/", "internal") == {"https://www.occ.cccd.edu/programs"}
+
+
+@pytest.mark.unit
+def test_writes_are_batched_until_flush_threshold_or_close(tmp_path):
+    clock = _Clock()
+    path = tmp_path / "discovery_cache.json"
+    cache = DiscoveryCache(path, clock=clock, flush_every=3, flush_interval_seconds=60)
+
+    cache.put("https://a.edu", "internal", {"https://a.edu/programs"})
+    cache.record_origin("https://b.edu", "https://www.b.edu/")
+    assert not path.exists()
+
+    cache.put("https://c.edu", "internal", set())
+    assert len(DiscoveryCache(path)) == 2  # 세 번째 변경에서 한 번에 저장
+
+    cache.put("https://d.edu", "internal", {"https://d.edu/careers"})
+    clock.now += 61
+    cache.put("https://e.edu", "internal", {"https://e.edu/careers"})  # 간격이 지나 바로 저장
+    assert len(DiscoveryCache(path)) == 4
+
+    cache.put("https://f.edu", "internal", {"https://f.edu/careers"})
+    cache.close()
+    assert len(DiscoveryCache(path)) == 5
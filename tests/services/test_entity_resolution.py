@@ -1,5 +1,10 @@
+import json
+import os
+from unittest.mock import MagicMock
+
 import pytest
 
+from src.services.alias_index import AliasIndex, AliasIndexRegistry
 from src.services.entity_resolution import EntityResolver
 from src.services.prompt_templates import Triple
 
@@ -34,3 +39,122 @@ def test_entity_resolver_normalize_triples_deduplicates():
     assert len(normalized) == 1
     assert normalized[0].head == "Massachusetts Institute of Technology"
     assert normalized[0].tail == "Computer Science"
+
+
+@pytest.mark.unit
+def test_entity_resolver_fuzzy_match_uses_same_cutoff():
+    resolver = EntityResolver()
+
+    # 오탈자 1글자는 기존 cutoff(0.93) 안에서 alias로 흡수됩니다.
+    assert resolver.normalize("Carnegie Melon University", "School") == "Carnegie Mellon University"
+    # cutoff 밖이면 fallback(Title Case)으로 떨어집니다.
+    assert resolver.normalize("robotics", "Program") == "Robotics"
+
+
+@pytest.mark.unit
+def test_fuzzy_index_matches_full_difflib_scan():
+    """trigram 색인 후보 + difflib 채점 결과가 전체 스캔 결과와 동일해야 합니다."""
+    import random
+    import string
+    from difflib import get_close_matches
+
+    from src.services.alias_index import _FuzzyKeyIndex
+
+    rng = random.Random(7)
+    words = ["college", "university", "community", "state", "santa", "valley", "data", "science"]
+    keys = sorted({
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 4))) for _ in range(400)
+    } | {"ab", "abc", "x"})
+    index = _FuzzyKeyIndex(keys)
+
+    def perturb(value: str) -> str:
+        chars = list(value)
+        for _ in range(rng.randint(0, 2)):
+            pos = rng.randrange(len(chars) + 1)
+            if rng.random() < 0.5 and chars:
+                chars.pop(min(pos, len(chars) - 1))
+            else:
+                chars.insert(pos, rng.choice(string.ascii_lowercase + " "))
+        return "".join(chars)
+
+    queries = [perturb(rng.choice(keys)) for _ in range(300)] + ["", "a", "abd", "zzzz"]
+    for query in queries:
+        expected = get_close_matches(query, keys, n=1, cutoff=0.93)
+        actual = index.best_match(query)
+        assert (expected[0] if expected else None) == actual, query
+
+
+@pytest.mark.unit
+def test_entity_resolver_memoizes_normalize_results(tmp_path):
+    registry = _registry_with(tmp_path, {"Machine Learning": ["ML"]})
+    resolver = EntityResolver(alias_registry=registry)
+    fuzzy = registry.current().fuzzy
+    fuzzy.best_match = MagicMock(wraps=fuzzy.best_match)
+
+    first = resolver.normalize("Some Unknown Program", "Program")
+    second = resolver.normalize("Some Unknown Program", "Program")
+
+    assert first == second == "Some Unknown Program"
+    assert fuzzy.best_match.call_count == 1
+
+
+def _registry_with(tmp_path, aliases, version="1"):
+    path = tmp_path / "aliases.json"
+    path.write_text(json.dumps({"version": version, "aliases": aliases}), encoding="utf-8")
+    return AliasIndexRegistry([path], check_interval=0)
+
+
+def _touch_later(path):
+    # 파일시스템 mtime 해상도와 무관하게 변경이 감지되도록 mtime을 1초 뒤로 옮깁니다.
+    later = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(later, later))
+
+
+@pytest.mark.unit
+def test_alias_registry_hot_reloads_changed_file(tmp_path):
+    registry = _registry_with(tmp_path, {"Machine Learning": ["ML"]})
+    resolver = EntityResolver(alias_registry=registry)
+    before = registry.current()
+    assert resolver.normalize("ML", "Skill") == "Machine Learning"
+    assert resolver.normalize("DL", "Skill") == "Dl"
+
+    path = tmp_path / "aliases.json"
+    path.write_text(
+        json.dumps({"version": "2", "aliases": {"Deep Learning": ["DL"]}}), encoding="utf-8"
+    )
+    _touch_later(path)
+
+    assert resolver.normalize("DL", "Skill") == "Deep Learning"
+    assert registry.current() is not before
+    assert registry.current().version == "aliases.json@2"
+
+
+@pytest.mark.unit
+def test_alias_registry_keeps_index_on_broken_file(tmp_path):
+    registry = _registry_with(tmp_path, {"Machine Learning": ["ML"]})
+    before = registry.current()
+    path = tmp_path / "aliases.json"
+    path.write_text("{broken", encoding="utf-8")
+    _touch_later(path)
+
+    assert registry.reload_if_changed() is False
+    assert registry.current() is before
+
+
+@pytest.mark.unit
+def test_alias_index_prefers_earlier_source_and_canonical_keys():
+    index = AliasIndex.build(
+        [
+            {"Machine Learning": ["ML"]},
+            {"Markup Language": ["ML", "Machine Learning"]},
+        ]
+    )
+
+    assert index.alias_to_canonical["ml"] == "Machine Learning"
+    assert index.alias_to_canonical["machine learning"] == "Machine Learning"
+    assert index.alias_to_canonical["markup language"] == "Markup Language"
+
+
+@pytest.mark.unit
+def test_entity_resolvers_share_default_index():
+    assert EntityResolver().alias_index is EntityResolver().alias_index
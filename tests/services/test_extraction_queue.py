@@ -0,0 +1,66 @@
+"""ExtractionQueue(지연 추출 큐) 테스트."""
+
+import pytest
+
+from src.services.extraction_queue import ExtractionQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = ExtractionQueue(tmp_path / "queue.sqlite3")
+    yield q
+    q.close()
+
+
+@pytest.mark.unit
+def test_enqueue_deduplicates_same_url_and_content(queue):
+    assert queue.enqueue("School A", "https://a.edu/careers", "<p>v1</p>") is True
+    assert queue.enqueue("School A", "https://a.edu/careers", "<p>v1</p>") is False
+    # 내용이 바뀌면 새 작업으로 적재
+    assert queue.enqueue("School A", "https://a.edu/careers", "<p>v2</p>") is True
+    assert queue.stats()["pending"] == 2
+
+
+@pytest.mark.unit
+def test_claim_complete_and_iter_results(queue):
+    queue.enqueue("School A", "https://a.edu/careers", "<p>careers</p>", website="https://a.edu")
+
+    items = queue.claim("w1", limit=5)
+    assert len(items) == 1
+    assert items[0].html == "<p>careers</p>"
+    assert queue.claim("w2") == []  # 이미 claim된 항목은 다시 나가지 않음
+
+    queue.complete(items[0].id, [{"head": "A", "relation": "OFFERS", "tail": "B", "confidence": 0.9}])
+
+    results = list(queue.iter_results())
+    assert results[0]["entries"][0]["tail"] == "B"
+    assert queue.stats()["done"] == 1
+
+
+@pytest.mark.unit
+def test_fail_requeues_until_max_attempts(queue):
+    queue.enqueue("School A", "https://a.edu/x", "<p>x</p>")
+
+    item = queue.claim("w1")[0]
+    queue.fail(item.id, "boom", max_attempts=2)
+    assert queue.stats()["pending"] == 1
+
+    item = queue.claim("w1")[0]
+    assert item.attempts == 2
+    queue.fail(item.id, "boom", max_attempts=2)
+    assert queue.stats()["failed"] == 1
+
+
+@pytest.mark.unit
+def test_requeue_stale_and_survives_reopen(tmp_path):
+    path = tmp_path / "queue.sqlite3"
+    first = ExtractionQueue(path)
+    first.enqueue("School A", "https://a.edu/x", "<p>x</p>")
+    first.claim("dead-worker")
+    first.close()
+
+    reopened = ExtractionQueue(path)
+    assert reopened.stats()["processing"] == 1
+    assert reopened.requeue_stale(older_than_seconds=0) == 1
+    assert len(reopened.claim("w2")) == 1
+    reopened.close()
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from src.services.entity_resolution import NormalizedTriple
+from src.services.graph_index import GraphIndex
+
+
+def _sample_index():
+    triples = [
+        NormalizedTriple("School A", "LOCATED_IN", "California", 0.95),
+        NormalizedTriple("School B", "LOCATED_IN", "Texas", 0.95),
+        NormalizedTriple("School A", "OFFERS", "Data Science", 0.9),
+        NormalizedTriple("School B", "OFFERS", "Data Science", 0.9),
+        NormalizedTriple("School A", "OFFERS", "Nursing", 0.85),
+        NormalizedTriple("Data Science", "LEADS_TO", "Data Scientist", 0.9),
+        NormalizedTriple("Nursing", "LEADS_TO", "Registered Nurse", 0.9),
+        NormalizedTriple("Data Science", "DEVELOPS", "Python", 0.6),
+        # 중복 간선은 max confidence로 병합
+        NormalizedTriple("School A", "OFFERS", "Data Science", 0.7),
+    ]
+    return GraphIndex.from_triples(triples)
+
+
+@pytest.mark.unit
+def test_neighbors_and_dedupe():
+    index = _sample_index()
+
+    assert len(index) == 8
+    offers = index.neighbors("School A", "OFFERS")
+    assert {name for name, _, _ in offers} == {"Data Science", "Nursing"}
+    assert dict((name, conf) for name, _, conf in offers)["Data Science"] == pytest.approx(0.9)
+    assert {name for name, _, _ in index.neighbors("Data Science", "OFFERS", direction="in")} == {
+        "School A",
+        "School B",
+    }
+    assert index.neighbors("Unknown") == []
+
+
+@pytest.mark.unit
+def test_traverse_answers_multi_hop_question():
+    index = _sample_index()
+
+    schools_in_ca = index.traverse(["California"], [("LOCATED_IN", "in")])
+    programs = index.traverse(schools_in_ca, [("OFFERS", "out")])
+    leading = index.traverse(["Data Scientist"], [("LEADS_TO", "in")])
+
+    assert programs & leading == {"Data Science"}
+
+
+@pytest.mark.unit
+def test_neighborhood_hops_and_confidence_filter():
+    index = _sample_index()
+
+    hood = index.neighborhood("Data Science", hops=1)
+    assert hood == {"School A": 1, "School B": 1, "Data Scientist": 1, "Python": 1}
+    assert "Python" not in index.neighborhood("Data Science", hops=1, min_confidence=0.8)
+    assert index.neighborhood("School A", hops=2, direction="out")["Data Scientist"] == 2
+
+
+@pytest.mark.unit
+def test_find_paths_preserves_edge_direction():
+    index = _sample_index()
+
+    paths = index.find_paths("School B", "Nursing", max_hops=3)
+
+    assert paths
+    shortest = paths[0]
+    assert [(t.head, t.relation, t.tail) for t in shortest] == [
+        ("School B", "OFFERS", "Data Science"),
+        ("School A", "OFFERS", "Data Science"),
+        ("School A", "OFFERS", "Nursing"),
+    ]
+    assert index.find_paths("School B", "Nursing", max_hops=2) == []
+
+
+@pytest.mark.unit
+def test_filter_triples():
+    index = _sample_index()
+
+    result = {(t.head, t.tail) for t in index.filter_triples("LEADS_TO", min_confidence=0.5)}
+    assert result == {("Data Science", "Data Scientist"), ("Nursing", "Registered Nurse")}
+    assert [t.tail for t in index.filter_triples(head="Data Science", relation="DEVELOPS")] == ["Python"]
+    assert list(index.filter_triples(tail="Nowhere")) == []
+
+
+@pytest.mark.unit
+def test_from_jsonl_reads_collector_and_merged_formats(tmp_path):
+    path = tmp_path / "triples.jsonl"
+    lines = [
+        {
+            "school_name": "School A",
+            "triples": [
+                {
+                    "source_url": "https://a.edu",
+                    "entries": [{"head": "School A", "relation": "offers", "tail": "Nursing", "confidence": 0.9}],
+                }
+            ],
+        },
+        {
+            "school_name": "School B",
+            "triples": [{"head": "School B", "relation": "PARTNERS_WITH", "tail": "Google", "confidence": 0.8}],
+        },
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+
+    index = GraphIndex.from_jsonl(path)
+
+    assert index.entity_count == 4
+    assert index.neighbors("School A", "OFFERS")[0][0] == "Nursing"
+    assert index.neighbors("Google", direction="in")[0][:2] == ("School B", "PARTNERS_WITH")
@@ -0,0 +1,58 @@
+"""
+HarvestCheckpoint 단위 테스트.
+"""
+
+import pytest
+
+from src.services.harvest_checkpoint import HarvestCheckpoint, report_line
+
+
+def _report(name: str, *, skipped: bool = False, count: int = 2) -> dict:
+    return {
+        "school_name": name,
+        "website": f"https://{name.lower()}.edu",
+        "triples": [] if skipped else [{"source_url": "https://x.edu/p", "count": count, "entries": []}],
+        "routing": {"skipped": True, "reason": "홈페이지 응답 없음"} if skipped else {},
+        "usage": {"calls": 1},
+    }
+
+
+@pytest.mark.unit
+def test_record_and_reload(tmp_path):
+    checkpoint = HarvestCheckpoint.for_output(tmp_path / "auto.jsonl")
+    checkpoint.reset({"schools_file": "/data/schools.json", "schools_sha256": "abc", "limit": None})
+    report = _report("Alpha")
+    checkpoint.record(report, line=report_line(report), content_hashes={"https://x.edu/p": "abc"})
+    with checkpoint.path.open("a", encoding="utf-8") as fp:
+        fp.write('{"school_name": "Bet')  # 쓰다 만 마지막 줄
+
+    loaded = HarvestCheckpoint(checkpoint.path).load()
+
+    assert checkpoint.path.name == "auto.jsonl.checkpoint.jsonl"
+    assert loaded.is_done("Alpha") and not loaded.is_done("Beta")
+    assert loaded.completed["Alpha"]["triples"] == 2
+    assert loaded.completed["Alpha"]["content_hashes"] == {"https://x.edu/p": "abc"}
+    assert loaded.matches({"schools_file": "/data/schools.json", "schools_sha256": "abc", "limit": None})
+    assert not loaded.matches({"schools_file": "/data/schools.json", "schools_sha256": "abc", "limit": 10})
+    assert loaded.run_completed is False
+    loaded.mark_run_completed()
+    assert HarvestCheckpoint(checkpoint.path).load().run_completed is True
+
+
+@pytest.mark.unit
+def test_repair_output_keeps_only_checkpointed_lines(tmp_path):
+    output = tmp_path / "auto.jsonl"
+    checkpoint = HarvestCheckpoint.for_output(output)
+    checkpoint.reset()
+    done, skipped, unrecorded = _report("Alpha"), _report("Beta", skipped=True), _report("Gamma")
+    lines = [report_line(done), report_line(skipped), report_line(unrecorded)]
+    output.write_text("\n".join(lines) + '\n{"partial', encoding="utf-8")
+    checkpoint.record(done, line=lines[0], content_hashes={})
+    checkpoint.record(skipped, line=lines[1], content_hashes={})
+
+    removed = checkpoint.repair_output(output)
+
+    # 건너뛴 학교는 재개 시 다시 수집하므로 출력에서도 제거됩니다.
+    assert removed == 3
+    assert output.read_text(encoding="utf-8") == lines[0] + "\n"
+    assert not checkpoint.is_done("Beta")
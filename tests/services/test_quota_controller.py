@@ -0,0 +1,99 @@
+"""QuotaController 전역 백오프 테스트."""
+
+import threading
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from src.services.quota_controller import (
+    QuotaController,
+    is_rate_limit_error,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """sleep 호출 시 시간이 흐르는 가짜 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+def test_rate_limit_error_detection():
+    assert is_rate_limit_error(google_exceptions.ResourceExhausted("quota"))
+    assert is_rate_limit_error(google_exceptions.TooManyRequests("slow down"))
+    response_error = Exception("Too Many Requests")
+    response_error.response = type("Response", (), {"status_code": 429})()
+    assert is_rate_limit_error(response_error)
+    assert not is_rate_limit_error(Exception("500 Internal error"))
+    # 메시지에 "quota"/"429"가 들어 있어도 상태 코드가 429가 아니면 rate limit이 아닙니다.
+    assert not is_rate_limit_error(google_exceptions.InvalidArgument("quota project 429 not found"))
+    assert not is_rate_limit_error(ValueError("chunk 429 exceeds quota of tokens"))
+    assert parse_retry_after(Exception("Please retry in 17.5s.")) == 17.5
+    assert parse_retry_after(Exception("boom")) is None
+
+
+@pytest.mark.unit
+def test_wait_blocks_until_global_pause_ends():
+    clock = FakeClock()
+    controller = QuotaController(base_delay=2.0, jitter=0.0, clock=clock, sleep=clock.sleep)
+
+    controller.report_rate_limited()
+    waited = controller.wait()
+
+    assert waited == pytest.approx(2.0)
+    assert controller.wait() == 0.0
+
+
+@pytest.mark.unit
+def test_backoff_escalates_only_across_waves():
+    """같은 일시정지 구간 안의 429는 백오프 단계를 올리지 않습니다."""
+    clock = FakeClock()
+    controller = QuotaController(base_delay=2.0, max_delay=10.0, jitter=0.0, clock=clock, sleep=clock.sleep)
+
+    assert controller.report_rate_limited() == pytest.approx(2.0)
+    assert controller.report_rate_limited() == pytest.approx(2.0)  # 같은 파도
+
+    controller.wait()
+    assert controller.report_rate_limited() == pytest.approx(4.0)
+    controller.wait()
+    assert controller.report_rate_limited() == pytest.approx(8.0)
+    controller.wait()
+    assert controller.report_rate_limited() == pytest.approx(10.0)  # max_delay 상한
+
+    controller.wait()
+    controller.report_success()
+    assert controller.report_rate_limited() == pytest.approx(2.0)
+
+
+@pytest.mark.unit
+def test_retry_after_hint_extends_pause():
+    clock = FakeClock()
+    controller = QuotaController(base_delay=2.0, jitter=0.0, clock=clock, sleep=clock.sleep)
+
+    assert controller.report_rate_limited(retry_after=30.0) == pytest.approx(30.0)
+
+
+@pytest.mark.unit
+def test_pause_is_shared_across_threads():
+    controller = QuotaController(base_delay=0.05, jitter=0.0)
+    controller.report_rate_limited()
+    waited: list[float] = []
+
+    threads = [threading.Thread(target=lambda: waited.append(controller.wait())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(waited) == 4
+    assert all(value > 0 for value in waited)
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from src.integrations.college_scorecard_client import ScorecardStats
+from src.services.alias_index import AliasIndex
+from src.services.school_alias_generator import (
+    SchoolNameRecord,
+    abbreviation,
+    aliases_needing_check,
+    build_school_alias_table,
+    conflicts_with_scorecard,
+    generate_school_aliases,
+    load_seed_records,
+    write_alias_file,
+)
+
+
+@pytest.mark.unit
+def test_generate_school_aliases_covers_common_variants():
+    aliases = generate_school_aliases("Orange Coast College", "Community College")
+    assert {"OCC", "Orange Coast Community College", "College of Orange Coast"} <= aliases
+
+    assert "Alvin College" in generate_school_aliases("Alvin Community College")
+    assert "Marin College" in generate_school_aliases("College of Marin")
+    assert "Mount San Antonio College" in generate_school_aliases("Mt. San Antonio College")
+    assert abbreviation("University of California, Los Angeles") == "UCLA"
+    assert abbreviation("Hill College") is None
+
+
+@pytest.mark.unit
+def test_build_school_alias_table_drops_ambiguous_aliases():
+    table = build_school_alias_table(
+        [
+            SchoolNameRecord("Cedar Valley College"),
+            SchoolNameRecord("Central Valley College"),
+            SchoolNameRecord("Austin Community College"),
+            SchoolNameRecord("Austin College"),
+        ]
+    )
+
+    # 두 학교 모두 "CVC"가 되므로 어느 쪽에도 넣지 않습니다.
+    assert "CVC" not in table["Cedar Valley College"]
+    assert "CVC" not in table["Central Valley College"]
+    # 다른 학교의 canonical 이름은 alias로 쓰지 않습니다.
+    assert "Austin College" not in table["Austin Community College"]
+
+
+@pytest.mark.unit
+def test_build_school_alias_table_includes_scorecard_names():
+    table = build_school_alias_table(
+        [
+            SchoolNameRecord(
+                "Mt. San Antonio College",
+                scorecard_name="Mt San Antonio College",
+                scorecard_aliases=("Mt. SAC", "Mt SAC"),
+            )
+        ]
+    )
+
+    index = AliasIndex.build([table])
+    assert index.alias_to_canonical["mt sac"] == "Mt. San Antonio College"
+
+
+@pytest.mark.unit
+def test_generated_alias_file_resolves_exactly(tmp_path):
+    seed = tmp_path / "schools.json"
+    seed.write_text(
+        json.dumps({"schools": [{"name": "Orange Coast College", "type": "community_college"}]}),
+        encoding="utf-8",
+    )
+    output = write_alias_file(build_school_alias_table(load_seed_records(seed)), tmp_path / "a.json")
+
+    data = json.loads(output.read_text(encoding="utf-8"))
+    index = AliasIndex.build([data["aliases"]])
+    assert index.alias_to_canonical["orange coast community college"] == "Orange Coast College"
+    # 3글자 약어는 Scorecard로 확인하지 않았으므로 파일에 넣지 않습니다.
+    assert "occ" not in index.alias_to_canonical
+
+
+def _scorecard(name, *aliases):
+    return ScorecardStats(
+        scorecard_id=None,
+        school_name=name,
+        state=None,
+        city=None,
+        acceptance_rate_percent=None,
+        graduation_rate_percent=None,
+        average_salary_usd=None,
+        aliases=aliases,
+    )
+
+
+@pytest.mark.unit
+def test_risky_aliases_require_scorecard_verification():
+    assert aliases_needing_check("Austin Community College") == {"Austin College", "ACC"}
+    assert aliases_needing_check("Orange Coast College", "Community College") == {"OCC"}
+
+    # Scorecard에 "Austin College"라는 다른 기관이 있으므로 충돌입니다.
+    matches = [_scorecard("Austin College"), _scorecard("Austin Community College District", "ACC")]
+    own = ("Austin Community College", "Austin Community College District")
+    assert conflicts_with_scorecard("Austin College", own, matches)
+    assert not conflicts_with_scorecard("ACC", own, matches)
+    assert conflicts_with_scorecard("CCC", own, [_scorecard("Cerritos College", "CCC")])
+
+    table = build_school_alias_table(
+        [
+            SchoolNameRecord("Austin Community College", verified_aliases=("ACC",)),
+            SchoolNameRecord("American River College", "Community College"),
+        ]
+    )
+    assert "Austin College" not in table["Austin Community College"]
+    assert "ACC" in table["Austin Community College"]
+    assert "ARC" not in table["American River College"]
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from src.services.school_cost import DEFAULT_COST_SECONDS, MIN_DURATION_SECONDS, SchoolCost, SchoolCostStore
+
+
+@pytest.mark.unit
+def test_estimates_use_history_then_bytes_then_pages_then_median(tmp_path):
+    store = SchoolCostStore(tmp_path / "costs.json")
+    store.record("https://big.edu", SchoolCost(pages=40, bytes=4_000_000, duration_s=80.0))
+    store.record("https://small.edu", SchoolCost(pages=4, bytes=200_000, duration_s=4.0))
+    store.record("https://failed.edu", SchoolCost(pages=10, bytes=1_000_000, duration_s=0.0))
+    store.record("https://timeout.edu", SchoolCost(pages=10, bytes=0, duration_s=0.0))
+
+    big, small, sized, paged, unknown = store.estimate_many(
+        ["https://big.edu", "https://small.edu", "https://failed.edu", "https://timeout.edu", "https://new.edu"]
+    )
+
+    assert (big, small) == (80.0, 4.0)
+    assert sized == pytest.approx(1_000_000 * 2e-5)  # 바이트당 중앙값 2e-5초
+    assert paged == pytest.approx(10 * 1.5)  # 페이지당 중앙값 (2.0, 1.0) → 1.5초
+    assert unknown == pytest.approx(42.0)  # 소요 시간 중앙값
+    assert SchoolCostStore().estimate("https://new.edu") == DEFAULT_COST_SECONDS
+
+
+@pytest.mark.unit
+def test_record_smooths_duration_and_round_trips(tmp_path):
+    path = tmp_path / "status.json.costs.json"
+    store = SchoolCostStore.for_status(tmp_path / "status.json")
+    store.record("https://alpha.edu", SchoolCost(pages=10, bytes=1000, duration_s=20.0))
+    store.record("https://alpha.edu", SchoolCost(pages=12, bytes=1500, duration_s=10.0))
+    store.record("https://alpha.edu", SchoolCost(pages=12, bytes=1500, duration_s=0.0))  # 실패: 시간 유지
+    store.save()
+
+    reloaded = SchoolCostStore(path)
+
+    assert reloaded.get("https://alpha.edu") == SchoolCost(pages=12, bytes=1500, duration_s=15.0)
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == 1
+
+
+@pytest.mark.unit
+def test_record_keeps_sub_millisecond_duration_above_zero():
+    store = SchoolCostStore()
+    store.record("https://fast.edu", SchoolCost(pages=1, bytes=10, duration_s=0.0002))
+
+    assert store.get("https://fast.edu").duration_s == MIN_DURATION_SECONDS
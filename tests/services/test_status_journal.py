@@ -0,0 +1,70 @@
+"""
+StatusJournal 단위 테스트.
+"""
+
+import json
+
+import pytest
+
+from src.services.status_journal import StatusJournal
+
+
+@pytest.mark.unit
+def test_append_then_load_folds_journal_over_snapshot(tmp_path):
+    snapshot = tmp_path / "status.json"
+    snapshot.write_text(json.dumps({"https://a.edu": "failed", "https://b.edu": "completed"}), encoding="utf-8")
+    journal = StatusJournal(snapshot, compact_every=0)
+    journal.load()
+
+    journal.append("https://a.edu", "completed")
+    journal.append("https://c.edu", "skipped")
+    # 쓰다 만 마지막 줄은 무시됩니다.
+    with journal.journal_path.open("a", encoding="utf-8") as fp:
+        fp.write('{"key": "https://d.edu", "sta')
+
+    assert json.loads(snapshot.read_text(encoding="utf-8"))["https://a.edu"] == "failed"
+    assert StatusJournal(snapshot).load() == {
+        "https://a.edu": "completed",
+        "https://b.edu": "completed",
+        "https://c.edu": "skipped",
+    }
+
+
+@pytest.mark.unit
+def test_compaction_rewrites_snapshot_and_truncates_journal(tmp_path):
+    snapshot = tmp_path / "status.json"
+    journal = StatusJournal(snapshot, compact_every=3)
+    journal.load()
+
+    for index in range(4):
+        journal.append(f"https://s{index}.edu", "completed")
+
+    assert sorted(json.loads(snapshot.read_text(encoding="utf-8"))) == [f"https://s{i}.edu" for i in range(3)]
+    assert journal.journal_path.read_text(encoding="utf-8").count("\n") == 1
+    assert len(StatusJournal(snapshot).load()) == 4
+
+
+@pytest.mark.unit
+def test_corrupt_snapshot_still_applies_journal(tmp_path):
+    snapshot = tmp_path / "status.json"
+    snapshot.write_text('{"https://a.edu": "comp', encoding="utf-8")
+    journal = StatusJournal(snapshot)
+    journal.append("https://b.edu", "completed")
+
+    assert StatusJournal(snapshot).load() == {"https://b.edu": "completed"}
+
+
+@pytest.mark.unit
+def test_append_after_torn_line_keeps_new_record(tmp_path):
+    snapshot = tmp_path / "status.json"
+    journal = StatusJournal(snapshot, compact_every=0)
+    journal.append("https://a.edu", "completed")
+    # 이전 실행이 줄을 쓰다가 죽은 상태
+    with journal.journal_path.open("a", encoding="utf-8") as fp:
+        fp.write('{"key": "https://b.edu", "sta')
+
+    resumed = StatusJournal(snapshot, compact_every=0)
+    resumed.load()
+    resumed.append("https://c.edu", "failed")
+
+    assert StatusJournal(snapshot).load() == {"https://a.edu": "completed", "https://c.edu": "failed"}
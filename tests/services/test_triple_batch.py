@@ -0,0 +1,97 @@
+import sys
+
+import pytest
+
+from src.services.entity_resolution import NormalizedTriple
+from src.services.graph_index import GraphIndexBuilder
+from src.services.interner import StringInterner
+from src.services.prompt_templates import Triple
+from src.services.triple_batch import TripleBatch
+
+
+def _triples():
+    return [
+        NormalizedTriple("School A", "OFFERS", "Nursing", 0.9),
+        NormalizedTriple("school a", "OFFERS", "NURSING", 0.7),
+        NormalizedTriple("School A", "OFFERS", "Welding", 0.55),
+        NormalizedTriple("Nursing", "LEADS_TO", "Registered Nurse", 0.8),
+    ]
+
+
+@pytest.mark.unit
+def test_round_trips_dataclasses():
+    batch = TripleBatch.from_triples(_triples())
+
+    assert len(batch) == 4
+    assert batch.to_normalized() == _triples()
+    assert batch.to_triples()[0] == Triple("School A", "OFFERS", "Nursing", 0.9)
+    assert batch[3] == _triples()[3]
+    # 반복되는 문자열은 interner에 한 번만 저장되고, relation은 별도 interner에 저장됩니다.
+    assert len(batch.interner) == 6
+    assert list(batch.relation_interner) == ["OFFERS", "LEADS_TO"]
+    assert batch.nbytes == 4 * 4 * len(batch)
+
+
+@pytest.mark.unit
+def test_filter_confidence_and_dedupe_match_resolver_semantics():
+    batch = TripleBatch.from_triples(_triples())
+
+    filtered = batch.filter_confidence(0.8)
+    assert [t.tail for t in filtered] == ["Nursing", "Registered Nurse"]
+
+    deduped = batch.dedupe()
+    assert [(t.head, t.tail) for t in deduped] == [
+        ("School A", "Nursing"),
+        ("School A", "Welding"),
+        ("Nursing", "Registered Nurse"),
+    ]
+    # dedupe는 공유 interner에 소문자 표기를 추가하지 않습니다.
+    assert "school a" in batch.interner and "nursing" not in batch.interner
+
+
+@pytest.mark.unit
+def test_concat_remaps_ids_from_other_interner():
+    shared = StringInterner()
+    first = TripleBatch.from_triples(_triples()[:1], interner=shared)
+    second = TripleBatch.from_triples(_triples()[3:], interner=StringInterner(["unused"]))
+
+    combined = first.concat(second)
+
+    assert combined.interner is shared
+    assert combined.relation_interner is first.relation_interner
+    assert combined.to_normalized() == [_triples()[0], _triples()[3]]
+
+
+@pytest.mark.unit
+def test_graph_builder_reuses_shared_interner_ids():
+    batch = TripleBatch.from_triples(_triples())
+    builder = GraphIndexBuilder(interner=batch.interner)
+    builder.add_batch(batch)
+    index = builder.build()
+
+    assert {name for name, _, _ in index.neighbors("School A", "OFFERS")} == {"Nursing", "Welding"}
+    assert index.entity_count == 6
+
+
+@pytest.mark.unit
+def test_graph_index_ignores_names_interned_after_build():
+    batch = TripleBatch.from_triples(_triples())
+    builder = GraphIndexBuilder(interner=batch.interner)
+    builder.add_batch(batch)
+    index = builder.build()
+
+    batch.append("Stanford", "OFFERS", "Physics", 0.9)
+
+    assert index.neighbors("Stanford") == []
+    assert index.neighborhood("Stanford") == {}
+    assert index.traverse(["Stanford"], [("OFFERS", "out")]) == set()
+    assert index.find_paths("Stanford", "Nursing") == []
+    assert list(index.filter_triples(head="Stanford")) == []
+    assert index.entity_count == 6
+
+
+@pytest.mark.unit
+def test_dataclasses_use_slots():
+    triple = _triples()[0]
+    assert not hasattr(triple, "__dict__")
+    assert sys.getsizeof(triple) < 100
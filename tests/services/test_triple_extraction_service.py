@@ -8,10 +8,12 @@ import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.api_core import exceptions as google_exceptions
 
-from src.services.entity_resolution import NormalizedTriple
+from src.services.entity_resolution import EntityResolver, NormalizedTriple
+from src.services.llm_usage import UsageStats
 from src.services.prompt_templates import Triple
-from src.services.triple_extraction_service import TripleExtractionService
+from src.services.triple_extraction_service import TRIPLE_RESPONSE_SCHEMA, TripleExtractionService
 
 
 @pytest.fixture
@@ -221,3 +223,196 @@ def test_extract_from_html_real_api():
     assert any(t.relation == "OFFERS" for t in result)
     assert any(t.relation == "DEVELOPS" for t in result)
     assert all(t.confidence >= 0.8 for t in result)
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_html_records_usage(mock_genai, sample_html, mock_gemini_response):
+    """usage 집계 객체를 넘기면 호출별 토큰/지연이 누적됩니다."""
+    mock_gemini_response.usage_metadata = MagicMock(
+        prompt_token_count=120,
+        candidates_token_count=30,
+        total_token_count=150,
+    )
+    mock_model = MagicMock()
+    mock_model.generate_content.return_value = mock_gemini_response
+    mock_genai.GenerativeModel.return_value = mock_model
+
+    service = TripleExtractionService(api_key="test-key")
+    usage = UsageStats()
+    service.extract_from_html(html=sample_html, school_name="Stanford University", usage=usage)
+
+    assert usage.calls == 1
+    assert usage.prompt_tokens == 120
+    assert usage.output_tokens == 30
+    assert usage.total_tokens == 150
+    assert usage.cost_usd > 0
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_chunk_records_failed_call(mock_genai):
+    """API 호출이 실패해도 실패 호출 수와 지연이 기록됩니다."""
+    mock_model = MagicMock()
+    mock_model.generate_content.side_effect = Exception("API Error")
+    mock_genai.GenerativeModel.return_value = mock_model
+
+    service = TripleExtractionService(api_key="test-key")
+    usage = UsageStats()
+    result = service._extract_from_chunk("Test text", usage=usage)
+
+    assert result == []
+    assert usage.calls == 1
+    assert usage.failed_calls == 1
+    assert usage.total_tokens == 0
+
+
+@pytest.mark.unit
+def test_parse_response_salvages_truncated_output():
+    """max token 등으로 잘린 응답에서도 완결된 Triple 객체는 살립니다."""
+    service = TripleExtractionService(api_key="test-key")
+    truncated = (
+        '```json\n{"triples": ['
+        '{"head": "A", "relation": "OFFERS", "tail": "B", "confidence": 0.9}, '
+        '{"head": "B", "relation": "LEADS_TO", "tail": "C", "confidence": 0.85}, '
+        '{"head": "C", "relation": "REQ'
+    )
+
+    result = service._parse_response(truncated)
+
+    assert [(t.head, t.tail) for t in result] == [("A", "B"), ("B", "C")]
+
+
+@pytest.mark.unit
+def test_parse_response_ignores_surrounding_text_and_bad_items():
+    """앞뒤 설명 문장과 필드가 깨진 항목이 있어도 나머지 Triple은 유지됩니다."""
+    service = TripleExtractionService(api_key="test-key")
+    noisy = (
+        "Here are the triples:\n"
+        '{"triples": [{"head": "A", "relation": "OFFERS", "tail": "B", "confidence": "high"}, '
+        '{"head": "A", "relation": "OFFERS", "tail": "D", "confidence": 0.9}]}\n'
+        "Let me know if you need more."
+    )
+
+    result = service._parse_response(noisy)
+
+    assert len(result) == 1
+    assert result[0].tail == "D"
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_chunk_requests_structured_output(mock_genai, mock_gemini_response):
+    """structured output 모드에서는 response_schema가 포함된 generation_config로 호출합니다."""
+    mock_model = MagicMock()
+    mock_model.generate_content.return_value = mock_gemini_response
+    mock_genai.GenerativeModel.return_value = mock_model
+
+    service = TripleExtractionService(api_key="test-key")
+    service._extract_from_chunk("Test text")
+
+    config = mock_model.generate_content.call_args.kwargs["generation_config"]
+    assert config["response_mime_type"] == "application/json"
+    assert "triples" in config["response_schema"]["properties"]
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_chunk_falls_back_when_schema_rejected(mock_genai, mock_gemini_response):
+    """모델이 response_schema를 거부하면 일반 모드로 재호출하고 이후에도 일반 모드를 유지합니다."""
+    mock_model = MagicMock()
+    mock_model.generate_content.side_effect = [
+        google_exceptions.InvalidArgument("response_schema is not supported"),
+        mock_gemini_response,
+        mock_gemini_response,
+    ]
+    mock_genai.GenerativeModel.return_value = mock_model
+
+    service = TripleExtractionService(api_key="test-key")
+    first = service._extract_from_chunk("Test text")
+    service._extract_from_chunk("Test text")
+
+    assert len(first) == 3
+    assert service.generation_config is None
+    assert "generation_config" not in mock_model.generate_content.call_args.kwargs
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_chunk_keeps_structured_output_after_unrelated_invalid_argument(
+    mock_genai, mock_gemini_response
+):
+    """스키마와 무관한 InvalidArgument는 이번 호출만 일반 모드로 재호출하고 설정은 유지합니다."""
+    mock_model = MagicMock()
+    mock_model.generate_content.side_effect = [
+        google_exceptions.InvalidArgument("request contains an invalid character"),
+        mock_gemini_response,
+        mock_gemini_response,
+    ]
+    mock_genai.GenerativeModel.return_value = mock_model
+
+    service = TripleExtractionService(api_key="test-key")
+    first = service._extract_from_chunk("Test text")
+    service._extract_from_chunk("Test text")
+
+    calls = mock_model.generate_content.call_args_list
+    assert len(first) == 3
+    assert "generation_config" not in calls[1].kwargs
+    assert calls[2].kwargs["generation_config"] is service.generation_config
+    assert service.generation_config is not None
+
+
+@pytest.mark.unit
+def test_response_schema_relations_match_entity_resolver():
+    """응답 스키마의 relation enum은 EntityResolver.RELATIONS에서 만듭니다."""
+    items = TRIPLE_RESPONSE_SCHEMA["properties"]["triples"]["items"]
+
+    assert items["properties"]["relation"]["enum"] == sorted(EntityResolver.RELATIONS)
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_html_requeues_rate_limited_chunks(mock_genai, sample_html, mock_gemini_response):
+    """429로 거절된 청크는 버려지지 않고 전역 백오프 후 재처리됩니다."""
+    mock_model = MagicMock()
+    mock_model.generate_content.side_effect = [
+        google_exceptions.ResourceExhausted("429 quota exceeded"),
+        mock_gemini_response,
+    ]
+    mock_genai.GenerativeModel.return_value = mock_model
+    quota = MagicMock()
+
+    service = TripleExtractionService(api_key="test-key", quota_controller=quota)
+    usage = UsageStats()
+    result = service.extract_from_html(html=sample_html, usage=usage)
+
+    assert len(result) >= 3
+    assert mock_model.generate_content.call_count == 2
+    quota.report_rate_limited.assert_called_once()
+    assert quota.wait.call_count == 2
+    assert usage.retries == 1
+    # 재시도로 성공한 429는 실패 호출로 세지 않습니다 (추출 큐가 페이지를 다시 처리하지 않도록).
+    assert usage.failed_calls == 0
+
+
+@pytest.mark.unit
+@patch("src.services.triple_extraction_service.genai")
+def test_extract_from_html_gives_up_after_rate_limit_retries(mock_genai, sample_html):
+    """재큐잉 한도를 넘긴 청크는 건너뛰고 빈 결과로 종료됩니다."""
+    mock_model = MagicMock()
+    mock_model.generate_content.side_effect = google_exceptions.ResourceExhausted("quota")
+    mock_genai.GenerativeModel.return_value = mock_model
+
+    service = TripleExtractionService(
+        api_key="test-key",
+        quota_controller=MagicMock(),
+        max_rate_limit_retries=2,
+    )
+    usage = UsageStats()
+    result = service.extract_from_html(html=sample_html, usage=usage)
+
+    assert result == []
+    assert mock_model.generate_content.call_count == 3
+    # 버린 청크는 UsageStats에 남아 리포트/추출 큐에서 보입니다.
+    assert usage.dropped_chunks == 1
+    assert usage.to_dict()["dropped_chunks"] == 1
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from src.services.triple_store import SchoolTripleStore
+
+
+def _entry(head, relation, tail, confidence):
+    return {"head": head, "relation": relation, "tail": tail, "confidence": confidence}
+
+
+@pytest.mark.unit
+def test_merges_duplicates_across_pages_with_noisy_or(tmp_path):
+    store = SchoolTripleStore(tmp_path / "merged.jsonl")
+    store.add("School A", [_entry("School A", "OFFERS", "Nursing", 0.8)], source_url="https://a.edu/1")
+    store.add("School A", [_entry("school a", "OFFERS", "nursing", 0.5)], source_url="https://a.edu/2")
+
+    (triple,) = store.triples_for("School A")
+    assert triple.confidence("noisy_or") == pytest.approx(1 - 0.2 * 0.5)
+    assert triple.confidence("max") == pytest.approx(0.8)
+    assert set(triple.sources) == {"https://a.edu/1", "https://a.edu/2"}
+
+
+@pytest.mark.unit
+def test_rerun_of_same_url_does_not_inflate_confidence(tmp_path):
+    path = tmp_path / "merged.jsonl"
+    report = {
+        "school_name": "School A",
+        "triples": [
+            {"source_url": "https://a.edu/p", "entries": [_entry("School A", "OFFERS", "CS", 0.8)]},
+            {"source_url": "https://a.edu/q", "entries": [_entry("School A", "OFFERS", "CS", 0.9)]},
+        ],
+    }
+    store = SchoolTripleStore(path)
+    assert store.add_report(report) == 1
+    store.save()
+
+    reloaded = SchoolTripleStore(path).load()
+    assert reloaded.add_report(report) == 0
+    (triple,) = reloaded.triples_for("School A")
+    assert triple.confidence() == pytest.approx(1 - 0.2 * 0.1)
+
+
+@pytest.mark.unit
+def test_save_writes_one_compact_line_per_school(tmp_path):
+    path = tmp_path / "merged.jsonl"
+    store = SchoolTripleStore(path, aggregation="max")
+    store.add("B", [_entry("B", "OFFERS", "Welding", 0.9)], source_url="u1")
+    store.add("A", [_entry("A", "OFFERS", "Nursing", 0.85)] * 3, source_url="u2")
+    store.save()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["school_name"] for line in lines] == ["A", "B"]
+    assert lines[0]["triples"] == [
+        {"head": "A", "relation": "OFFERS", "tail": "Nursing", "confidence": 0.85, "sources": {"u2": 0.85}}
+    ]
+
+
+@pytest.mark.unit
+def test_rejects_unknown_aggregation(tmp_path):
+    with pytest.raises(ValueError):
+        SchoolTripleStore(tmp_path / "x.jsonl", aggregation="mean")
@@ -114,3 +114,276 @@ def test_find_target_urls_respects_max_depth_limit(mock_get):
     called_urls = [call.args[0] for call in mock_get.call_args_list]
     assert all("deep-career" not in url for url in called_urls)
     assert all("deep-career" not in url for url in urls)
+
+
+def _big_homepage(link_count: int) -> str:
+    links = "".join(
+        f"<li><a href='https://example.edu/news/{index}'>News {index}</a></li>" for index in range(link_count)
+    )
+    return (
+        "<html><body><ul>"
+        + links
+        + "<li>Explore our degree programs: <a href='https://example.edu/study'>Study here</a></li>"
+        + "</ul></body></html>"
+    )
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_expands_promising_links_first(mock_get):
+    """주변 문맥에 키워드가 있는 링크를 먼저 열어, 300개 링크 홈페이지에서도 몇 페이지만 요청합니다."""
+    from src.services.url_finder import InternalLinkStrategy
+
+    study_page = (
+        "<html><body>"
+        + "".join(f"<a href='https://example.edu/careers/{i}'>Career path {i}</a>" for i in range(3))
+        + "</body></html>"
+    )
+
+    def _side_effect(url, timeout=30):
+        response = MagicMock()
+        if url == "https://example.edu":
+            response.text = _big_homepage(300)
+        elif url == "https://example.edu/study":
+            response.text = study_page
+        else:
+            response.text = "<html><body><p>Nothing here</p></body></html>"
+        return response
+
+    mock_get.side_effect = _side_effect
+
+    strategy = InternalLinkStrategy(max_depth=2, max_targets=3, concurrency=1)
+    urls, pages_fetched = strategy.explore("https://example.edu")
+
+    called_urls = [call.args[0] for call in mock_get.call_args_list]
+    assert called_urls == ["https://example.edu", "https://example.edu/study"]
+    assert pages_fetched == 2
+    assert urls == {f"https://example.edu/careers/{i}" for i in range(3)}
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_respects_page_budget(mock_get):
+    """대상 링크가 없어도 사이트당 페이지 예산을 넘겨 요청하지 않습니다."""
+    from src.services.url_finder import InternalLinkStrategy
+
+    response = MagicMock()
+    response.text = _big_homepage(300)
+    mock_get.return_value = response
+
+    strategy = InternalLinkStrategy(max_depth=3, max_pages=10, min_host_delay=0)
+    strategy.search("https://example.edu")
+
+    assert mock_get.call_count == 10
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_budgets_concurrent_searches_separately(mock_get):
+    """같은 전략으로 여러 학교를 동시에 탐색해도 페이지 예산과 집계는 학교별로 따로 셉니다."""
+    import asyncio
+    from urllib.parse import urlparse
+
+    from src.services.url_finder import InternalLinkStrategy
+
+    def _side_effect(url, timeout=30):
+        host = urlparse(url).netloc
+        response = MagicMock()
+        response.text = _big_homepage(50).replace("example.edu", host)
+        return response
+
+    mock_get.side_effect = _side_effect
+
+    strategy = InternalLinkStrategy(max_depth=3, max_pages=4, min_host_delay=0)
+
+    async def _explore_both():
+        return await asyncio.gather(
+            strategy.explore_async("https://a.edu"),
+            strategy.explore_async("https://b.edu"),
+        )
+
+    (_, pages_a), (_, pages_b) = asyncio.run(_explore_both())
+
+    hosts = [urlparse(call.args[0]).netloc for call in mock_get.call_args_list]
+    assert (pages_a, pages_b) == (4, 4)
+    assert hosts.count("a.edu") == 4
+    assert hosts.count("b.edu") == 4
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_spaces_requests_to_same_host(mock_get):
+    """같은 호스트에 대한 요청 시작 사이에는 최소 min_host_delay초 간격을 둡니다."""
+    import time
+
+    from src.services.url_finder import InternalLinkStrategy
+
+    started = []
+
+    def _side_effect(url, timeout=30):
+        started.append(time.monotonic())
+        response = MagicMock()
+        response.text = _big_homepage(20)
+        return response
+
+    mock_get.side_effect = _side_effect
+
+    InternalLinkStrategy(max_depth=2, max_pages=4, concurrency=4, min_host_delay=0.05).search("https://example.edu")
+
+    gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+    assert len(started) == 4
+    assert min(gaps) >= 0.045
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_fetches_frontier_concurrently(mock_get):
+    """frontier 페이지를 동시에 요청하되 호스트당 per_host_concurrency개를 넘지 않고, 결과는 순차 탐색과 같습니다."""
+    import threading
+    import time
+
+    from src.services.url_finder import InternalLinkStrategy
+
+    homepage = "<html><body>" + "".join(
+        f"<a href='https://example.edu/dept/{i}'>Department {i}</a>" for i in range(8)
+    ) + "</body></html>"
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _side_effect(url, timeout=30):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        response = MagicMock()
+        if url == "https://example.edu":
+            response.text = homepage
+        else:
+            index = url.rsplit("/", 1)[1]
+            response.text = f"<html><body><a href='/programs/{index}'>Programs</a></body></html>"
+        return response
+
+    mock_get.side_effect = _side_effect
+
+    concurrent = InternalLinkStrategy(
+        max_depth=2, concurrency=4, per_host_concurrency=2, min_host_delay=0
+    ).search("https://example.edu")
+    peak = active["peak"]
+    sequential = InternalLinkStrategy(max_depth=2, concurrency=1, min_host_delay=0).search("https://example.edu")
+
+    assert peak == 2
+    assert concurrent == sequential == {f"https://example.edu/programs/{i}" for i in range(8)}
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_does_not_refetch_url_variants(mock_get):
+    """끝 슬래시/추적 파라미터/fragment/대소문자만 다른 링크는 한 번만 요청합니다."""
+    from src.services.url_finder import InternalLinkStrategy
+    from src.utils.url_canonicalizer import UrlCanonicalizer
+
+    homepage = """
+    <a href="/about">About</a><a href="/about/">About us</a><a href="/About#team">Team</a>
+    <a href="/about?utm_source=nav">About (nav)</a><a href="http://example.edu/about">About (http)</a>
+    <a href="/programs/">Programs</a><a href="/programs?utm_medium=x">Programs again</a>
+    """
+
+    def _side_effect(url, timeout=30):
+        response = MagicMock()
+        response.url = url
+        response.text = homepage if url == "https://example.edu" else "<p>leaf</p>"
+        return response
+
+    mock_get.side_effect = _side_effect
+
+    urls = InternalLinkStrategy(max_depth=2, canonicalizer=UrlCanonicalizer()).search("https://example.edu")
+
+    called_urls = [call.args[0] for call in mock_get.call_args_list]
+    assert called_urls == ["https://example.edu", "https://example.edu/about"]
+    assert urls == {"https://example.edu/programs"}
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_find_target_urls_reuses_discovery_cache_until_invalidated(mock_get, tmp_path):
+    """같은 홈페이지는 캐시에서 답하고, invalidate 후에는 다시 탐색합니다 (다른 인스턴스와도 공유)."""
+    from src.services.discovery_cache import DiscoveryCache
+
+    response = MagicMock()
+    response.text = "<a href='/career-services'>Career Services</a>"
+    mock_get.return_value = response
+    cache_path = tmp_path / "discovery_cache.json"
+
+    first = UrlFinder(discovery_cache=DiscoveryCache(cache_path))
+    assert first.find_target_urls("https://example.edu") == ["https://example.edu/career-services"]
+    assert first.find_target_urls("http://example.edu/") == ["https://example.edu/career-services"]
+    assert mock_get.call_count == 1
+    first.discovery_cache.close()
+
+    nightly = UrlFinder(discovery_cache=DiscoveryCache(cache_path))
+    assert nightly.find_target_urls("https://example.edu") == ["https://example.edu/career-services"]
+    assert mock_get.call_count == 1
+
+    nightly.invalidate("https://example.edu")
+    nightly.find_target_urls("https://example.edu")
+    assert mock_get.call_count == 2
+
+
+def _redirecting_site():
+    pages = {
+        "https://www.occ.cccd.edu/home": """
+            <a href="/about">About</a>
+            <a href="https://counseling.cccd.edu/career-center">Career Center</a>
+            <a href="https://www.occ.cccd.edu/programs">Programs</a>
+            <a href="https://external.com/career">External careers</a>
+        """,
+    }
+    requested = []
+
+    def _side_effect(url, timeout=30):
+        requested.append(url)
+        response = MagicMock()
+        final_url = "https://www.occ.cccd.edu/home" if url == "https://occ.cccd.edu" else url
+        response.url = final_url
+        response.text = pages.get(final_url, "<p>leaf</p>")
+        return response
+
+    return _side_effect, requested
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_follows_homepage_redirect(mock_get):
+    """홈페이지가 다른 호스트로 redirect 돼도 내부 링크와 같은 등록 도메인 링크를 찾습니다."""
+    from src.services.discovery_cache import DiscoveryCache
+    from src.services.url_finder import InternalLinkStrategy
+    from src.utils.url_canonicalizer import UrlCanonicalizer
+
+    mock_get.side_effect, requested = _redirecting_site()
+    cache = DiscoveryCache(canonicalizer=UrlCanonicalizer())
+    strategy = InternalLinkStrategy(canonicalizer=UrlCanonicalizer(), discovery_cache=cache)
+
+    urls = strategy.search("https://occ.cccd.edu")
+
+    assert urls == {"https://counseling.cccd.edu/career-center", "https://www.occ.cccd.edu/programs"}
+    assert cache.origin_for("https://occ.cccd.edu") == "https://www.occ.cccd.edu/home"
+
+    # 다음 탐색은 학습한 최종 주소에서 바로 시작합니다.
+    requested.clear()
+    strategy.search("https://occ.cccd.edu")
+    assert requested[0] == "https://www.occ.cccd.edu/home"
+
+
+@pytest.mark.unit
+@patch("src.services.url_finder.requests.Session.get")
+def test_internal_link_strategy_exact_scope_skips_sibling_hosts(mock_get):
+    from src.services.url_finder import InternalLinkStrategy
+    from src.utils.url_canonicalizer import UrlCanonicalizer
+
+    mock_get.side_effect, _ = _redirecting_site()
+
+    urls = InternalLinkStrategy(canonicalizer=UrlCanonicalizer(), host_scope="exact").search("https://occ.cccd.edu")
+
+    assert urls == {"https://www.occ.cccd.edu/programs"}
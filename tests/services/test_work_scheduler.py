@@ -0,0 +1,55 @@
+import threading
+import time
+from concurrent.futures import as_completed
+
+import pytest
+
+from src.services.work_scheduler import WorkStealingScheduler
+
+
+@pytest.mark.unit
+def test_single_worker_runs_most_expensive_first():
+    order = []
+
+    with WorkStealingScheduler(1) as scheduler:
+        futures = scheduler.submit_all(order.append, ["small", "huge", "medium"], [1.0, 50.0, 5.0])
+
+    assert order == ["huge", "medium", "small"]
+    assert [future.done() for future in futures] == [True, True, True]
+
+
+@pytest.mark.unit
+def test_idle_worker_steals_when_estimates_are_wrong():
+    """추정이 틀려 한 워커가 오래 걸리면 다른 워커가 그 큐의 남은 작업을 가져갑니다."""
+    ran_on = {}
+
+    def _work(item):
+        ran_on[item] = threading.current_thread().name
+        time.sleep(0.5 if item == "slow" else 0.02)
+        return item
+
+    # LPT 배정: worker-0 ← [slow(10), z(4), w(1)], worker-1 ← [x(9), y(5)]
+    items = ["slow", "x", "y", "z", "w"]
+    costs = [10.0, 9.0, 5.0, 4.0, 1.0]
+    with WorkStealingScheduler(2) as scheduler:
+        futures = scheduler.submit_all(_work, items, costs)
+        results = sorted(future.result() for future in as_completed(futures))
+
+    assert results == sorted(items)
+    assert scheduler.stats()["steals"] == 2
+    assert ran_on["z"] == ran_on["w"] == ran_on["x"] != ran_on["slow"]
+
+
+@pytest.mark.unit
+def test_exceptions_are_reported_through_futures():
+    def _work(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        return item
+
+    with WorkStealingScheduler(2) as scheduler:
+        good, bad = scheduler.submit_all(_work, ["good", "bad"], [1.0, 1.0])
+
+    assert good.result() == "good"
+    with pytest.raises(RuntimeError):
+        bad.result()
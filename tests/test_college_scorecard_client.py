@@ -79,3 +79,42 @@ def test_fetch_school_stats_handles_429_with_retry(monkeypatch):
     assert stats is None
     assert calls["n"] == 2
 
+
+
+@pytest.mark.unit
+def test_fetch_school_stats_splits_scorecard_aliases(monkeypatch):
+    payload = {
+        "results": [
+            {
+                "id": 1,
+                "school": {"name": "Mt San Antonio College", "alias": "Mt. SAC, Mt SAC"},
+                "latest": {},
+            }
+        ]
+    }
+    client = CollegeScorecardClient(api_key="test-key", max_retries=1)
+    monkeypatch.setattr(client._session, "get", lambda url, params, timeout: _FakeResp(200, payload))
+
+    stats = client.fetch_school_stats("Mt San Antonio College")
+    assert stats is not None
+    assert stats.aliases == ("Mt. SAC", "Mt SAC")
+
+
+@pytest.mark.unit
+def test_search_schools_returns_all_matches_or_none(monkeypatch):
+    payload = {
+        "results": [
+            {"id": 1, "school": {"name": "Austin College", "alias": None}},
+            {"id": 2, "school": {"name": "Austin Community College District", "alias": "ACC"}},
+        ]
+    }
+    client = CollegeScorecardClient(api_key="test-key", max_retries=1)
+    monkeypatch.setattr(client._session, "get", lambda url, params, timeout: _FakeResp(200, payload))
+
+    matches = client.search_schools("Austin College")
+    assert [(m.school_name, m.aliases) for m in matches] == [
+        ("Austin College", ()),
+        ("Austin Community College District", ("ACC",)),
+    ]
+    monkeypatch.delenv("COLLEGE_SCORECARD_API", raising=False)
+    assert CollegeScorecardClient(api_key="").search_schools("Austin College") is None
@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.database import graph_loader
+from src.database.graph_loader import (
+    GraphBulkLoader,
+    TripleRecord,
+    records_from_report,
+    records_from_seed,
+)
+
+
+def _fake_conn():
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn, cursor
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    calls = []
+
+    def fake_execute_values(cur, sql, rows, template=None, page_size=100, fetch=False):
+        calls.append({"sql": sql, "rows": list(rows), "page_size": page_size})
+        if fetch:
+            # RETURNING uuid, entity_type, canonical_name
+            return [(row[0], row[1], row[3]) for row in rows]
+        return None
+
+    monkeypatch.setattr(graph_loader, "execute_values", fake_execute_values)
+    return calls
+
+
+@pytest.mark.unit
+def test_load_upserts_entities_and_triples_in_two_statements(captured):
+    conn, _ = _fake_conn()
+    records = [
+        TripleRecord("School A", "School A", "OFFERS", "Nursing", 0.7, "u1"),
+        TripleRecord("School A", "School A", "OFFERS", "Nursing", 0.9, "u2"),
+        TripleRecord("School A", "Nursing", "LEADS_TO", "Registered Nurse", 0.8, "u1"),
+    ]
+
+    counts = GraphBulkLoader(conn).load(records)
+
+    assert counts == {"entities": 3, "triples": 2}
+    assert len(captured) == 2
+    entity_call, triple_call = captured
+    assert "ON CONFLICT (entity_type, canonical_name)" in entity_call["sql"]
+    assert {(row[1], row[3]) for row in entity_call["rows"]} == {
+        ("School", "School A"),
+        ("Program", "Nursing"),
+        ("Program", "Registered Nurse"),
+    }
+    assert "ON CONFLICT (head_entity_uuid, relation_type, tail_entity_uuid)" in triple_call["sql"]
+    offers = next(row for row in triple_call["rows"] if row[4] == "OFFERS")
+    # 같은 Triple은 한 statement에 한 번만 (confidence는 max, 출처는 그 관측의 URL)
+    assert offers[9] == 0.9
+    assert offers[11] == "u2"
+    conn.commit.assert_called_once()
+
+
+@pytest.mark.unit
+def test_school_entities_carry_school_id_from_schools_table(captured):
+    conn, cursor = _fake_conn()
+    school_id = uuid4()
+    cursor.fetchall.return_value = [("School A", school_id)]
+
+    GraphBulkLoader(conn).load([TripleRecord("School A", "School A", "OFFERS", "Nursing")])
+
+    cursor.execute.assert_called_once_with(graph_loader._SCHOOL_IDS_SQL, (["School A"],))
+    school_ids = {row[3]: row[4] for row in captured[0]["rows"]}
+    assert school_ids == {"School A": school_id, "Nursing": None}
+    assert "COALESCE(entities.school_id, EXCLUDED.school_id)" in captured[0]["sql"]
+
+
+@pytest.mark.unit
+def test_load_rolls_back_on_error(monkeypatch):
+    conn, _ = _fake_conn()
+
+    def boom(*args, **kwargs):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(graph_loader, "execute_values", boom)
+
+    with pytest.raises(RuntimeError):
+        GraphBulkLoader(conn).load([TripleRecord("S", "S", "OFFERS", "X")])
+    conn.rollback.assert_called_once()
+    conn.commit.assert_not_called()
+
+
+@pytest.mark.unit
+def test_record_adapters_flatten_seed_and_collector_formats():
+    seed = {"schools": [{"school_name": "S", "triples": [{"head": "S", "relation": "OFFERS", "tail": "X"}]}]}
+    report = {
+        "school_name": "S",
+        "triples": [
+            {
+                "source_url": "https://s.edu/p",
+                "entries": [
+                    {"head": "S", "relation": "OFFERS", "tail": "Y", "confidence": 0.95},
+                    {"head": "", "relation": "OFFERS", "tail": "Z"},
+                ],
+            }
+        ],
+    }
+
+    assert list(records_from_seed(seed)) == [TripleRecord("S", "S", "OFFERS", "X", 0.8, None)]
+    assert list(records_from_report(report)) == [
+        TripleRecord("S", "S", "OFFERS", "Y", 0.95, "https://s.edu/p")
+    ]
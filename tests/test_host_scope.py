@@ -0,0 +1,54 @@
+"""
+HostScope / registered_domain 단위 테스트.
+"""
+
+import pytest
+
+from src.utils.host_scope import HostScope, registered_domain
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "host, expected",
+    [
+        ("www.occ.cccd.edu", "cccd.edu"),
+        ("cccd.edu", "cccd.edu"),
+        ("WWW.OX.AC.UK.", "ox.ac.uk"),
+        ("www.lausd.k12.ca.us", "lausd.k12.ca.us"),
+        ("library.smccd.cc.ca.us", "smccd.cc.ca.us"),
+        ("www.ci.boston.ma.us", "boston.ma.us"),
+        ("localhost", "localhost"),
+        ("127.0.0.1", "127.0.0.1"),
+    ],
+)
+def test_registered_domain(host, expected):
+    assert registered_domain(host) == expected
+
+
+@pytest.mark.unit
+def test_registered_domain_policy_includes_siblings_and_redirect_target():
+    scope = HostScope.for_site("https://occ.cccd.edu").with_redirect("https://www.occ.cccd.edu/home")
+
+    assert scope.contains("https://www.occ.cccd.edu/programs")
+    assert scope.contains("http://occ.cccd.edu:8080/x")
+    assert scope.contains("https://counseling.cccd.edu/careers")
+    assert not scope.contains("https://cccd.edu.evil.com/careers")
+    assert not scope.contains("mailto:info@cccd.edu")
+
+
+@pytest.mark.unit
+def test_exact_policy_allows_only_start_and_redirect_hosts():
+    scope = HostScope.for_site("https://occ.cccd.edu", "https://www.occ.cccd.edu/", policy="exact")
+
+    assert scope.contains("https://www.occ.cccd.edu/programs")
+    assert scope.contains("https://occ.cccd.edu/programs")
+    assert not scope.contains("https://counseling.cccd.edu/careers")
+
+
+@pytest.mark.unit
+def test_unknown_policy_is_rejected():
+    assert HostScope.validate_policy("exact") == "exact"
+    with pytest.raises(ValueError):
+        HostScope.validate_policy("anything")
+    with pytest.raises(ValueError):
+        HostScope.for_site("https://a.edu", policy="anything")
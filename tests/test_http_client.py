@@ -0,0 +1,93 @@
+"""
+PooledHttpClient 단위 테스트.
+
+로컬 HTTP 서버로 keep-alive 연결 재사용 통계를 검증합니다.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.crawlers.base_crawler import BaseCrawler
+from src.utils.http_client import PooledHttpClient
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - http.server 규약
+        body = b"User-agent: *\nAllow: /\n" if self.path == "/robots.txt" else b"<html>ok</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # 테스트 출력 억제
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+def test_pooled_client_reuses_connections(local_server):
+    with PooledHttpClient(pool_size=2) as client:
+        for path in ("/a", "/b", "/c", "/d"):
+            assert client.session.get(local_server + path, timeout=5).status_code == 200
+        stats = client.stats()
+
+    assert stats.requests == 4
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 3
+    assert stats.to_dict()["reuse_ratio"] == 0.75
+
+
+@pytest.mark.unit
+def test_crawlers_share_injected_session_without_closing_it(local_server):
+    client = PooledHttpClient(pool_size=1)
+    for _ in range(3):
+        with BaseCrawler(local_server, session=client.session) as crawler:
+            assert crawler.session is client.session
+            crawler.session.get(local_server + "/page", timeout=5)
+
+    # robots.txt + 페이지 요청 6건이 연결 하나로 처리되고, 크롤러 종료 후에도 세션은 살아 있습니다.
+    assert client.stats().requests == 6
+    assert client.stats().connections_opened == 1
+    assert client.session.get(local_server + "/after", timeout=5).status_code == 200
+    client.close()
+
+
+@pytest.mark.unit
+def test_crawler_closes_its_own_session(monkeypatch):
+    monkeypatch.setattr("src.crawlers.base_crawler.requests.Session.get", MagicMock(side_effect=OSError))
+    close = MagicMock()
+    monkeypatch.setattr("src.crawlers.base_crawler.requests.Session.close", close)
+
+    with BaseCrawler("https://example.com"):
+        pass
+
+    close.assert_called_once()
+
+
+@pytest.mark.unit
+def test_stats_since_reports_only_new_requests(local_server):
+    with PooledHttpClient(pool_size=1) as client:
+        client.session.get(local_server + "/first", timeout=5)
+        baseline = client.stats()
+        client.session.get(local_server + "/second", timeout=5)
+        client.session.get(local_server + "/third", timeout=5)
+        delta = client.stats().since(baseline)
+
+    # 공유 풀에서도 기준 시점 이후 요청만 집계되고, 이미 열린 연결을 재사용합니다.
+    assert delta.requests == 2
+    assert delta.connections_opened == 0
+    assert delta.connections_reused == 2
@@ -0,0 +1,130 @@
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.triple_ingester import TripleJsonlIngester
+
+
+def _report(school, tails):
+    return {
+        "school_name": school,
+        "triples": [
+            {
+                "source_url": f"https://{school.lower()}.edu/p",
+                "entries": [
+                    {"head": school, "relation": "OFFERS", "tail": tail, "confidence": 0.9} for tail in tails
+                ],
+            }
+        ],
+    }
+
+
+def _write_jsonl(path, reports):
+    with path.open("w", encoding="utf-8") as fp:
+        for report in reports:
+            fp.write(json.dumps(report) + "\n")
+
+
+def _fake_loader(fail_on_call=None):
+    loader = MagicMock()
+    loader.batches = []
+
+    def load(records):
+        loader.batches.append(list(records))
+        if fail_on_call is not None and len(loader.batches) == fail_on_call:
+            raise RuntimeError("db down")
+        return {"entities": 0, "triples": len(records)}
+
+    loader.load.side_effect = load
+    return loader
+
+
+@pytest.mark.unit
+def test_ingest_streams_in_batches_at_line_boundaries(tmp_path):
+    path = tmp_path / "auto.jsonl"
+    _write_jsonl(path, [_report("A", ["X", "Y"]), _report("B", ["Z"]), _report("C", ["W"])])
+    loader = _fake_loader()
+
+    summary = TripleJsonlIngester(loader, batch_size=2).ingest(path)
+
+    assert [len(batch) for batch in loader.batches] == [2, 2]
+    assert summary["triples"] == 4
+    assert summary["offset"] == path.stat().st_size
+
+
+@pytest.mark.unit
+def test_ingest_resumes_from_last_committed_offset(tmp_path):
+    path = tmp_path / "auto.jsonl"
+    _write_jsonl(path, [_report("A", ["X"]), _report("B", ["Y"]), _report("C", ["Z"])])
+
+    failing = _fake_loader(fail_on_call=2)
+    with pytest.raises(RuntimeError):
+        TripleJsonlIngester(failing, batch_size=1).ingest(path)
+
+    loader = _fake_loader()
+    summary = TripleJsonlIngester(loader, batch_size=1).ingest(path)
+
+    # A는 이미 커밋되었으므로 B부터 다시 적재합니다.
+    assert [batch[0].school_name for batch in loader.batches] == ["B", "C"]
+    assert summary["start_offset"] > 0
+
+
+@pytest.mark.unit
+def test_ingest_restarts_when_file_replaced_and_defers_partial_line(tmp_path):
+    path = tmp_path / "auto.jsonl"
+    _write_jsonl(path, [_report("A", ["X"])])
+    TripleJsonlIngester(_fake_loader(), batch_size=10).ingest(path)
+
+    _write_jsonl(path, [_report("B", ["Y"])])
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write('{"school_name": "C", "tri')  # 아직 쓰는 중인 줄
+
+    loader = _fake_loader()
+    summary = TripleJsonlIngester(loader, batch_size=10).ingest(path)
+
+    assert summary["start_offset"] == 0
+    assert [record.school_name for record in loader.batches[0]] == ["B"]
+    assert summary["offset"] < path.stat().st_size
+
+
+@pytest.mark.unit
+def test_ingest_restarts_when_rewritten_with_same_first_line(tmp_path):
+    path = tmp_path / "auto.jsonl"
+    _write_jsonl(path, [_report("A", ["X"]), _report("B", ["Y"])])
+    TripleJsonlIngester(_fake_loader(), batch_size=10).ingest(path)
+    stat = path.stat()
+
+    # 첫 줄·크기·수정 시각이 모두 같지만 이후 내용이 다른 새 수집 결과
+    _write_jsonl(path, [_report("A", ["X"]), _report("C", ["Y"])])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    loader = _fake_loader()
+    summary = TripleJsonlIngester(loader, batch_size=10).ingest(path)
+
+    assert summary["start_offset"] == 0
+    assert [record.school_name for record in loader.batches[0]] == ["A", "C"]
+
+
+@pytest.mark.unit
+def test_ingest_resumes_after_append_and_same_content_replace(tmp_path):
+    path = tmp_path / "auto.jsonl"
+    _write_jsonl(path, [_report("A", ["X"])])
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write('{"school_name": "B", "tri')  # 아직 쓰는 중인 줄
+    ingester = TripleJsonlIngester(_fake_loader(), batch_size=10)
+    first = ingester.ingest(path)
+
+    # repair_output처럼 같은 내용을 새 파일로 쓰고 os.replace → inode/수정 시각이 바뀜
+    _write_jsonl(path.with_name("repaired.jsonl"), [_report("A", ["X"])])
+    os.replace(path.with_name("repaired.jsonl"), path)
+    # 수집 재개로 줄이 덧붙음
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write(json.dumps(_report("C", ["Z"])) + "\n")
+
+    loader = _fake_loader()
+    summary = TripleJsonlIngester(loader, batch_size=10).ingest(path)
+
+    assert summary["start_offset"] == first["offset"] > 0
+    assert [record.school_name for record in loader.batches[0]] == ["C"]
@@ -0,0 +1,51 @@
+"""
+UrlCanonicalizer 단위 테스트.
+"""
+
+import pytest
+
+from src.utils.url_canonicalizer import UrlCanonicalizer
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "https://example.edu/programs",
+        "https://example.edu/programs/",
+        "https://example.edu/programs?utm_source=x&utm_medium=email",
+        "https://example.edu/Programs#top",
+        "http://example.edu/programs",
+        "HTTPS://EXAMPLE.EDU:443/programs",
+        "https://example.edu./programs?fbclid=abc",
+    ],
+)
+def test_variants_share_dedupe_key(raw):
+    canonicalizer = UrlCanonicalizer()
+
+    assert canonicalizer.dedupe_key(raw) == canonicalizer.dedupe_key("https://example.edu/programs")
+
+
+@pytest.mark.unit
+def test_canonicalize_keeps_meaningful_parts():
+    canonicalizer = UrlCanonicalizer()
+
+    assert canonicalizer.canonicalize("HTTP://Example.edu:8080/Career/?b=2&a=1&gclid=x#frag") == (
+        "http://example.edu:8080/Career?a=1&b=2"
+    )
+    assert canonicalizer.canonicalize("https://example.edu") == "https://example.edu/"
+    assert canonicalizer.canonicalize("https://example.edu/a%7eb%2f") == "https://example.edu/a~b%2F"
+    assert canonicalizer.canonicalize("mailto:info@example.edu") == "mailto:info@example.edu"
+
+
+@pytest.mark.unit
+def test_redirect_aliases_are_followed():
+    canonicalizer = UrlCanonicalizer()
+    canonicalizer.add_redirect("http://occ.cccd.edu/", "https://www.occ.cccd.edu/home/")
+    canonicalizer.add_redirect("https://www.occ.cccd.edu/home", "https://www.occ.cccd.edu/home")  # 자기 자신은 무시
+
+    assert canonicalizer.canonicalize("https://occ.cccd.edu") == "https://www.occ.cccd.edu/home"
+    assert canonicalizer.dedupe_key("http://occ.cccd.edu/?utm_campaign=x") == canonicalizer.dedupe_key(
+        "https://www.occ.cccd.edu/home"
+    )
+    assert len(canonicalizer.redirect_aliases()) == 1